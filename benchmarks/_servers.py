@@ -0,0 +1,112 @@
+"""Helpers for running stand-in services during benchmarks."""
+
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import httpx
+import uvicorn
+
+# Holds the ``interview_core`` package shared by the services
+SERVICES_DIR = Path(__file__).resolve().parents[1] / "services"
+
+
+def free_port() -> int:
+    """Return a TCP port that is currently free on localhost."""
+
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class BackgroundServer:
+    """Serve an ASGI app with uvicorn on a background thread."""
+
+    def __init__(self, app, port: int = 0) -> None:
+        self.port = port or free_port()
+        config = uvicorn.Config(
+            app, host="127.0.0.1", port=self.port, log_level="warning", access_log=False
+        )
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "BackgroundServer":
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._server.should_exit = True
+        self._thread.join()
+
+
+class ServiceProcess:
+    """Run one of the repository's FastAPI services with uvicorn in a subprocess.
+
+    The services each use their ``app`` directory as the import root, so
+    they cannot share a process with each other. ``env`` is added to the
+    current environment, with the shared package on ``PYTHONPATH``. The
+    service is ready once ``/metrics`` answers.
+    """
+
+    def __init__(self, app_dir: Path, env: Dict[str, str], port: int = 0) -> None:
+        self.app_dir = app_dir
+        self.env = {**os.environ, **env}
+        self.env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [str(SERVICES_DIR), self.env.get("PYTHONPATH")])
+        )
+        self.port = port or free_port()
+        self._process: Optional[subprocess.Popen] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def rss_bytes(self) -> Optional[int]:
+        """Resident memory of the service process, or ``None`` off Linux."""
+
+        try:
+            with open(f"/proc/{self._process.pid}/status") as status:
+                for line in status:
+                    if line.startswith("VmRSS:"):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            return None
+        return None
+
+    def __enter__(self) -> "ServiceProcess":
+        command = [
+            sys.executable, "-m", "uvicorn", "main:app",
+            "--host", "127.0.0.1", "--port", str(self.port),
+            "--log-level", "warning", "--no-access-log",
+        ]
+        self._process = subprocess.Popen(command, cwd=self.app_dir, env=self.env)
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"{self.app_dir} exited with {self._process.returncode}")
+            try:
+                httpx.get(f"{self.url}/metrics", timeout=1)
+                return self
+            except httpx.TransportError:
+                time.sleep(0.1)
+        self.__exit__(None, None, None)
+        raise RuntimeError(f"{self.app_dir} did not start")
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
@@ -0,0 +1,141 @@
+"""Report prompt savings from compacting job descriptions and resumes.
+
+A corpus of sample postings and resumes is generated with the kinds of
+noise seen in real ones: company blurbs, benefits and equal opportunity
+sections, bullets repeated across sections and ragged whitespace. Each
+document is compacted with the services' shared preprocessor, with
+and without the default token budgets. The job description is part of the
+system prompt of every turn, so the script also reports prompt tokens per
+interview and the provider prefill time they imply at
+``--prefill-ms-per-1k-tokens``. The script prints JSON results.
+
+    python benchmarks/bench_context_preprocessing.py --postings 200 --turns 12
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "services"))
+
+from interview_core.context_preprocessor import compact_text, estimate_tokens  # noqa: E402
+
+SKILLS = [
+    "Python", "Go", "Java", "Kafka", "PostgreSQL", "Redis", "AWS", "Kubernetes",
+    "Terraform", "React", "TypeScript", "Spark", "Airflow", "Django", "FastAPI", "gRPC",
+]
+DUTIES = [
+    "Design and build APIs used by millions of customers",
+    "Own the reliability and observability of core services",
+    "Mentor engineers and review code across teams",
+    "Work with product managers to shape the roadmap",
+    "Tune database queries and caching layers",
+    "Participate in the on-call rotation",
+]
+BLURB = (
+    "Founded in 2009, {company} is a fast-growing, mission-driven company with offices "
+    "in twelve countries. We are passionate about building a world-class culture where "
+    "everyone can do the best work of their careers.   Our customers love us and so "
+    "will you!"
+)
+BENEFITS = [
+    "Competitive salary and equity", "30 days of paid vacation", "Private health insurance",
+    "Learning budget of 2,000 EUR per year", "Free lunch and snacks", "Gym membership",
+    "Flexible working hours", "Parental leave", "Home office allowance",
+]
+EEO = (
+    "{company} is an equal opportunity employer. We celebrate diversity and are committed "
+    "to creating an inclusive environment for all employees without regard to race, "
+    "religion, gender, age or disability. Please let us know if you need a reasonable "
+    "accommodation during the application process."
+)
+
+
+def posting(rng: random.Random) -> str:
+    company = rng.choice(["Acme", "Globex", "Initech", "Umbrella"])
+    skills = rng.sample(SKILLS, 6)
+    duties = rng.sample(DUTIES, 4)
+    requirements = [f"{rng.randint(2, 8)}+ years of experience with {s}" for s in skills]
+    lines = ["About Us:", BLURB.format(company=company), ""]
+    lines += [f"Senior {rng.choice(skills)} Engineer  ({rng.choice(['Berlin', 'Remote'])})", ""]
+    lines += ["Responsibilities:"] + [f"  •  {d}" for d in duties] + [""]
+    lines += ["Requirements:"] + [f"- {r}" for r in requirements]
+    # Recruiters often paste the same bullet twice
+    lines += [f"- {rng.choice(requirements)}.", ""]
+    lines += ["Nice to have:", f"- {rng.choice(SKILLS)}", ""]
+    lines += ["What We Offer:"] + [f"* {b}" for b in rng.sample(BENEFITS, 6)] + [""]
+    lines += ["How to apply:", "Click apply and send us your CV.", ""]
+    lines += [EEO.format(company=company)]
+    return "\n".join(lines)
+
+
+def resume(rng: random.Random) -> str:
+    lines = ["SUMMARY", "Backend engineer who enjoys distributed systems.", ""]
+    lines += ["EXPERIENCE"]
+    for job in range(rng.randint(3, 6)):
+        lines.append(f"Engineer at Company {job} ({2010 + job}-{2012 + job})")
+        lines += [f"- Built services in {s}" for s in rng.sample(SKILLS, 3)]
+        lines.append("- Worked in an agile team")
+    lines += ["", "SKILLS", ", ".join(rng.sample(SKILLS, 8)), ""]
+    lines += ["INTERESTS", "Climbing, chess, cooking", "", "REFERENCES", "Available upon request."]
+    return "\n".join(lines)
+
+
+def summarize(values: list) -> dict:
+    return {"mean": round(statistics.fmean(values), 1), "max": max(values)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--postings", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=12)
+    parser.add_argument("--jd-budget", type=int, default=800)
+    parser.add_argument("--resume-budget", type=int, default=1500)
+    parser.add_argument("--prefill-ms-per-1k-tokens", type=float, default=60.0)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    docs = [(posting(rng), resume(rng)) for _ in range(args.postings)]
+    results = {"postings": args.postings}
+    for name, index, budget in (
+        ("job_description", 0, args.jd_budget),
+        ("resume", 1, args.resume_budget),
+    ):
+        raw = [estimate_tokens(doc[index]) for doc in docs]
+        compact_text.cache_clear()
+        start = time.perf_counter()
+        compacted = [compact_text(doc[index]) for doc in docs]
+        elapsed = (time.perf_counter() - start) / len(docs)
+        budgeted = [compact_text(doc[index], budget) for doc in docs]
+        results[name] = {
+            "raw_tokens": summarize(raw),
+            "compact_tokens": summarize([estimate_tokens(text) for text in compacted]),
+            "budgeted_tokens": summarize([estimate_tokens(text) for text in budgeted]),
+            "reduction": round(
+                1 - sum(estimate_tokens(text) for text in budgeted) / sum(raw), 3
+            ),
+            "preprocess_ms": round(elapsed * 1000, 3),
+        }
+
+    # The job description is resent in the system prompt on every turn
+    saved = statistics.fmean(
+        estimate_tokens(doc[0]) - estimate_tokens(compact_text(doc[0], args.jd_budget))
+        for doc in docs
+    )
+    results["per_interview"] = {
+        "turns": args.turns,
+        "prompt_tokens_saved": round(saved * args.turns),
+        "estimated_prefill_ms_saved": round(
+            saved * args.turns * args.prefill_ms_per_1k_tokens / 1000, 1
+        ),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Measure throughput and added latency of local LLM micro-batching.
+
+A stand-in local LLM server runs one forward pass at a time. A pass costs a
+fixed overhead plus a small per-sequence cost, which is how batched GPU
+inference behaves. It serves single chat completions and, on
+``/v1/batch``, arrays of them. The benchmark drives concurrent
+``generate_next_question`` calls with batching off, and then with batching
+on for several ``max_wait`` values. It prints JSON results.
+
+    python benchmarks/bench_local_batching.py --requests 400 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+from fastapi import FastAPI
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "services"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _servers import BackgroundServer  # noqa: E402
+from interview_core import llm_service  # noqa: E402
+from interview_core.batch_dispatcher import BatchDispatcher  # noqa: E402
+from interview_core.config import settings  # noqa: E402
+from interview_core.llm_service import provider_clients  # noqa: E402
+from interview_core.schemas import InterviewContext  # noqa: E402
+
+
+def stand_in_llm(overhead: float, per_item: float) -> FastAPI:
+    app = FastAPI()
+    device = asyncio.Lock()
+
+    def completion(index: int) -> dict:
+        return {"choices": [{"message": {"content": f"Question {index}?"}}]}
+
+    async def forward(items: int) -> None:
+        async with device:
+            await asyncio.sleep(overhead + per_item * items)
+
+    @app.post("/v1/chat/completions")
+    async def chat(payload: dict) -> dict:
+        await forward(1)
+        return completion(0)
+
+    @app.post("/v1/batch")
+    async def batch(payloads: List[dict]) -> list:
+        await forward(len(payloads))
+        return [completion(i) for i in range(len(payloads))]
+
+    return app
+
+
+async def run(label: str, requests: int, concurrency: int) -> dict:
+    await provider_clients.aclose()
+    llm_service.local_batcher = BatchDispatcher(
+        llm_service._send_local_batch,
+        max_size=settings.llm_batch_max_size,
+        max_wait=settings.llm_batch_max_wait_ms / 1000,
+    )
+    contexts = [InterviewContext(job_description=f"Role {i}") for i in range(requests)]
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(context: InterviewContext) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await llm_service.generate_next_question(context, [], use_cache=False)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(c) for c in contexts))
+    elapsed = time.perf_counter() - start
+    stats = llm_service.local_batcher.stats()
+    await llm_service.local_batcher.aclose()
+    await provider_clients.aclose()
+
+    latencies.sort()
+    return {
+        "mode": label,
+        "requests": requests,
+        "concurrency": concurrency,
+        "throughput_rps": round(requests / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+        "mean_batch_size": round(stats["mean_batch_size"], 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--waits", default="1,5,20", help="max_wait values in ms")
+    parser.add_argument("--overhead", type=float, default=0.02, help="seconds per pass")
+    parser.add_argument("--per-item", type=float, default=0.001, help="seconds per sequence")
+    parser.add_argument("--no-batch-endpoint", action="store_true",
+                        help="batch with concurrent single requests instead")
+    args = parser.parse_args()
+
+    settings.llm_provider = "local"
+    settings.llm_batch_max_size = args.batch_size
+    settings.llm_context_token_budget = 0
+    results = []
+    with BackgroundServer(stand_in_llm(args.overhead, args.per_item)) as server:
+        settings.local_llm_url = f"{server.url}/v1/chat/completions"
+        settings.local_llm_batch_url = "" if args.no_batch_endpoint else f"{server.url}/v1/batch"
+
+        settings.llm_batch_enabled = False
+        results.append(asyncio.run(run("unbatched", args.requests, args.concurrency)))
+        settings.llm_batch_enabled = True
+        for wait in args.waits.split(","):
+            settings.llm_batch_max_wait_ms = float(wait)
+            results.append(
+                asyncio.run(run(f"batched_{wait}ms", args.requests, args.concurrency))
+            )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
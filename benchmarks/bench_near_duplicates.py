@@ -0,0 +1,95 @@
+"""Measure near-duplicate job description lookup as the index grows.
+
+Synthetic postings are indexed with the interview engine's
+``NearDuplicateIndex``. Each query is a posting with its location changed
+and must find the original. The LSH lookup is compared with a linear scan
+computing exact shingle Jaccard against every posting. The script prints
+JSON results.
+
+    python benchmarks/bench_near_duplicates.py --sizes 100,1000,5000 --queries 50
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "services"))
+
+from interview_core.near_duplicates import NearDuplicateIndex, shingles  # noqa: E402
+
+SKILLS = [
+    "python", "go", "java", "kafka", "postgresql", "redis", "aws", "gcp", "kubernetes",
+    "terraform", "react", "typescript", "spark", "airflow", "django", "fastapi", "grpc",
+]
+DUTIES = [
+    "design APIs", "mentor engineers", "own reliability", "run on-call", "tune queries",
+    "ship features", "review code", "scale services", "build pipelines", "write tests",
+]
+CITIES = ["Berlin", "Munich", "Paris", "Lisbon", "Warsaw", "Madrid", "Dublin", "Prague"]
+
+
+def posting(rng: random.Random, number: int, city: str) -> str:
+    skills = ", ".join(rng.sample(SKILLS, 6))
+    duties = ", ".join(rng.sample(DUTIES, 5))
+    return (
+        f"Role {number}: engineer in {city} working with {skills}. "
+        f"You will {duties} for team {rng.randrange(10_000)}."
+    )
+
+
+def jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,3000")
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--threshold", type=float, default=0.6)
+    args = parser.parse_args()
+
+    results = []
+    for size in map(int, args.sizes.split(",")):
+        rng = random.Random(size)
+        postings = [posting(random.Random(i), i, rng.choice(CITIES)) for i in range(size)]
+        index: NearDuplicateIndex[int] = NearDuplicateIndex()
+        start = time.perf_counter()
+        for number, text in enumerate(postings):
+            index.add(number, text)
+        add_time = (time.perf_counter() - start) / size
+        shingle_sets = [shingles(text) for text in postings]
+
+        targets = [rng.randrange(size) for _ in range(args.queries)]
+        queries = [posting(random.Random(t), t, "Vienna") for t in targets]
+
+        start = time.perf_counter()
+        found = [index.query(q, args.threshold) for q in queries]
+        lsh_time = (time.perf_counter() - start) / len(queries)
+
+        start = time.perf_counter()
+        for q in queries:
+            query_set = shingles(q)
+            max(range(size), key=lambda i: jaccard(query_set, shingle_sets[i]))
+        scan_time = (time.perf_counter() - start) / len(queries)
+
+        recall = sum(
+            match is not None and match[0] == target for match, target in zip(found, targets)
+        ) / len(queries)
+        results.append(
+            {
+                "postings": size,
+                "add_ms": round(add_time * 1000, 3),
+                "lsh_query_ms": round(lsh_time * 1000, 3),
+                "linear_scan_ms": round(scan_time * 1000, 3),
+                "recall": recall,
+            }
+        )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
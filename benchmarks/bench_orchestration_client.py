@@ -0,0 +1,110 @@
+"""Compare per-request clients with the shared ConnectionManager client.
+
+A stand-in orchestration app answers ``/generate-question`` after a fixed
+delay. The benchmark drives the same number of requests through a fresh
+``httpx.AsyncClient`` per call (the previous behaviour) and through
+``ConnectionManager``'s pooled client, then prints JSON results.
+
+    python benchmarks/bench_orchestration_client.py --requests 500 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "services/interview_session_service/app"))
+sys.path.append(str(ROOT / "services"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _servers import BackgroundServer  # noqa: E402
+from interview_core.turn_log import TurnLog  # noqa: E402
+
+from core.config import settings  # noqa: E402
+from services import connection_manager, orchestration_transport  # noqa: E402
+
+
+def stand_in_app(delay: float) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/interview/generate-question")
+    async def generate_question(payload: dict) -> dict:
+        await asyncio.sleep(delay)
+        return {"question_text": "What is a context manager?"}
+
+    return app
+
+
+async def per_request_client(url: str, payload: dict) -> None:
+    async with httpx.AsyncClient() as client:
+        resp = await client.post(url, json=payload)
+        resp.raise_for_status()
+
+
+async def run(mode: str, base_url: str, requests: int, concurrency: int) -> dict:
+    orchestration_transport.AI_API_URL = f"{base_url}/interview"
+    manager = connection_manager.ConnectionManager(
+        transport=orchestration_transport.HttpTransport()
+    )
+    await manager.startup()
+    key = "bench"
+    manager.contexts[key] = {"job_description": "Backend developer"}
+    history = TurnLog([{"role": "candidate", "message": "I like Python."}])
+    url = f"{base_url}/interview/generate-question"
+    payload = {"context": manager.contexts[key], "history": history.to_dicts()}
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            if mode == "pooled":
+                await manager._next_question(key, history)
+            else:
+                await per_request_client(url, payload)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    await manager.shutdown()
+
+    latencies.sort()
+    return {
+        "mode": mode,
+        "requests": requests,
+        "concurrency": concurrency,
+        "throughput_rps": round(requests / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.0, help="stand-in latency (s)")
+    parser.add_argument("--http2", action="store_true", help="pooled client uses HTTP/2")
+    args = parser.parse_args()
+
+    settings.ai_orchestration_http2 = args.http2
+    results = []
+    with BackgroundServer(stand_in_app(args.delay)) as server:
+        for mode in ("per_request", "pooled"):
+            results.append(
+                asyncio.run(run(mode, server.url, args.requests, args.concurrency))
+            )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
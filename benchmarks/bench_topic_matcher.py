@@ -0,0 +1,90 @@
+"""Benchmark topic inference on large job description and resume inputs.
+
+Compares the compiled ``SkillMatcher`` with the previous approach of testing
+every keyword with ``keyword in text``. Synthetic skills are added to the
+bundled taxonomy to show how each approach scales with taxonomy size, and
+documents of increasing size show scaling with input length.
+
+    python benchmarks/bench_topic_matcher.py
+"""
+
+import argparse
+import json
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "services"))
+
+from interview_core.skill_matcher import DEFAULT_TAXONOMY_PATH, SkillMatcher  # noqa: E402
+
+SAMPLE = (
+    "We are hiring a senior backend engineer to build REST APIs in Python and "
+    "Django on AWS. You will own PostgreSQL schema design, Kafka pipelines and "
+    "Kubernetes deployments, mentor engineers and work with product managers. "
+    "Experience with React, TypeScript, CI/CD and observability tooling such as "
+    "Prometheus and Grafana is a plus. Candidate resume: eight years shipping "
+    "node.js services, C++ trading systems and machine learning models. "
+)
+
+
+def synthetic_skills(count: int, rng: random.Random) -> list:
+    def word() -> str:
+        return "".join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 10)))
+
+    return [
+        {"name": f"{word()} {word()}", "aliases": [word(), f"{word()}.{word()}"]}
+        for _ in range(count)
+    ]
+
+
+def naive_match(terms: list, text: str) -> list:
+    lowered = text.lower()
+    return [term for term in terms if term in lowered]
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--taxonomy-sizes", default="0,5000,20000")
+    parser.add_argument("--doc-kb", default="10,100,1000")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    base = json.loads(DEFAULT_TAXONOMY_PATH.read_text())["skills"]
+    results = []
+    for extra in (int(x) for x in args.taxonomy_sizes.split(",")):
+        skills = base + synthetic_skills(extra, rng)
+        start = time.perf_counter()
+        matcher = SkillMatcher(skills)
+        compile_s = time.perf_counter() - start
+        terms = [s["name"] for s in skills] + [a for s in skills for a in s["aliases"]]
+        for kb in (int(x) for x in args.doc_kb.split(",")):
+            text = (SAMPLE * (kb * 1024 // len(SAMPLE) + 1))[: kb * 1024]
+            results.append({
+                "taxonomy_terms": matcher.term_count,
+                "doc_kb": kb,
+                "compile_ms": round(compile_s * 1000, 1),
+                "matcher_ms": round(timed(lambda: matcher.match(text), args.repeat) * 1000, 2),
+                "naive_substring_ms": round(
+                    timed(lambda: naive_match(terms, text), 1) * 1000, 2
+                ),
+                "topics": len(matcher.match(text)),
+            })
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
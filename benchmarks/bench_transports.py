@@ -0,0 +1,163 @@
+"""Compare per-turn overhead of the session service's orchestration transports.
+
+A stand-in LLM answers chat completions after a fixed delay. The session
+``ConnectionManager`` runs in this process and plays interviews against it
+twice: with the ``http`` transport, through the real orchestration service
+in a subprocess, and with the ``inprocess`` transport, running the same
+``interview_core`` engine directly. A turn lasts from handling
+``send_answer`` to sending ``new_question``. Direct calls to the stand-in
+give the LLM's own latency, and each transport's overhead is its turn
+latency minus that baseline. The script prints JSON results.
+
+    python benchmarks/bench_transports.py --sessions 20 --rounds 10
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import httpx
+from fastapi import FastAPI
+
+ROOT = Path(__file__).resolve().parents[1]
+SESSION_APP = ROOT / "services/interview_session_service/app"
+ORCHESTRATION_APP = ROOT / "services/ai_orchestration_service/app"
+sys.path.insert(0, str(SESSION_APP))
+sys.path.append(str(ROOT / "services"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _servers import BackgroundServer, ServiceProcess  # noqa: E402
+from services import connection_manager, orchestration_transport  # noqa: E402
+from services.session_store import MemorySessionStore  # noqa: E402
+
+JOB = "Backend engineer building Python APIs on AWS with PostgreSQL and Kafka."
+RESUME = "Five years of Python, FastAPI and PostgreSQL; some Kubernetes."
+QUESTION = "Can you walk me through how you would design this service?"
+
+
+def stand_in_llm(delay: float) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/v1/chat/completions")
+    async def chat(payload: dict) -> dict:
+        await asyncio.sleep(delay)
+        return {"choices": [{"message": {"content": QUESTION}}]}
+
+    return app
+
+
+class SilentWebSocket:
+    async def accept(self) -> None:
+        pass
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+    async def send_json(self, data: dict) -> None:
+        if data["event"] == "error":
+            raise RuntimeError(data["payload"]["detail"])
+
+
+def summarize(name: str, latencies: List[float], elapsed: float, baseline: float) -> dict:
+    latencies.sort()
+    mean = statistics.mean(latencies)
+    return {
+        "transport": name,
+        "turns": len(latencies),
+        "throughput_turns_per_s": round(len(latencies) / elapsed, 1),
+        "turn_p50_ms": round(statistics.median(latencies) * 1000, 3),
+        "turn_p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 3),
+        "turn_mean_ms": round(mean * 1000, 3),
+        "overhead_mean_ms": round((mean - baseline) * 1000, 3),
+    }
+
+
+async def llm_baseline(llm_url: str, turns: int) -> float:
+    """Mean latency of calling the stand-in LLM directly."""
+
+    payload = {"model": "bench", "messages": [{"role": "user", "content": "Hi"}]}
+    latencies = []
+    async with httpx.AsyncClient() as client:
+        for _ in range(turns):
+            start = time.perf_counter()
+            resp = await client.post(f"{llm_url}/v1/chat/completions", json=payload)
+            resp.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+    return statistics.mean(latencies)
+
+
+async def play(transport, name: str, args, baseline: float) -> dict:
+    manager = connection_manager.ConnectionManager(
+        store=MemorySessionStore(), transport=transport
+    )
+    await manager.startup()
+    latencies: List[float] = []
+
+    async def interview(index: int) -> None:
+        ws = SilentWebSocket()
+        await manager.connect(ws, f"{name}-{index}")
+        join = {
+            "event": "join_session",
+            "payload": {"job_description": JOB, "candidate_resume": RESUME},
+        }
+        await manager.handle_message(ws, join)
+        for round_number in range(args.rounds):
+            answer = {
+                "event": "send_answer",
+                "payload": {"answer_text": f"Answer {round_number} from {index}"},
+            }
+            start = time.perf_counter()
+            await manager.handle_message(ws, answer)
+            latencies.append(time.perf_counter() - start)
+        manager.disconnect(ws)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(interview(i) for i in range(args.sessions)))
+    elapsed = time.perf_counter() - start
+    await manager.shutdown()
+    return summarize(name, latencies, elapsed, baseline)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10, help="concurrent interviews")
+    parser.add_argument("--rounds", type=int, default=20, help="send_answer turns per interview")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="stand-in LLM seconds")
+    args = parser.parse_args()
+
+    results = []
+    with BackgroundServer(stand_in_llm(args.llm_latency)) as llm:
+        llm_endpoint = f"{llm.url}/v1/chat/completions"
+        baseline = asyncio.run(llm_baseline(llm.url, 200))
+        orchestration_env = {
+            "LLM_PROVIDER": "local",
+            "LOCAL_LLM_URL": llm_endpoint,
+            "OPENAI_API_KEY": "",
+            "OPENAI_MODEL": "gpt-3.5-turbo",
+            "GEMINI_API_KEY": "",
+            "LLM_TIMEOUT": "30",
+            "LLM_CACHE_BACKEND": "none",
+        }
+        with ServiceProcess(ORCHESTRATION_APP, orchestration_env) as orchestration:
+            orchestration_transport.AI_API_URL = f"{orchestration.url}/api/v1/interview"
+            results.append(
+                asyncio.run(play(orchestration_transport.HttpTransport(), "http", args, baseline))
+            )
+        # The in-process engine reads the same settings as the service did
+        os.environ.update(orchestration_env)
+        results.append(
+            asyncio.run(
+                play(orchestration_transport.InProcessTransport(), "inprocess", args, baseline)
+            )
+        )
+    print(json.dumps({"llm_mean_ms": round(baseline * 1000, 3), "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
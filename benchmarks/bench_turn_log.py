@@ -0,0 +1,111 @@
+"""Measure session history storage: a list of dicts vs. ``TurnLog``.
+
+Memory is the traced allocation for 1,000 sessions holding ``--turns``
+turns each. CPU is the cost of preparing one question request on the
+direct-provider path: before, the context and every turn were revalidated
+into Pydantic models and then turned into messages; now the validated
+context is kept and ``build_messages`` reads the ``TurnLog`` as-is. The
+script prints JSON results.
+
+    python benchmarks/bench_turn_log.py --turns 20 --repeat 2000
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT / "services"))
+
+from interview_core import turn_log  # noqa: E402
+from interview_core.llm_service import build_messages  # noqa: E402
+from interview_core.schemas import ConversationTurn, InterviewContext  # noqa: E402
+
+SESSIONS = 1000
+CONTEXT = {
+    "job_description": "Backend developer with Python, Kafka and PostgreSQL on AWS. " * 20,
+    "candidate_resume": "Five years building payment services in Python and Go. " * 20,
+}
+QUESTION = "How did you keep consumers idempotent while replaying the Kafka backlog?"
+ANSWER = "We keyed every write on the event id and made the upsert a no-op on conflict."
+
+
+def turns(count: int) -> list:
+    return [
+        ("interviewer" if i % 2 == 0 else "candidate", f"{i}: {QUESTION if i % 2 == 0 else ANSWER}")
+        for i in range(count)
+    ]
+
+
+def dict_history(count: int) -> list:
+    history = []
+    for role, message in turns(count):
+        history.append({"role": role, "message": message})
+    return history
+
+
+def log_history(count: int):
+    history = turn_log.TurnLog()
+    for role, message in turns(count):
+        history.append(role, message)
+    return history
+
+
+def memory_per_sessions(build, count: int) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = [build(count) for _ in range(SESSIONS)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del sessions
+    return used
+
+
+def per_turn_us(prepare, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        prepare()
+    return round((time.perf_counter() - start) / repeat * 1e6, 3)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    dicts = dict_history(args.turns)
+    log = log_history(args.turns)
+    context = InterviewContext(**CONTEXT)
+
+    def revalidate():
+        return build_messages(
+            InterviewContext(**CONTEXT), [ConversationTurn(**turn) for turn in dicts]
+        )
+
+    def direct():
+        return build_messages(context, log)
+
+    assert revalidate() == direct()
+    results = [
+        {
+            "storage": "list_of_dicts",
+            "turns": args.turns,
+            "bytes_per_1000_sessions": memory_per_sessions(dict_history, args.turns),
+            "prepare_turn_us": per_turn_us(revalidate, args.repeat),
+        },
+        {
+            "storage": "turn_log",
+            "turns": args.turns,
+            "bytes_per_1000_sessions": memory_per_sessions(log_history, args.turns),
+            "prepare_turn_us": per_turn_us(direct, args.repeat),
+        },
+    ]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
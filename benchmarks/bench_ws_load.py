@@ -0,0 +1,216 @@
+"""Load-test the interview WebSocket with concurrent simulated candidates.
+
+A stand-in LLM server answers chat completions after a latency drawn from a
+log-normal distribution, optionally as a server-sent event stream. The real
+orchestration and session services run against it in subprocesses. For each
+concurrency level, N candidates connect to ``/api/v1/ws/{interview_id}``,
+send ``join_session`` and then answer K questions. A turn lasts from sending
+the event to receiving ``new_question``. All candidates stay connected until
+the last one finishes, so the session service's resident memory then covers
+every open session. Fresh services are started for each level, and the
+script prints JSON results.
+
+    python benchmarks/bench_ws_load.py --sessions 10,50,200 --rounds 5
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import websockets
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from _servers import BackgroundServer, ServiceProcess  # noqa: E402
+
+ORCHESTRATION_APP = ROOT / "services/ai_orchestration_service/app"
+SESSION_APP = ROOT / "services/interview_session_service/app"
+
+RESUME = "Five years of Python, FastAPI and PostgreSQL; some Kubernetes."
+JOB = "Backend engineer building Python APIs on AWS with PostgreSQL and Kafka."
+
+
+class TurnFailed(Exception):
+    """The session service reported an error instead of the next question."""
+
+
+def stand_in_llm(median: float, sigma: float, chunks: int, seed: int) -> FastAPI:
+    app = FastAPI()
+    rng = random.Random(seed)
+
+    def latency() -> float:
+        return median * rng.lognormvariate(0, sigma) if sigma > 0 else median
+
+    @app.post("/v1/chat/completions")
+    async def chat(payload: dict):
+        delay = latency()
+        words = "Can you walk me through how you would design this service".split()
+        if not payload.get("stream"):
+            await asyncio.sleep(delay)
+            return {"choices": [{"message": {"content": " ".join(words) + "?"}}]}
+
+        async def events():
+            size = max(1, len(words) // chunks)
+            pieces = [" ".join(words[i:i + size]) + " " for i in range(0, len(words), size)]
+            pieces[-1] = pieces[-1].rstrip() + "?"
+            for piece in pieces:
+                await asyncio.sleep(delay / len(pieces))
+                chunk = {"choices": [{"delta": {"content": piece}}]}
+                yield f"data: {json.dumps(chunk)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+def percentile(ordered: List[float], q: float) -> Optional[float]:
+    if not ordered:
+        return None
+    index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+    return round(ordered[index] * 1000, 2)
+
+
+async def wait_for_question(ws, timeout: float) -> None:
+    async def receive() -> None:
+        while True:
+            message = json.loads(await ws.recv())
+            if message["event"] == "new_question":
+                return
+            if message["event"] == "error" and message["payload"].get("step") == "question":
+                raise TurnFailed(message["payload"].get("detail"))
+
+    await asyncio.wait_for(receive(), timeout)
+
+
+async def drive(ws_url: str, session: ServiceProcess, args, sessions: int) -> dict:
+    join_latencies: List[float] = []
+    turn_latencies: List[float] = []
+    errors: List[str] = []
+    finished = asyncio.Event()
+    remaining = [sessions]
+    peak_rss = [None]
+
+    async def turn(ws, event: dict, latencies: List[float]) -> None:
+        start = time.perf_counter()
+        await ws.send(json.dumps(event))
+        await wait_for_question(ws, args.turn_timeout)
+        latencies.append(time.perf_counter() - start)
+
+    async def candidate(index: int) -> None:
+        await asyncio.sleep(args.ramp * index / sessions)
+        completed = 0
+        try:
+            async with websockets.connect(
+                f"{ws_url}/api/v1/ws/load-{sessions}-{index}", open_timeout=args.turn_timeout
+            ) as ws:
+                join = {
+                    "event": "join_session",
+                    "payload": {"job_description": JOB, "candidate_resume": RESUME},
+                }
+                await turn(ws, join, join_latencies)
+                completed += 1
+                for round_number in range(args.rounds):
+                    answer = {
+                        "event": "send_answer",
+                        "payload": {"answer_text": f"Answer {round_number} from {index}"},
+                    }
+                    await turn(ws, answer, turn_latencies)
+                    completed += 1
+                await done()
+                await finished.wait()
+        except Exception as exc:
+            errors.extend([type(exc).__name__] * (args.rounds + 1 - completed))
+            await done()
+
+    async def done() -> None:
+        remaining[0] -= 1
+        if remaining[0] == 0:
+            peak_rss[0] = session.rss_bytes()
+            finished.set()
+
+    baseline_rss = session.rss_bytes()
+    start = time.perf_counter()
+    await asyncio.gather(*(candidate(i) for i in range(sessions)))
+    elapsed = time.perf_counter() - start
+
+    attempted = sessions * (args.rounds + 1)
+    completed = len(join_latencies) + len(turn_latencies)
+    join_latencies.sort()
+    turn_latencies.sort()
+    memory = None
+    if baseline_rss is not None and peak_rss[0] is not None:
+        memory = round((peak_rss[0] - baseline_rss) / sessions / 1024, 1)
+    return {
+        "sessions": sessions,
+        "rounds": args.rounds,
+        "stream": args.stream,
+        "turns": attempted,
+        "elapsed_s": round(elapsed, 2),
+        "throughput_turns_per_s": round(completed / elapsed, 1),
+        "join_p50_ms": percentile(join_latencies, 50),
+        "turn_p50_ms": percentile(turn_latencies, 50),
+        "turn_p95_ms": percentile(turn_latencies, 95),
+        "turn_p99_ms": percentile(turn_latencies, 99),
+        "turn_mean_ms": round(statistics.mean(turn_latencies) * 1000, 2)
+        if turn_latencies else None,
+        "error_rate": round(len(errors) / attempted, 4),
+        "errors": {name: errors.count(name) for name in sorted(set(errors))},
+        "session_rss_baseline_mb": round(baseline_rss / 2**20, 1) if baseline_rss else None,
+        "memory_per_session_kb": memory,
+    }
+
+
+def run_level(llm_url: str, args, sessions: int) -> dict:
+    orchestration_env = {
+        "LLM_PROVIDER": "local",
+        "LOCAL_LLM_URL": f"{llm_url}/v1/chat/completions",
+        "OPENAI_API_KEY": "",
+        "OPENAI_MODEL": "gpt-3.5-turbo",
+        "GEMINI_API_KEY": "",
+        "LLM_TIMEOUT": str(args.turn_timeout),
+        "LLM_CACHE_BACKEND": "none",
+    }
+    with ServiceProcess(ORCHESTRATION_APP, orchestration_env) as orchestration:
+        session_env = {
+            "AI_ORCHESTRATION_URL": f"{orchestration.url}/api/v1/interview",
+            "AI_ORCHESTRATION_STREAM": str(args.stream).lower(),
+            "AI_ORCHESTRATION_TIMEOUT": str(args.turn_timeout),
+        }
+        with ServiceProcess(SESSION_APP, session_env) as session:
+            ws_url = session.url.replace("http://", "ws://")
+            return asyncio.run(drive(ws_url, session, args, sessions))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", default="10,50", help="concurrent candidates per level")
+    parser.add_argument("--rounds", type=int, default=3, help="send_answer turns per candidate")
+    parser.add_argument("--ramp", type=float, default=1.0, help="seconds to spread connects")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="median LLM seconds")
+    parser.add_argument("--llm-sigma", type=float, default=0.5, help="log-normal spread")
+    parser.add_argument("--stream", action="store_true", help="stream questions token by token")
+    parser.add_argument("--chunks", type=int, default=6, help="fragments per streamed reply")
+    parser.add_argument("--turn-timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    llm = stand_in_llm(args.llm_latency, args.llm_sigma, args.chunks, args.seed)
+    results = []
+    with BackgroundServer(llm) as server:
+        for level in args.sessions.split(","):
+            results.append(run_level(server.url, args, int(level)))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
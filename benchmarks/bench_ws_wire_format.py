@@ -0,0 +1,121 @@
+"""Compare frame size and encode cost of the interview WebSocket wire formats.
+
+A representative stream of session events is encoded with Starlette's
+``send_json`` encoding (stdlib ``json``), with the session service's JSON
+codec (``orjson`` when installed) and with MessagePack when installed. The
+stream is a join, streamed question deltas, typing notices, full questions
+and a resume with history. Each format is measured without compression and
+with permessage-deflate as websocket servers apply it: raw DEFLATE with a
+sync flush per message, and either a fresh window per message or the
+default context takeover. The script prints JSON results.
+
+    python benchmarks/bench_ws_wire_format.py --turns 20 --repeat 200
+"""
+
+import argparse
+import json
+import sys
+import time
+import zlib
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "services/interview_session_service/app"))
+sys.path.append(str(ROOT / "services"))
+
+from services import wire_format  # noqa: E402
+
+
+QUESTION = (
+    "You mentioned migrating the billing service to Kafka. How did you keep "
+    "consumers idempotent while replaying the backlog, and what would you change?"
+)
+
+
+def session_events(turns: int) -> list:
+    events = [
+        {"event": "session_started"},
+        {"event": "topics", "payload": {"topics": ["python", "kafka", "postgresql", "aws"]}},
+    ]
+    history = []
+    for turn in range(turns):
+        events.append({"event": "interviewer_typing"})
+        for word in QUESTION.split(" "):
+            events.append({"event": "new_question_delta", "payload": {"delta": word + " "}})
+        events.append({"event": "new_question", "payload": {"question_text": QUESTION}})
+        history.append({"role": "interviewer", "message": QUESTION})
+        history.append({"role": "candidate", "message": f"Answer {turn}: " + QUESTION[::-1]})
+    events.append(
+        {"event": "session_resumed", "payload": {"interview_id": "bench", "history": history}}
+    )
+    return events
+
+
+def stdlib_json(event: dict) -> str:
+    # What ``WebSocket.send_json`` does
+    return json.dumps(event, separators=(",", ":"), ensure_ascii=False)
+
+
+def deflate(frames: list, context_takeover: bool) -> int:
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    total = 0
+    for frame in frames:
+        if not context_takeover:
+            compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+        data = compressor.compress(frame) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        # RFC 7692: the trailing empty block is not sent
+        total += len(data) - 4
+    return total
+
+
+def measure(name: str, encode, decode, events: list, repeat: int) -> dict:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        frames = [encode(event) for event in events]
+    encode_time = (time.perf_counter() - start) / (repeat * len(events))
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for frame in frames:
+            decode(frame)
+    decode_time = (time.perf_counter() - start) / (repeat * len(events))
+
+    raw = [frame.encode() if isinstance(frame, str) else frame for frame in frames]
+    start = time.perf_counter()
+    deflated = deflate(raw, context_takeover=True)
+    deflate_time = (time.perf_counter() - start) / len(events)
+    total = sum(len(frame) for frame in raw)
+    return {
+        "format": name,
+        "events": len(events),
+        "bytes": total,
+        "mean_frame_bytes": round(total / len(events), 1),
+        "deflate_bytes": deflated,
+        "deflate_no_context_takeover_bytes": deflate(raw, context_takeover=False),
+        "encode_us": round(encode_time * 1e6, 3),
+        "decode_us": round(decode_time * 1e6, 3),
+        "deflate_us": round(deflate_time * 1e6, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    events = session_events(args.turns)
+    results = [measure("json_stdlib", stdlib_json, json.loads, events, args.repeat)]
+    codecs = wire_format.available_codecs()
+    json_name = "json_orjson" if wire_format.orjson is not None else "json_codec"
+    results.append(
+        measure(json_name, codecs["json"].encode, codecs["json"].decode, events, args.repeat)
+    )
+    if "msgpack" in codecs:
+        codec = codecs["msgpack"]
+        results.append(measure("msgpack", codec.encode, codec.decode, events, args.repeat))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,187 @@
 """API endpoints for interview-related operations."""
 
-from fastapi import APIRouter
+import asyncio
+import json
+from typing import AsyncIterator, List, Optional, Tuple
 
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from interview_core.admission import ProviderSaturated, admission_control
+from interview_core.batch_runner import run_batch
+from interview_core.engine import engine
+from interview_core.provider_router import provider_router
+
+from core.config import settings
 from schemas.interview import (
+    BatchQuestionRequest,
+    BatchTopicsRequest,
+    ConversationStatsResponse,
+    ConversationTurn,
     InterviewRequest,
     InterviewResponse,
     InterviewContext,
     TopicsResponse,
 )
-from services.llm_service import generate_next_question
-from services.topic_service import determine_topics
+from services.conversation_cache import conversation_cache
 
 router = APIRouter()
 
 
-@router.post("/generate-question", response_model=InterviewResponse)
+def _conversation(request: InterviewRequest) -> Tuple[InterviewContext, List[ConversationTurn]]:
+    """Return the full context and history, expanding incremental requests.
+
+    A context sent in full is compacted here; sessions keep the compacted
+    context for their later delta requests.
+    """
+
+    context = engine.prepare_context(request.context) if request.context is not None else None
+    if request.session_id is None:
+        return context, request.history
+    return conversation_cache.resolve(
+        request.session_id, request.base_version, context, request.history
+    )
+
+
+def _commit(
+    request: InterviewRequest,
+    context: InterviewContext,
+    history: List[ConversationTurn],
+    question: str,
+) -> Optional[int]:
+    """Remember the conversation including the new question; return its version."""
+
+    if request.session_id is None:
+        return None
+    turns = history + [ConversationTurn(role="interviewer", message=question)]
+    return conversation_cache.commit(request.session_id, context, turns)
+
+
+@router.post(
+    "/generate-question", response_model=InterviewResponse, response_model_exclude_none=True
+)
 async def generate_question(request: InterviewRequest) -> InterviewResponse:
-    """Generate the next interview question."""
+    """Generate the next interview question.
+
+    An opening question for a near-duplicate of a registered job posting is
+    taken from that posting's ready pool.
+    """
+
+    context, history = _conversation(request)
+    question = await engine.generate_question(context, history, use_cache=request.use_cache)
+    version = _commit(request, context, history, question)
+    return InterviewResponse(question_text=question, version=version)
+
+
+@router.post("/generate-question/stream")
+async def generate_question_stream(request: InterviewRequest) -> StreamingResponse:
+    """Stream the next interview question as newline-delimited JSON.
+
+    Each line is an object of the form ``{"delta": "..."}``; concatenating
+    the deltas yields the full question text. If the request has to wait
+    for a provider slot, a ``{"queued": {"position": n, "estimated_wait": s}}``
+    line is sent first. Requests with a ``session_id`` end with a
+    ``{"version": n}`` line.
+    """
+
+    context, history = _conversation(request)
+    limiter = admission_control.limiter(provider_router.choose())
+    if limiter.saturated():
+        raise ProviderSaturated(limiter.provider, limiter.estimated_wait(limiter.queue_depth + 1))
+
+    async def body() -> AsyncIterator[str]:
+        events: asyncio.Queue = asyncio.Queue()
+
+        async def on_queued(position: int, estimated_wait: float) -> None:
+            await events.put({"queued": {"position": position, "estimated_wait": estimated_wait}})
+
+        async def produce() -> None:
+            try:
+                parts = []
+                async for delta in engine.stream_question(
+                    context, history, use_cache=request.use_cache, on_queued=on_queued
+                ):
+                    parts.append(delta)
+                    await events.put({"delta": delta})
+                version = _commit(request, context, history, "".join(parts).strip())
+                if version is not None:
+                    await events.put({"version": version})
+            finally:
+                await events.put(None)
 
-    question = await generate_next_question(request.context, request.history)
-    return InterviewResponse(question_text=question)
+        task = asyncio.create_task(produce())
+        try:
+            while (event := await events.get()) is not None:
+                yield json.dumps(event) + "\n"
+            await task
+        finally:
+            task.cancel()
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+
+def _batch_response(items: list, work) -> StreamingResponse:
+    if len(items) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=413, detail=f"Batch exceeds {settings.batch_max_items} items"
+        )
+
+    async def body() -> AsyncIterator[str]:
+        async for result in run_batch(items, work, settings.batch_concurrency):
+            yield json.dumps(result) + "\n"
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+
+@router.post("/generate-question/batch")
+async def generate_question_batch(request: BatchQuestionRequest) -> StreamingResponse:
+    """Generate a question for each item, streamed as newline-delimited JSON.
+
+    Up to ``BATCH_CONCURRENCY`` items run at once. Lines arrive in completion
+    order as ``{"index": i, "question_text": "..."}`` (plus ``version`` for
+    items with a ``session_id``) or ``{"index": i, "error": {"type": ...,
+    "detail": ...}}``; a failed item does not stop the others. Items are
+    answered as ``/generate-question`` answers them, ready openers included.
+    """
+
+    async def work(item: InterviewRequest) -> dict:
+        context, history = _conversation(item)
+        question = await engine.generate_question(context, history, use_cache=item.use_cache)
+        result = {"question_text": question}
+        version = _commit(item, context, history, question)
+        if version is not None:
+            result["version"] = version
+        return result
+
+    return _batch_response(request.items, work)
 
 
 @router.post("/determine-topics", response_model=TopicsResponse)
 async def determine_topics_endpoint(context: InterviewContext) -> TopicsResponse:
-    """Determine interview topics based on job description and resume."""
+    """Determine interview topics based on job description and resume.
+
+    Without a resume, a near-duplicate of a registered job posting reuses
+    the topics inferred for that posting.
+    """
+
+    return TopicsResponse(topics=await engine.determine_topics(context))
+
+
+@router.post("/determine-topics/batch")
+async def determine_topics_batch(request: BatchTopicsRequest) -> StreamingResponse:
+    """Infer topics for each context, streamed as ``{"index": i, "topics": [...]}`` lines.
+
+    Like ``/determine-topics``, near-duplicates of registered postings reuse their topics.
+    """
+
+    async def work(context: InterviewContext) -> dict:
+        return {"topics": await engine.determine_topics(context)}
+
+    return _batch_response(request.items, work)
+
+
+@router.get("/conversation-stats", response_model=ConversationStatsResponse)
+async def conversation_stats() -> ConversationStatsResponse:
+    """Report how often incremental requests matched the cached conversation."""
 
-    topics = await determine_topics(context)
-    return TopicsResponse(topics=topics)
+    return ConversationStatsResponse(**conversation_cache.stats())
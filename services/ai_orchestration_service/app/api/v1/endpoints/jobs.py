@@ -0,0 +1,63 @@
+"""API endpoints for pre-warmed job postings."""
+
+from fastapi import APIRouter, HTTPException
+
+from interview_core.engine import engine
+from interview_core.job_registry import PrewarmedJob, job_registry
+
+from schemas.jobs import (
+    JobRegistrationRequest,
+    JobResponse,
+    JobStartRequest,
+    JobStartResponse,
+)
+
+router = APIRouter()
+
+
+def _job_response(job: PrewarmedJob) -> JobResponse:
+    return JobResponse(
+        job_id=job.job_id,
+        job_description=job.context.job_description,
+        topics=job.topics,
+        questions_ready=len(job.questions),
+        duplicate_of=job.duplicate_of.job_id if job.duplicate_of is not None else None,
+    )
+
+
+def _get_job(job_id: str) -> PrewarmedJob:
+    job = job_registry.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job
+
+
+@router.post("", response_model=JobResponse, response_model_exclude_none=True)
+async def register_job(request: JobRegistrationRequest) -> JobResponse:
+    """Register a job posting and precompute its topics and opening questions."""
+
+    job = await job_registry.register(
+        request.job_description, job_id=request.job_id, pool_size=request.pool_size
+    )
+    return _job_response(job)
+
+
+@router.get("/{job_id}", response_model=JobResponse, response_model_exclude_none=True)
+async def get_job(job_id: str) -> JobResponse:
+    """Describe a registered job posting."""
+
+    return _job_response(_get_job(job_id))
+
+
+@router.post("/{job_id}/start", response_model=JobStartResponse)
+async def start_job_interview(job_id: str, request: JobStartRequest) -> JobStartResponse:
+    """Serve the precomputed first turn of an interview for a job posting.
+
+    Topics are only recomputed when the candidate supplies a resume; the
+    opening question depends on the job description alone.
+    """
+
+    start = await engine.start_job(job_id, request.candidate_resume)
+    if start is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return JobStartResponse(**start)
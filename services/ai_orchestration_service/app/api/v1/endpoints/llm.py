@@ -0,0 +1,78 @@
+"""API endpoints exposing LLM provider client internals."""
+
+from fastapi import APIRouter
+
+from interview_core.admission import admission_control
+from interview_core.completion_cache import completion_cache
+from interview_core.config import settings
+from interview_core.llm_service import local_batcher, provider_clients
+from interview_core.provider_router import provider_router
+from interview_core.resilience import circuit_breakers
+
+from schemas.llm import (
+    BatchStatsResponse,
+    BreakerStats,
+    BreakerStatsResponse,
+    CacheStatsResponse,
+    PoolStats,
+    PoolStatsResponse,
+    QueueStats,
+    QueueStatsResponse,
+    RouteStatsResponse,
+)
+
+router = APIRouter()
+
+
+@router.get("/pool-stats", response_model=PoolStatsResponse)
+async def pool_stats() -> PoolStatsResponse:
+    """Report connection pool usage for each provider client."""
+
+    pools = {
+        provider: PoolStats(**stats)
+        for provider, stats in provider_clients.stats().items()
+    }
+    return PoolStatsResponse(pools=pools)
+
+
+@router.get("/cache-stats", response_model=CacheStatsResponse)
+async def cache_stats() -> CacheStatsResponse:
+    """Report completion cache hits, misses and size."""
+
+    return CacheStatsResponse(**await completion_cache.stats())
+
+
+@router.get("/batch-stats", response_model=BatchStatsResponse)
+async def batch_stats() -> BatchStatsResponse:
+    """Report how requests to the local LLM are being batched."""
+
+    return BatchStatsResponse(enabled=settings.llm_batch_enabled, **local_batcher.stats())
+
+
+@router.get("/queue-stats", response_model=QueueStatsResponse)
+async def queue_stats() -> QueueStatsResponse:
+    """Report admission queue depth and wait times for each provider."""
+
+    queues = {
+        provider: QueueStats(**stats)
+        for provider, stats in admission_control.stats().items()
+    }
+    return QueueStatsResponse(queues=queues)
+
+
+@router.get("/route-stats", response_model=RouteStatsResponse)
+async def route_stats() -> RouteStatsResponse:
+    """Report per-provider latency and health used for routing and hedging."""
+
+    return RouteStatsResponse(**provider_router.stats())
+
+
+@router.get("/breaker-stats", response_model=BreakerStatsResponse)
+async def breaker_stats() -> BreakerStatsResponse:
+    """Report circuit breaker state and transition counts for each provider."""
+
+    breakers = {
+        provider: BreakerStats(**stats)
+        for provider, stats in circuit_breakers.stats().items()
+    }
+    return BreakerStatsResponse(breakers=breakers)
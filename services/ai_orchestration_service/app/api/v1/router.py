@@ -1,5 +1,7 @@
 from fastapi import APIRouter
-from .endpoints import interview
+from .endpoints import interview, jobs, llm
 
 api_router = APIRouter()
 api_router.include_router(interview.router, prefix="/interview", tags=["interview"])
+api_router.include_router(jobs.router, prefix="/interview/jobs", tags=["jobs"])
+api_router.include_router(llm.router, prefix="/llm", tags=["llm"])
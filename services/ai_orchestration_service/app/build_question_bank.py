@@ -0,0 +1,93 @@
+"""Build the offline question bank from a file of job descriptions.
+
+Topics are inferred for every job description with ``determine_topics``,
+and questions are generated per topic through the configured providers,
+as the service would call them. Results are appended to the bank as they
+arrive, so an interrupted build resumes where it stopped. Run from this
+directory, with the shared package on the path::
+
+    PYTHONPATH=../.. python build_question_bank.py jobs.txt question_bank.jsonl --per-topic 5
+
+The input holds one job description per line. Point ``QUESTION_BANK_PATH``
+at the output to serve from it.
+"""
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from interview_core.batch_runner import run_batch
+from interview_core.llm_service import generate_topic_question, local_batcher, provider_clients
+from interview_core.question_bank import QuestionBank
+from interview_core.schemas import InterviewContext
+from interview_core.topic_service import determine_topics
+
+from core.config import settings
+
+
+async def plan(jobs: List[str], bank: QuestionBank, per_topic: int) -> List[Tuple[str, str]]:
+    """Return one ``(topic, job_description)`` item per question still needed."""
+
+    job_for_topic: Dict[str, str] = {}
+    for job in jobs:
+        for topic in await determine_topics(InterviewContext(job_description=job)):
+            job_for_topic.setdefault(topic, job)
+    return [
+        (topic, job)
+        for topic, job in job_for_topic.items()
+        for _ in range(per_topic - len(bank.questions(topic)))
+    ]
+
+
+async def build(input_path: Path, output_path: Path, per_topic: int, concurrency: int) -> dict:
+    jobs = [line.strip() for line in input_path.read_text(encoding="utf-8").splitlines()]
+    jobs = [job for job in jobs if job]
+    bank = QuestionBank.from_file(output_path) if output_path.exists() else QuestionBank()
+    items = await plan(jobs, bank, per_topic)
+
+    async def work(item: Tuple[str, str]) -> dict:
+        topic, job = item
+        context = InterviewContext(job_description=job)
+        return {"topic": topic, "question": await generate_topic_question(context, topic)}
+
+    added = duplicates = failed = 0
+    await provider_clients.startup()
+    try:
+        with open(output_path, "a", encoding="utf-8") as out:
+            async for result in run_batch(items, work, concurrency):
+                if "error" in result:
+                    failed += 1
+                elif bank.add(result["topic"], result["question"]):
+                    out.write(json.dumps({"topic": result["topic"], "question": result["question"]}))
+                    out.write("\n")
+                    added += 1
+                else:
+                    duplicates += 1
+    finally:
+        await local_batcher.aclose()
+        await provider_clients.aclose()
+    return {
+        "jobs": len(jobs),
+        "topics": len(bank.topics()),
+        "questions": len(bank),
+        "added": added,
+        "duplicates": duplicates,
+        "failed": failed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", type=Path, help="job descriptions, one per line")
+    parser.add_argument("output", type=Path, help="question bank to create or extend")
+    parser.add_argument("--per-topic", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=settings.batch_concurrency)
+    args = parser.parse_args()
+    summary = asyncio.run(build(args.input, args.output, args.per_topic, args.concurrency))
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
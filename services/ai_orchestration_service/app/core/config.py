@@ -5,28 +5,23 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
-    """Application settings and LLM provider configuration."""
+    """Settings of the HTTP API; the engine's are in ``interview_core.config``."""
 
     model_config = SettingsConfigDict(
         env_file=Path(__file__).resolve().parents[2] / ".env",
         env_file_encoding="utf-8",
+        extra="ignore",
     )
 
-    # Which LLM backend to use: "openai", "gemini", or "local"
-    llm_provider: str
-
-    # API keys or URLs for the various providers
-    openai_api_key: str
-    # Default OpenAI model to use
-    openai_model: str
-    gemini_api_key: str
-    # Default endpoint for a locally hosted model.
-    # `host.docker.internal` lets containers reach services on the host.
-    # local_llm_url: str = "http://host.docker.internal:1234/v1/chat/completions"
-    local_llm_url: str
-
-    # Timeout (in seconds) for outgoing HTTP requests to LLM providers
-    llm_timeout: float
+    # Conversations kept per session so clients can send only new turns
+    conversation_cache_max_sessions: int = 10000
+    # Seconds an idle conversation is kept before the client must resync
+    conversation_cache_ttl: float = 3600.0
+
+    # Largest batch accepted by the batch endpoints, and how many of its
+    # items run at once (admission control still bounds provider calls)
+    batch_max_items: int = 1000
+    batch_concurrency: int = 8
 
 
 settings = Settings()
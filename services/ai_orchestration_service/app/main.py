@@ -1,5 +1,57 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import Union
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+from interview_core.admission import ProviderSaturated
+from interview_core.engine import engine
+from interview_core.metrics import CONTENT_TYPE, MetricsMiddleware, registry
+from interview_core.resilience import CircuitOpen
+from interview_core.tracing import TracingMiddleware
+
 from api.v1.router import api_router
+from services.conversation_cache import ConversationOutOfSync
+
 
-app = FastAPI(title="AI Orchestration Service")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await engine.startup()
+    yield
+    await engine.aclose()
+
+
+app = FastAPI(title="AI Orchestration Service", lifespan=lifespan)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(TracingMiddleware, tracer=engine.tracer)
 app.include_router(api_router, prefix="/api/v1")
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Expose service metrics in the Prometheus text format."""
+
+    return Response(registry.render(), media_type=CONTENT_TYPE)
+
+
+@app.exception_handler(ProviderSaturated)
+@app.exception_handler(CircuitOpen)
+async def provider_unavailable_handler(
+    request: Request, exc: Union[ProviderSaturated, CircuitOpen]
+) -> JSONResponse:
+    """Reject work fast when a provider's queue is full or its circuit is open."""
+
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc), "retry_after": exc.retry_after},
+        headers={"Retry-After": str(max(1, round(exc.retry_after)))},
+    )
+
+
+@app.exception_handler(ConversationOutOfSync)
+async def conversation_out_of_sync_handler(
+    request: Request, exc: ConversationOutOfSync
+) -> JSONResponse:
+    """Ask the client to resend the full conversation."""
+
+    return JSONResponse(status_code=409, content={"detail": str(exc), "version": exc.version})
@@ -2,37 +2,67 @@
 
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
+from interview_core.schemas import ConversationTurn, InterviewContext
 
-class InterviewContext(BaseModel):
-    """Context for the interview such as job description."""
 
-    job_description: str
-    candidate_resume: Optional[str] = None
+class InterviewRequest(BaseModel):
+    """Request model for generating the next interview question.
 
+    With a ``session_id`` the service keeps the conversation between calls.
+    A later request may then set ``base_version`` to the ``version`` of the
+    previous response and send only the turns added since, without
+    ``context``. A stale ``base_version`` is answered with 409, after which
+    the client resends the full context and history.
+    """
 
-class ConversationTurn(BaseModel):
-    """A single turn in the interview conversation."""
+    context: Optional[InterviewContext] = None
+    history: List[ConversationTurn] = Field(default_factory=list)
+    # Set to False to bypass the completion cache for this request
+    use_cache: bool = True
+    session_id: Optional[str] = None
+    base_version: Optional[int] = Field(default=None, ge=0)
 
-    role: str
-    message: str
+    @model_validator(mode="after")
+    def check_sync_mode(self) -> "InterviewRequest":
+        if self.base_version is None and self.context is None:
+            raise ValueError("context is required unless base_version is given")
+        if self.base_version is not None and self.session_id is None:
+            raise ValueError("base_version requires session_id")
+        return self
 
 
-class InterviewRequest(BaseModel):
-    """Request model for generating the next interview question."""
+class BatchQuestionRequest(BaseModel):
+    """Many question requests answered in one call."""
+
+    items: List[InterviewRequest] = Field(min_length=1)
 
-    context: InterviewContext
-    history: List[ConversationTurn] = Field(default_factory=list)
+
+class BatchTopicsRequest(BaseModel):
+    """Many contexts whose topics are inferred in one call."""
+
+    items: List[InterviewContext] = Field(min_length=1)
 
 
 class InterviewResponse(BaseModel):
     """Response model containing the generated question text."""
 
     question_text: str
+    # Conversation version to send as ``base_version`` next time
+    version: Optional[int] = None
 
 
 class TopicsResponse(BaseModel):
     """Response model containing inferred interview topics."""
 
     topics: List[str]
+
+
+class ConversationStatsResponse(BaseModel):
+    """Usage of the server-side conversation cache."""
+
+    sessions: int
+    hits: int
+    resyncs: int
+    mismatches: int
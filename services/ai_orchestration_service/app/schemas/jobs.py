@@ -0,0 +1,43 @@
+"""Pydantic models for pre-warmed job postings."""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from interview_core.schemas import InterviewContext
+
+
+class JobRegistrationRequest(BaseModel):
+    """Request model for registering a job posting ahead of interviews."""
+
+    job_description: str
+    # Use the caller's own identifier instead of a generated one
+    job_id: Optional[str] = None
+    # Number of opening questions to keep ready; defaults to the setting
+    pool_size: Optional[int] = Field(default=None, ge=1, le=20)
+
+
+class JobResponse(BaseModel):
+    """Response model describing a registered job posting."""
+
+    job_id: str
+    job_description: str
+    topics: List[str]
+    questions_ready: int
+    # Registered posting this one was matched to as a near-duplicate
+    duplicate_of: Optional[str] = None
+
+
+class JobStartRequest(BaseModel):
+    """Request model for starting an interview from a registered posting."""
+
+    candidate_resume: Optional[str] = None
+
+
+class JobStartResponse(BaseModel):
+    """Response model with everything needed to open an interview session."""
+
+    job_id: str
+    context: InterviewContext
+    topics: List[str]
+    question_text: str
@@ -0,0 +1,103 @@
+"""Pydantic models for LLM provider diagnostics."""
+
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+
+class PoolStats(BaseModel):
+    """Connection counts for a single provider client pool."""
+
+    connections: int
+    in_use: int
+    idle: int
+    waiting: int
+
+
+class PoolStatsResponse(BaseModel):
+    """Response model containing pool statistics keyed by provider."""
+
+    pools: Dict[str, PoolStats]
+
+
+class CacheStatsResponse(BaseModel):
+    """Response model containing completion cache counters."""
+
+    backend: str
+    enabled: bool
+    hits: int
+    misses: int
+    size: int
+
+
+class BatchStatsResponse(BaseModel):
+    """Response model containing local LLM micro-batching counters."""
+
+    enabled: bool
+    max_size: int
+    max_wait_ms: float
+    batches: int
+    items: int
+    mean_batch_size: float
+    waiting: int
+
+
+class QueueStats(BaseModel):
+    """Admission control counters for a single provider (times in seconds)."""
+
+    max_concurrency: int
+    max_queue: int
+    in_flight: int
+    queue_depth: int
+    peak_queue_depth: int
+    admitted: int
+    rejected: int
+    mean_wait: float
+    max_wait: float
+    estimated_wait: float
+    background_in_flight: int
+    background_queue_depth: int
+
+
+class QueueStatsResponse(BaseModel):
+    """Response model containing admission queue statistics keyed by provider."""
+
+    queues: Dict[str, QueueStats]
+
+
+class ProviderLatency(BaseModel):
+    """Rolling latency and error counts for a single provider."""
+
+    healthy: bool
+    requests: int
+    errors: int
+    samples: int
+    ewma_ms: Optional[float]
+    p50_ms: Optional[float]
+    p95_ms: Optional[float]
+    p99_ms: Optional[float]
+
+
+class RouteStatsResponse(BaseModel):
+    """Response model containing routing latency per provider, hedge and failover counts."""
+
+    providers: Dict[str, ProviderLatency]
+    hedges: int
+    hedge_wins: int
+    failovers: int
+
+
+class BreakerStats(BaseModel):
+    """Circuit breaker state for a single provider."""
+
+    state: str
+    failures: int
+    rejected: int
+    retry_in: float
+    transitions: Dict[str, int]
+
+
+class BreakerStatsResponse(BaseModel):
+    """Response model containing circuit breaker state keyed by provider."""
+
+    breakers: Dict[str, BreakerStats]
@@ -0,0 +1,112 @@
+"""Server-side conversation state for incremental question requests."""
+
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from core.config import settings
+from schemas.interview import ConversationTurn, InterviewContext
+
+
+class ConversationOutOfSync(Exception):
+    """Raised when a delta request does not match the cached conversation."""
+
+    def __init__(self, session_id: str, version: Optional[int]) -> None:
+        super().__init__(f"Conversation '{session_id}' is not at the requested version")
+        self.session_id = session_id
+        self.version = version
+
+
+class Conversation:
+    """Context and turns of one interview as last seen by this service."""
+
+    def __init__(
+        self, context: InterviewContext, turns: List[ConversationTurn], ttl: float
+    ) -> None:
+        self.context = context
+        self.turns = turns
+        self.expires_at = time.monotonic() + ttl
+
+    @property
+    def version(self) -> int:
+        return len(self.turns)
+
+
+class ConversationCache:
+    """Keep each session's conversation so clients only send new turns.
+
+    The version of a conversation is the number of turns it holds. A client
+    that knows the version sends just the turns added since; if the cached
+    conversation is missing, expired or at another version, the request is
+    rejected with ``ConversationOutOfSync`` and the client resends the full
+    context and history. Conversations are evicted least recently used first
+    and are local to the worker, so a request landing on another worker
+    costs one resync.
+    """
+
+    def __init__(self, max_sessions: int, ttl: float) -> None:
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._conversations: "OrderedDict[str, Conversation]" = OrderedDict()
+        self.hits = 0
+        self.resyncs = 0
+        self.mismatches = 0
+
+    def resolve(
+        self,
+        session_id: str,
+        base_version: Optional[int],
+        context: Optional[InterviewContext],
+        turns: List[ConversationTurn],
+    ) -> Tuple[InterviewContext, List[ConversationTurn]]:
+        """Return the full context and history for a request.
+
+        With ``base_version`` set, ``turns`` are appended to the cached
+        conversation; otherwise ``context`` and ``turns`` replace it.
+        Nothing is stored until ``commit``.
+        """
+
+        if base_version is None:
+            self.resyncs += 1
+            return context, list(turns)
+        conversation = self._get(session_id)
+        if conversation is None or conversation.version != base_version:
+            self.mismatches += 1
+            version = conversation.version if conversation is not None else None
+            raise ConversationOutOfSync(session_id, version)
+        self.hits += 1
+        return conversation.context, conversation.turns + list(turns)
+
+    def commit(
+        self, session_id: str, context: InterviewContext, turns: List[ConversationTurn]
+    ) -> int:
+        """Store the conversation after a successful turn and return its version."""
+
+        self._conversations[session_id] = Conversation(context, turns, self.ttl)
+        self._conversations.move_to_end(session_id)
+        while len(self._conversations) > self.max_sessions:
+            self._conversations.popitem(last=False)
+        return len(turns)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "sessions": len(self._conversations),
+            "hits": self.hits,
+            "resyncs": self.resyncs,
+            "mismatches": self.mismatches,
+        }
+
+    def _get(self, session_id: str) -> Optional[Conversation]:
+        conversation = self._conversations.get(session_id)
+        if conversation is None:
+            return None
+        if conversation.expires_at < time.monotonic():
+            del self._conversations[session_id]
+            return None
+        self._conversations.move_to_end(session_id)
+        return conversation
+
+
+conversation_cache = ConversationCache(
+    settings.conversation_cache_max_sessions, settings.conversation_cache_ttl
+)
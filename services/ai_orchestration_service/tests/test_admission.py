@@ -0,0 +1,161 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from interview_core import admission
+from interview_core.admission import AdmissionControl, AdmissionLimiter, ProviderSaturated
+from interview_core.config import settings
+from interview_core.llm_service import provider_clients
+
+from main import app
+
+
+async def hold(limiter, started, release):
+    async with limiter.slot():
+        started.append(True)
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_limiter_queues_in_order_and_rejects_when_full():
+    limiter = AdmissionLimiter("local", max_concurrency=1, max_queue=2)
+    started, release = [], asyncio.Event()
+    positions = []
+
+    async def on_queued(position, estimated_wait):
+        positions.append(position)
+
+    admission.queue_listener.set(on_queued)
+    tasks = [asyncio.create_task(hold(limiter, started, release)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+
+    assert len(started) == 1
+    assert limiter.queue_depth == 2 and limiter.saturated()
+    assert positions == [1, 2]
+    with pytest.raises(ProviderSaturated):
+        async with limiter.slot():
+            pass
+
+    release.set()
+    await asyncio.gather(*tasks)
+    stats = limiter.stats()
+    assert (stats["in_flight"], stats["queue_depth"]) == (0, 0)
+    assert (stats["admitted"], stats["rejected"], stats["peak_queue_depth"]) == (3, 1, 2)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue():
+    limiter = AdmissionLimiter("local", max_concurrency=1, max_queue=4)
+    started, release = [], asyncio.Event()
+    holder = asyncio.create_task(hold(limiter, started, release))
+    waiter = asyncio.create_task(hold(limiter, started, release))
+    await asyncio.sleep(0.01)
+
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    assert limiter.queue_depth == 0
+
+    release.set()
+    await holder
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_background_calls_yield_slots_to_live_calls():
+    limiter = AdmissionLimiter("local", max_concurrency=2, max_queue=4, max_background=1)
+    order, release = [], asyncio.Event()
+
+    async def run(name, background):
+        async with limiter.slot(background):
+            order.append(name)
+            await release.wait()
+
+    summary = asyncio.create_task(run("summary", True))
+    await asyncio.sleep(0.01)
+    # The background cap keeps the second summary waiting with a slot free
+    blocked = asyncio.create_task(run("blocked summary", True))
+    live = asyncio.create_task(run("live", False))
+    await asyncio.sleep(0.01)
+    assert order == ["summary", "live"]
+    assert limiter.stats()["background_queue_depth"] == 1
+
+    release.set()
+    await asyncio.gather(summary, blocked, live)
+    assert order[-1] == "blocked summary"
+    assert (limiter.in_flight, limiter.background_in_flight) == (0, 0)
+
+    # A freed slot goes to a waiting live call before an older summary
+    limiter.max_concurrency, order = 1, []
+    release.clear()
+    holder = asyncio.create_task(run("holder", False))
+    await asyncio.sleep(0.01)
+    queued = [asyncio.create_task(run("summary", True))]
+    await asyncio.sleep(0.01)
+    queued.append(asyncio.create_task(run("live", False)))
+    await asyncio.sleep(0.01)
+    release.set()
+    await asyncio.gather(holder, *queued)
+    assert order == ["holder", "live", "summary"]
+
+
+@pytest.mark.asyncio
+async def test_saturated_provider_returns_503(monkeypatch):
+    control = AdmissionControl()
+    limiter = control.limiter("openai")
+    limiter.max_concurrency, limiter.max_queue = 1, 0
+    limiter.in_flight = 1
+    monkeypatch.setattr(settings, "llm_provider", "openai")
+    monkeypatch.setattr("interview_core.llm_service.admission_control", control)
+    monkeypatch.setattr("api.v1.endpoints.interview.admission_control", control)
+
+    payload = {"context": {"job_description": "Backend developer"}, "history": []}
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.post("/api/v1/interview/generate-question", json=payload)
+        streamed = await ac.post("/api/v1/interview/generate-question/stream", json=payload)
+
+    assert response.status_code == streamed.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_queue_position(monkeypatch):
+    control = AdmissionControl()
+    limiter = control.limiter("openai")
+    limiter.max_concurrency, limiter.max_queue = 1, 4
+    monkeypatch.setattr(settings, "llm_provider", "openai")
+    monkeypatch.setattr("interview_core.llm_service.admission_control", control)
+    monkeypatch.setattr("api.v1.endpoints.interview.admission_control", control)
+
+    release = asyncio.Event()
+    started = []
+    holder = asyncio.create_task(hold(limiter, started, release))
+    await asyncio.sleep(0)
+
+    def handler(request):
+        body = f'data: {json.dumps({"choices": [{"delta": {"content": "Why?"}}]})}\n\n'
+        return httpx.Response(200, text=body, headers={"Content-Type": "text/event-stream"})
+
+    await provider_clients.aclose()
+    provider_clients._clients["openai"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    asyncio.get_running_loop().call_later(0.05, release.set)
+    payload = {"context": {"job_description": "Backend developer"}, "history": []}
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            response = await ac.post("/api/v1/interview/generate-question/stream", json=payload)
+    finally:
+        await provider_clients.aclose()
+        await holder
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines == [
+        {"queued": {"position": 1, "estimated_wait": 0.0}},
+        {"delta": "Why?"},
+    ]
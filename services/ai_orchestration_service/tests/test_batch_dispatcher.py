@@ -0,0 +1,91 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from interview_core import llm_service
+from interview_core.batch_dispatcher import BatchDispatcher
+from interview_core.config import settings
+from interview_core.schemas import InterviewContext
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_without_waiting():
+    batches = []
+
+    async def send(items):
+        batches.append(items)
+        return [item * 10 for item in items]
+
+    dispatcher = BatchDispatcher(send, max_size=3, max_wait=60)
+    results = await asyncio.wait_for(
+        asyncio.gather(*(dispatcher.submit(i) for i in range(3))), timeout=1
+    )
+
+    assert results == [0, 10, 20]
+    assert batches == [[0, 1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_is_sent_after_max_wait():
+    batches = []
+
+    async def send(items):
+        batches.append(items)
+        return items
+
+    dispatcher = BatchDispatcher(send, max_size=8, max_wait=0.01)
+    results = await asyncio.gather(*(dispatcher.submit(i) for i in range(5)))
+    results.append(await dispatcher.submit(5))
+
+    assert results == [0, 1, 2, 3, 4, 5]
+    assert batches == [[0, 1, 2, 3, 4], [5]]
+    assert dispatcher.stats()["mean_batch_size"] == 3.0
+
+
+@pytest.mark.asyncio
+async def test_item_failures_reach_only_their_caller():
+    async def send(items):
+        return [ValueError("bad") if item == "b" else item for item in items]
+
+    dispatcher = BatchDispatcher(send, max_size=2, max_wait=0.01)
+    results = await asyncio.gather(
+        dispatcher.submit("a"), dispatcher.submit("b"), return_exceptions=True
+    )
+
+    assert results[0] == "a"
+    assert isinstance(results[1], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_local_requests_are_batched(monkeypatch):
+    payloads = []
+
+    async def fake_post(self, url, headers=None, json=None):
+        payloads.append(json)
+        content = f"Batch of {len(json)}" if isinstance(json, list) else "?"
+        body = [{"choices": [{"message": {"content": f"{content} #{i}"}}]} for i in range(len(json))]
+        return httpx.Response(200, json=body, request=httpx.Request("POST", url))
+
+    dispatcher = BatchDispatcher(llm_service._send_local_batch, max_size=4, max_wait=0.05)
+    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+    monkeypatch.setattr(settings, "llm_provider", "local")
+    monkeypatch.setattr(settings, "llm_batch_enabled", True)
+    monkeypatch.setattr(settings, "local_llm_batch_url", "http://llm/v1/batch")
+    monkeypatch.setattr(llm_service, "local_batcher", dispatcher)
+
+    contexts = [InterviewContext(job_description=f"Role {i}") for i in range(3)]
+    questions = await asyncio.gather(
+        *(llm_service.generate_next_question(c, [], use_cache=False) for c in contexts)
+    )
+
+    assert questions == ["Batch of 3 #0", "Batch of 3 #1", "Batch of 3 #2"]
+    assert len(payloads) == 1
+    assert [p["messages"][0]["content"] for p in payloads[0]] == [
+        llm_service.build_messages(c, [])[0]["content"] for c in contexts
+    ]
@@ -0,0 +1,111 @@
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from interview_core import llm_service
+from interview_core.completion_cache import (
+    MemoryCompletionCache,
+    SQLiteCompletionCache,
+    completion_key,
+)
+from interview_core.config import settings
+from interview_core.schemas import InterviewContext
+
+
+def test_completion_key_is_stable():
+    messages = [{"role": "system", "content": "x"}]
+    assert completion_key("openai", "gpt", messages) == completion_key(
+        "openai", "gpt", [{"content": "x", "role": "system"}]
+    )
+    assert completion_key("openai", "gpt", messages) != completion_key(
+        "local", "gpt", messages
+    )
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCompletionCache(max_entries=2, ttl=60)
+    await cache.set("a", "A")
+    await cache.set("b", "B")
+    assert await cache.get("a") == "A"
+    await cache.set("c", "C")
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == "A"
+    stats = await cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_expires_entries():
+    cache = MemoryCompletionCache(max_entries=2, ttl=-1)
+    await cache.set("a", "A")
+    assert await cache.get("a") is None
+    assert await cache.size() == 0
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_persists_and_evicts(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = SQLiteCompletionCache(path, max_entries=2, ttl=60)
+    await cache.set("a", "A")
+    await cache.set("b", "B")
+    await cache.get("a")
+    await cache.set("c", "C")
+    await cache.aclose()
+
+    reopened = SQLiteCompletionCache(path, max_entries=2, ttl=60)
+    assert await reopened.get("a") == "A"
+    assert await reopened.get("b") is None
+    assert await reopened.size() == 2
+    assert (await reopened.stats())["size"] == 2
+    await reopened.aclose()
+
+
+@pytest.mark.asyncio
+async def test_generate_next_question_uses_cache(monkeypatch):
+    calls = []
+
+    async def fake_post(self, url, headers=None, json=None):
+        calls.append(json)
+        return httpx.Response(
+            200,
+            json={"choices": [{"message": {"content": f"Question {len(calls)}?"}}]},
+            request=httpx.Request("POST", url),
+        )
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+    monkeypatch.setattr(settings, "llm_provider", "openai")
+    monkeypatch.setattr(llm_service, "completion_cache", MemoryCompletionCache(8, 60))
+    context = InterviewContext(job_description="Backend developer")
+
+    first = await llm_service.generate_next_question(context, [])
+    second = await llm_service.generate_next_question(context, [])
+    bypassed = await llm_service.generate_next_question(context, [], use_cache=False)
+
+    assert first == second == "Question 1?"
+    assert bypassed == "Question 2?"
+    assert len(calls) == 2
+
+
+def test_lifespan_closes_completion_cache(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    import main
+
+    closed = []
+
+    class ClosingCache(MemoryCompletionCache):
+        async def aclose(self):
+            closed.append(True)
+
+    monkeypatch.setattr("interview_core.engine.completion_cache", ClosingCache(8, 60))
+    with TestClient(main.app):
+        assert closed == []
+    assert closed == [True]
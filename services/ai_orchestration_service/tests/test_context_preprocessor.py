@@ -0,0 +1,125 @@
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from interview_core.config import settings
+from interview_core.context_preprocessor import compact_text, estimate_tokens
+from interview_core.llm_service import provider_clients
+
+from main import app
+
+POSTING = """About Us:
+Acme has built   widgets since 1890.
+
+Senior Backend Engineer (Berlin)
+
+Responsibilities:
+ * Design and build payment APIs
+ * Own reliability of the ledger
+ * Design and build payment APIs
+
+Requirements:
+- 5+ years of Python
+- Kafka and PostgreSQL
+- 5+ years of Python.
+
+Benefits:
+- 30 days of vacation
+- Free lunch
+
+We are an equal opportunity employer.
+"""
+
+
+def test_compaction_drops_boilerplate_and_repeated_bullets():
+    compact = compact_text(POSTING)
+
+    assert compact.splitlines() == [
+        "Senior Backend Engineer (Berlin)",
+        "Responsibilities:",
+        "- Design and build payment APIs",
+        "- Own reliability of the ledger",
+        "Requirements:",
+        "- 5+ years of Python",
+        "- Kafka and PostgreSQL",
+    ]
+    assert compact_text(compact) == compact
+
+
+def test_budget_keeps_requirements_first():
+    compact = compact_text(POSTING, 25)
+
+    assert compact.startswith("Requirements:")
+    assert "Responsibilities" not in compact
+    assert estimate_tokens(compact) <= 25
+    assert compact_text(compact, 25) == compact
+    assert compact_text(POSTING, 3) == "- 5+"
+
+
+@pytest.mark.asyncio
+async def test_session_prompt_uses_compacted_context(monkeypatch):
+    prompts = []
+
+    def handler(request):
+        prompts.append(json.loads(request.content)["messages"][0]["content"])
+        return httpx.Response(200, json={"choices": [{"message": {"content": "Why?"}}]})
+
+    monkeypatch.setattr(settings, "llm_provider", "openai")
+    monkeypatch.setattr(settings, "llm_providers", "")
+    await provider_clients.aclose()
+    provider_clients._clients["openai"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    first = {"session_id": "compact", "context": {"job_description": POSTING}, "history": []}
+    delta = {
+        "session_id": "compact",
+        "base_version": 1,
+        "history": [{"role": "candidate", "message": "Hi"}],
+    }
+    url = "/api/v1/interview/generate-question"
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            await ac.post(url, json={**first, "use_cache": False})
+            await ac.post(url, json={**delta, "use_cache": False})
+    finally:
+        await provider_clients.aclose()
+
+    assert len(prompts) == 2
+    assert all("Own reliability of the ledger" in prompt for prompt in prompts)
+    assert not any("vacation" in prompt or "equal opportunity" in prompt for prompt in prompts)
+
+
+def test_all_caps_skills_are_content_not_headings():
+    resume = "SKILLS\nPYTHON\nSQL\nAWS\n\nEXPERIENCE\nBuilt ETL jobs at Acme\n\nBENEFITS\nGym\n"
+
+    assert compact_text(resume).splitlines() == [
+        "SKILLS:",
+        "PYTHON",
+        "SQL",
+        "AWS",
+        "EXPERIENCE:",
+        "Built ETL jobs at Acme",
+    ]
+
+
+def test_mixed_case_section_names_are_headings_without_a_colon():
+    posting = (
+        "Responsibilities\n- Run the on-call rotation\n\n"
+        "Experience with Kafka\n\n"
+        "Requirements\n- Go and gRPC\n\n"
+        "About Us\nWe sell shoes\n"
+    )
+
+    assert compact_text(posting).splitlines() == [
+        "Responsibilities:",
+        "- Run the on-call rotation",
+        "Experience with Kafka",
+        "Requirements:",
+        "- Go and gRPC",
+    ]
+    assert compact_text(posting, 8) == "Requirements:\n- Go and gRPC"
@@ -0,0 +1,67 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from interview_core.config import settings
+from interview_core.context_window import ContextWindow, estimate_tokens, message_tokens
+
+
+def conversation(turns):
+    messages = [{"role": "system", "content": "You are an AI technical interviewer."}]
+    for i in range(turns):
+        role = "assistant" if i % 2 == 0 else "user"
+        messages.append({"role": role, "content": f"Turn {i} " + "detail " * 40})
+    return messages
+
+
+def test_estimate_tokens_counts_words_and_symbols():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("Hi, there!") == 5
+    assert estimate_tokens("internationalization") == 5
+
+
+def test_short_history_is_untouched(monkeypatch):
+    monkeypatch.setattr(settings, "llm_context_token_budget", 3000)
+    window = ContextWindow(None)
+    messages = conversation(4)
+    assert window.fit(messages) is messages
+
+
+@pytest.mark.asyncio
+async def test_long_history_is_bounded_and_summarized(monkeypatch):
+    monkeypatch.setattr(settings, "llm_context_token_budget", 300)
+    monkeypatch.setattr(settings, "llm_context_recent_turns", 2)
+    calls = []
+
+    async def summarize(previous, turns):
+        calls.append((previous, [int(t["content"].split()[1]) for t in turns]))
+        return f"covered {len(turns)} turns"
+
+    window = ContextWindow(summarize)
+
+    first = window.fit(conversation(20))
+    assert sum(message_tokens(m) for m in first) <= 300
+    assert first[-2:] == conversation(20)[-2:]
+    await asyncio.sleep(0)
+    assert calls == [(None, list(range(18)))]
+
+    second = window.fit(conversation(22))
+    await asyncio.sleep(0)
+    assert "Summary of the earlier conversation: covered 18 turns" in second[0]["content"]
+    assert sum(message_tokens(m) for m in second) <= 300
+    # Only the turns added since the last summary are folded in.
+    assert calls[-1] == ("covered 18 turns", [18, 19])
+    await window.aclose()
+
+
+@pytest.mark.asyncio
+async def test_zero_budget_disables_window(monkeypatch):
+    monkeypatch.setattr(settings, "llm_context_token_budget", 0)
+    window = ContextWindow(None)
+    messages = conversation(50)
+    assert window.fit(messages) is messages
@@ -1,3 +1,5 @@
+import asyncio
+import json
 import sys
 from pathlib import Path
 
@@ -6,8 +8,12 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 
 sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.append(str(Path(__file__).resolve().parents[2]))
 
-from core.config import settings
+from interview_core.config import settings
+from interview_core.llm_service import provider_clients
+
+from core.config import settings as api_settings
 from main import app
 
 
@@ -67,3 +73,128 @@ async def test_determine_topics():
 
     assert response.status_code == 200
     assert response.json() == {"topics": ["python", "database"]}
+
+
+@pytest.mark.asyncio
+async def test_generate_question_stream():
+    captured = {}
+
+    def handler(request):
+        captured["payload"] = json.loads(request.content)
+        chunks = ["What ", "is ", "asyncio?"]
+        body = "".join(
+            f'data: {json.dumps({"choices": [{"delta": {"content": c}}]})}\n\n'
+            for c in chunks
+        )
+        body += "data: [DONE]\n\n"
+        return httpx.Response(
+            200, text=body, headers={"Content-Type": "text/event-stream"}
+        )
+
+    settings.llm_provider = "openai"
+    await provider_clients.aclose()
+    provider_clients._clients["openai"] = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+
+    payload = {
+        "context": {"job_description": "Backend developer"},
+        "history": [{"role": "candidate", "message": "Hi"}],
+    }
+
+    try:
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as ac:
+            response = await ac.post(
+                "/api/v1/interview/generate-question/stream", json=payload
+            )
+    finally:
+        await provider_clients.aclose()
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines == [{"delta": "What "}, {"delta": "is "}, {"delta": "asyncio?"}]
+    assert captured["payload"]["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_incremental_history_uses_cached_conversation(monkeypatch):
+    prompts = []
+    questions = iter(["First?", "Second?"])
+
+    def handler(request):
+        prompts.append(json.loads(request.content)["messages"])
+        return httpx.Response(200, json={"choices": [{"message": {"content": next(questions)}}]})
+
+    monkeypatch.setattr(settings, "llm_provider", "openai")
+    monkeypatch.setattr(settings, "llm_providers", "")
+    await provider_clients.aclose()
+    provider_clients._clients["openai"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    full = {
+        "session_id": "incremental",
+        "context": {"job_description": "Backend developer"},
+        "history": [{"role": "candidate", "message": "Hi"}],
+    }
+    delta = {
+        "session_id": "incremental",
+        "base_version": 2,
+        "history": [{"role": "candidate", "message": "I use asyncio daily"}],
+    }
+    url = "/api/v1/interview/generate-question"
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            first = await ac.post(url, json=full)
+            second = await ac.post(url, json=delta)
+            stale = await ac.post(url, json=delta)
+            unknown = await ac.post(url, json={**delta, "session_id": "unknown"})
+            missing_context = await ac.post(url, json={"session_id": "x", "history": []})
+    finally:
+        await provider_clients.aclose()
+
+    assert first.json() == {"question_text": "First?", "version": 2}
+    assert second.json() == {"question_text": "Second?", "version": 4}
+    prompt = json.dumps(prompts[1])
+    assert "Backend developer" in prompt and "First?" in prompt and "I use asyncio daily" in prompt
+    assert stale.status_code == 409 and stale.json()["version"] == 4
+    assert unknown.status_code == 409 and unknown.json()["version"] is None
+    assert missing_context.status_code == 422
+    assert len(prompts) == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_generate_question_bounds_concurrency(monkeypatch):
+    in_flight = peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"choices": [{"message": {"content": "Why?"}}]})
+
+    monkeypatch.setattr(settings, "llm_provider", "openai")
+    monkeypatch.setattr(settings, "llm_providers", "")
+    monkeypatch.setattr(api_settings, "batch_concurrency", 3)
+    await provider_clients.aclose()
+    provider_clients._clients["openai"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    items = [
+        {"context": {"job_description": f"Backend developer {i}"}, "use_cache": False}
+        for i in range(10)
+    ]
+    items.append({"session_id": "batch-stale", "base_version": 3, "history": []})
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            response = await ac.post(
+                "/api/v1/interview/generate-question/batch", json={"items": items}
+            )
+    finally:
+        await provider_clients.aclose()
+
+    assert response.status_code == 200
+    results = {line["index"]: line for line in map(json.loads, response.text.splitlines())}
+    assert sorted(results) == list(range(11))
+    assert all(results[i] == {"index": i, "question_text": "Why?"} for i in range(10))
+    assert results[10]["error"]["type"] == "ConversationOutOfSync"
+    assert peak == 3
@@ -0,0 +1,164 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from interview_core import job_registry as registry_module
+from interview_core.job_registry import job_registry
+
+from main import app
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    calls = []
+
+    async def fake_question(context, history, use_cache=True):
+        calls.append((context, history, use_cache))
+        return f"Opener {len(calls)}?"
+
+    monkeypatch.setattr(registry_module, "generate_next_question", fake_question)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_register_job_prewarms_topics_and_questions(fake_llm):
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        response = await ac.post(
+            "/api/v1/interview/jobs",
+            json={
+                "job_id": "job-1",
+                "job_description": "  Python   backend\n developer ",
+                "pool_size": 2,
+            },
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "job_id": "job-1",
+        "job_description": "Python backend developer",
+        "topics": ["python", "backend"],
+        "questions_ready": 2,
+    }
+    assert len(fake_llm) == 2
+    assert all(use_cache is False for _, history, use_cache in fake_llm)
+
+
+@pytest.mark.asyncio
+async def test_start_serves_pooled_question_and_refills(fake_llm):
+    await job_registry.register("Python developer", job_id="job-2", pool_size=2)
+    assert len(fake_llm) == 2
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        response = await ac.post("/api/v1/interview/jobs/job-2/start", json={})
+        assert response.json() == {
+            "job_id": "job-2",
+            "context": {"job_description": "Python developer", "candidate_resume": None},
+            "topics": ["python"],
+            "question_text": "Opener 1?",
+        }
+        # The pool is refilled in the background after being consumed.
+        await asyncio.sleep(0.05)
+        job = await ac.get("/api/v1/interview/jobs/job-2")
+
+    assert job.json()["questions_ready"] == 2
+    assert len(fake_llm) == 3
+    await job_registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_start_unknown_job_returns_404():
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
+        response = await ac.post("/api/v1/interview/jobs/missing/start", json={})
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_near_duplicate_postings_share_topics_and_openers(fake_llm):
+    posting = (
+        "Senior backend engineer in {} building payment services with Python, Kafka and "
+        "PostgreSQL on AWS. You will design APIs, mentor engineers and own reliability "
+        "of services that move money for millions of customers every day. We run "
+        "Kubernetes on AWS, deploy many times a day and expect every engineer to write "
+        "tests, review code, join the on-call rotation and improve our observability."
+    )
+    original = await job_registry.register(posting.format("Berlin"), job_id="pay-berlin")
+    calls = len(fake_llm)
+    twin = await job_registry.register(posting.format("Munich"), job_id="pay-munich")
+
+    assert len(fake_llm) == calls
+    assert twin.duplicate_of is original and twin.topics == original.topics
+    assert job_registry.find_similar("Frontend developer with React") is None
+
+    payload = {"context": {"job_description": posting.format("Hamburg")}, "history": []}
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        job = await ac.get("/api/v1/interview/jobs/pay-munich")
+        topics = await ac.post(
+            "/api/v1/interview/determine-topics", json=payload["context"]
+        )
+        opener = await ac.post("/api/v1/interview/generate-question", json=payload)
+        batch_topics = await ac.post(
+            "/api/v1/interview/determine-topics/batch", json={"items": [payload["context"]]}
+        )
+        batch_opener = await ac.post(
+            "/api/v1/interview/generate-question/batch", json={"items": [payload]}
+        )
+
+    assert job.json()["duplicate_of"] == "pay-berlin"
+    assert topics.json() == {"topics": original.topics}
+    assert opener.json()["question_text"].startswith("Opener")
+    # Batched items are answered as the single-item endpoints answer them
+    assert json.loads(batch_topics.text) == {"index": 0, "topics": original.topics}
+    assert json.loads(batch_opener.text)["question_text"].startswith("Opener")
+
+
+@pytest.mark.asyncio
+async def test_reregistering_a_job_replaces_its_indexed_text(fake_llm):
+    posting = (
+        "Site reliability engineer running Kubernetes clusters on GCP, writing Terraform "
+        "modules, tuning Prometheus alerts and leading incident reviews across teams."
+    )
+    await job_registry.register(posting, job_id="sre")
+    await job_registry.register(posting, job_id="sre")
+    assert job_registry.find_similar(posting).job_id == "sre"
+
+    await job_registry.register("Android developer shipping Kotlin apps", job_id="sre")
+    assert job_registry.find_similar(posting) is None
+    await job_registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_reregistering_an_original_rematches_its_duplicates(fake_llm):
+    posting = (
+        "Data engineer in {} building streaming pipelines with Spark, Flink and Kafka, "
+        "modelling warehouse tables in dbt, owning data quality checks and on-call for "
+        "the ingestion platform that feeds every analytics dashboard in the company."
+    )
+    await job_registry.register(posting.format("Oslo"), job_id="data-oslo")
+    twin = await job_registry.register(posting.format("Bergen"), job_id="data-bergen")
+    orphan = await job_registry.register(posting.format("Tromso"), job_id="data-tromso")
+
+    replaced = await job_registry.register(posting.format("Oslo"), job_id="data-oslo")
+    rematched = job_registry.get("data-bergen")
+    assert rematched is not twin and rematched.duplicate_of is replaced
+    assert rematched.questions is replaced.questions
+
+    await job_registry.register("iOS developer shipping Swift apps", job_id="data-oslo")
+    standalone = job_registry.get("data-bergen")
+    assert standalone.duplicate_of is None and standalone.questions
+    assert job_registry.get("data-tromso").duplicate_of is standalone
+    assert orphan.duplicate_of is not standalone
+    await job_registry.aclose()
@@ -5,10 +5,11 @@ import httpx
 import pytest
 
 sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.append(str(Path(__file__).resolve().parents[2]))
 
-from core.config import settings
-from schemas.interview import InterviewContext, ConversationTurn
-from services.llm_service import generate_next_question
+from interview_core.config import settings
+from interview_core.llm_service import generate_next_question, provider_clients
+from interview_core.schemas import InterviewContext, ConversationTurn
 
 
 @pytest.mark.asyncio
@@ -28,6 +29,9 @@ async def test_generate_next_question_uses_configured_timeout(monkeypatch):
         async def __aexit__(self, exc_type, exc, tb):
             pass
 
+        async def aclose(self):
+            pass
+
         async def post(self, url, headers=None, json=None):
             return httpx.Response(
                 200,
@@ -35,11 +39,15 @@ async def test_generate_next_question_uses_configured_timeout(monkeypatch):
                 request=httpx.Request("POST", url),
             )
 
+    await provider_clients.aclose()
     monkeypatch.setattr(httpx, "AsyncClient", DummyClient)
 
-    await generate_next_question(
-        InterviewContext(job_description="Backend developer"),
-        [ConversationTurn(role="candidate", message="Hi")],
-    )
+    try:
+        await generate_next_question(
+            InterviewContext(job_description="Backend developer"),
+            [ConversationTurn(role="candidate", message="Hi")],
+        )
+    finally:
+        await provider_clients.aclose()
 
     assert captured["timeout"] == settings.llm_timeout
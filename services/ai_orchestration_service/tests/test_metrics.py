@@ -0,0 +1,60 @@
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from interview_core.config import settings
+from interview_core.llm_service import provider_clients
+from interview_core.metrics import Registry
+
+from main import app
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = Registry()
+    latency = registry.histogram("hop_seconds", "Hop latency.", ("hop",), buckets=(0.1, 1.0))
+    errors = registry.counter("hop_errors", "Hop errors.", ("error",))
+    latency.observe(0.05, "llm")
+    latency.observe(0.5, "llm")
+    latency.observe(5, "llm")
+    errors.inc("ReadTimeout")
+
+    lines = registry.render().splitlines()
+    assert 'hop_seconds_bucket{hop="llm",le="0.1"} 1' in lines
+    assert 'hop_seconds_bucket{hop="llm",le="1"} 2' in lines
+    assert 'hop_seconds_bucket{hop="llm",le="+Inf"} 3' in lines
+    assert 'hop_seconds_count{hop="llm"} 3' in lines
+    assert 'hop_seconds_sum{hop="llm"} 5.55' in lines
+    assert 'hop_errors_total{error="ReadTimeout"} 1' in lines
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_exposes_llm_histograms(monkeypatch):
+    def handler(request):
+        return httpx.Response(200, json={"choices": [{"message": {"content": "Why?"}}]})
+
+    monkeypatch.setattr(settings, "llm_provider", "openai")
+    monkeypatch.setattr(settings, "llm_providers", "")
+    await provider_clients.aclose()
+    provider_clients._clients["openai"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    payload = {"context": {"job_description": "Backend developer"}, "history": []}
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            await ac.post(
+                "/api/v1/interview/generate-question", json={**payload, "use_cache": False}
+            )
+            response = await ac.get("/metrics")
+    finally:
+        await provider_clients.aclose()
+
+    assert response.status_code == 200
+    text = response.text
+    model = settings.openai_model
+    assert f'llm_request_duration_seconds_count{{provider="openai",model="{model}"}}' in text
+    assert 'llm_queue_wait_seconds_count{provider="openai"}' in text
+    assert 'route="/api/v1/interview/generate-question",status="200"' in text
@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from interview_core import near_duplicates
+from interview_core.near_duplicates import NearDuplicateIndex
+
+POSTING = (
+    "Data engineer in {} maintaining Spark pipelines on AWS, modelling warehouse "
+    "tables in dbt and Snowflake, and owning the quality of the data that product "
+    "analytics and finance teams rely on for their daily reporting."
+)
+
+
+def test_signatures_are_memoized_by_text(monkeypatch):
+    index: NearDuplicateIndex[str] = NearDuplicateIndex()
+    first = index.signature(POSTING.format("Lisbon"))
+    calls = []
+    monkeypatch.setattr(near_duplicates, "shingles", lambda text: calls.append(text) or {text})
+
+    assert index.signature(POSTING.format("Lisbon")) == first
+    assert calls == []
+
+
+def test_adding_a_key_again_replaces_its_text():
+    index: NearDuplicateIndex[str] = NearDuplicateIndex()
+    index.add("job", POSTING.format("Lisbon"))
+    index.add("job", POSTING.format("Lisbon"))
+    index.add("job", "Frontend developer writing React and TypeScript")
+
+    assert len(index) == 1
+    assert index.query(POSTING.format("Porto"), 0.5) is None
+    assert index.query("Frontend developer writing React and TypeScript", 0.9)[0] == "job"
+    assert all(keys == ["job"] for bucket in index._buckets for keys in bucket.values())
+
+    index.remove("job")
+    assert len(index) == 0
+    assert not any(index._buckets)
@@ -0,0 +1,101 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from interview_core.config import settings
+from interview_core.llm_service import generate_next_question, provider_clients
+from interview_core.provider_clients import ProviderClients
+from interview_core.schemas import InterviewContext
+
+
+@pytest.mark.asyncio
+async def test_client_is_reused_across_calls(monkeypatch):
+    settings.llm_provider = "openai"
+    created = []
+
+    class DummyClient:
+        def __init__(self, *args, **kwargs):
+            created.append(kwargs)
+
+        async def post(self, url, headers=None, json=None):
+            return httpx.Response(
+                200,
+                json={"choices": [{"message": {"content": "Next?"}}]},
+                request=httpx.Request("POST", url),
+            )
+
+        async def aclose(self):
+            pass
+
+    await provider_clients.aclose()
+    monkeypatch.setattr(httpx, "AsyncClient", DummyClient)
+
+    try:
+        for _ in range(3):
+            await generate_next_question(
+                InterviewContext(job_description="Backend developer"), []
+            )
+    finally:
+        await provider_clients.aclose()
+
+    assert len(created) == 1
+    assert created[0]["limits"].max_connections == settings.llm_max_connections
+
+
+@pytest.mark.asyncio
+async def test_http2_falls_back_without_h2(monkeypatch):
+    monkeypatch.setattr(settings, "llm_http2", True)
+    monkeypatch.setitem(sys.modules, "h2", None)
+
+    clients = ProviderClients(settings)
+    client = clients.get("local")
+    try:
+        assert clients.stats() == {
+            "local": {"connections": 0, "in_use": 0, "idle": 0, "waiting": 0}
+        }
+    finally:
+        await clients.aclose()
+
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_track_a_real_connection_pool(monkeypatch):
+    # Guards the httpx/httpcore internals ``_pool_stats`` reads
+    monkeypatch.setattr(settings, "llm_http2", False)
+    monkeypatch.setattr(settings, "llm_max_connections", 1)
+    reply = asyncio.Event()
+
+    async def serve(reader, writer):
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                await reply.wait()
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+    server = await asyncio.start_server(serve, "127.0.0.1", 0)
+    url = "http://127.0.0.1:%d/" % server.sockets[0].getsockname()[1]
+    clients = ProviderClients(settings)
+    client = clients.get("local")
+    try:
+        requests = [asyncio.create_task(client.get(url)) for _ in range(2)]
+        await asyncio.sleep(0.1)
+        assert clients.stats()["local"] == {
+            "connections": 1, "in_use": 1, "idle": 0, "waiting": 1
+        }
+        reply.set()
+        await asyncio.gather(*requests)
+        assert clients.stats()["local"] == {
+            "connections": 1, "in_use": 0, "idle": 1, "waiting": 0
+        }
+    finally:
+        await clients.aclose()
+        server.close()
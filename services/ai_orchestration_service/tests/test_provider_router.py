@@ -0,0 +1,164 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from interview_core import llm_service
+from interview_core.config import settings
+from interview_core.provider_router import ProviderRouter
+from interview_core.resilience import CircuitBreakers
+from interview_core.schemas import InterviewContext
+
+
+@pytest.fixture
+def two_providers(monkeypatch):
+    monkeypatch.setattr(settings, "llm_providers", "local, openai")
+    monkeypatch.setattr(settings, "llm_hedge_enabled", False)
+    monkeypatch.setattr(settings, "llm_hedge_min_samples", 3)
+    monkeypatch.setattr(settings, "llm_hedge_percentile", 50.0)
+
+
+def test_ranks_fastest_healthy_provider_first(two_providers, monkeypatch):
+    router = ProviderRouter()
+    assert router.ranked() == ["local", "openai"]
+
+    router.tracker("local").observe(0.5)
+    router.tracker("openai").observe(0.1)
+    assert router.ranked() == ["openai", "local"]
+
+    breakers = CircuitBreakers()
+    monkeypatch.setattr(settings, "llm_breaker_failure_threshold", 2)
+    monkeypatch.setattr("interview_core.provider_router.circuit_breakers", breakers)
+    breakers.get("openai").record_failure()
+    breakers.get("openai").record_failure()
+    assert router.ranked() == ["local", "openai"]
+    assert router.stats()["providers"]["openai"]["healthy"] is False
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged_and_loser_cancelled(two_providers, monkeypatch):
+    monkeypatch.setattr(settings, "llm_hedge_enabled", True)
+    router = ProviderRouter()
+    for _ in range(3):
+        router.tracker("local").observe(0.01)
+    router.tracker("openai").observe(0.02)
+    cancelled = []
+
+    async def send(provider):
+        if provider == "local":
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(provider)
+                raise
+            return "slow"
+        return "fast"
+
+    assert await router.call(send) == "fast"
+    await asyncio.sleep(0)
+    assert cancelled == ["local"]
+    assert (router.hedges, router.hedge_wins) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_fast_request_is_not_hedged(two_providers, monkeypatch):
+    monkeypatch.setattr(settings, "llm_hedge_enabled", True)
+    router = ProviderRouter()
+    for _ in range(3):
+        router.tracker("local").observe(0.05)
+    router.tracker("openai").observe(0.5)
+    calls = []
+
+    async def send(provider):
+        calls.append(provider)
+        return "ok"
+
+    assert await router.call(send) == "ok"
+    assert calls == ["local"] and router.hedges == 0
+
+
+@pytest.mark.asyncio
+async def test_generate_next_question_routes_to_fastest(two_providers, monkeypatch):
+    router = ProviderRouter()
+    router.tracker("local").observe(2.0)
+    router.tracker("openai").observe(0.2)
+    urls = []
+
+    async def fake_post(self, url, headers=None, json=None):
+        urls.append(url)
+        return httpx.Response(
+            200,
+            json={"choices": [{"message": {"content": "Routed?"}}]},
+            request=httpx.Request("POST", url),
+        )
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+    monkeypatch.setattr(llm_service, "provider_router", router)
+
+    context = InterviewContext(job_description="Backend developer")
+    assert await llm_service.generate_next_question(context, [], use_cache=False) == "Routed?"
+    assert urls == ["https://api.openai.com/v1/chat/completions"]
+    assert router.tracker("openai").requests == 2
+
+
+@pytest.mark.asyncio
+async def test_successful_stream_updates_latency_estimate(two_providers, monkeypatch):
+    from interview_core.llm_service import provider_clients
+
+    router = ProviderRouter()
+    router.tracker("local").observe(0.1)
+    router.tracker("openai").observe(2.0)
+    monkeypatch.setattr(llm_service, "provider_router", router)
+
+    async def handler(request):
+        await asyncio.sleep(0.05)
+        body = 'data: {"choices": [{"delta": {"content": "Streamed?"}}]}\n\ndata: [DONE]\n\n'
+        return httpx.Response(200, text=body)
+
+    await provider_clients.aclose()
+    provider_clients._clients["local"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    context = InterviewContext(job_description="Backend developer")
+    try:
+        deltas = [d async for d in llm_service.stream_next_question(context, [], use_cache=False)]
+    finally:
+        await provider_clients.aclose()
+
+    tracker = router.tracker("local")
+    assert deltas == ["Streamed?"]
+    assert tracker.requests == 2 and tracker.errors == 0
+    assert tracker.samples[-1] >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_failed_primary_fails_over_to_next_provider(two_providers):
+    router = ProviderRouter()
+    calls = []
+
+    async def send(provider):
+        calls.append(provider)
+        if provider == "local":
+            raise httpx.ConnectError("refused")
+        return "backup"
+
+    assert await router.call(send) == "backup"
+    assert calls == ["local", "openai"]
+    assert router.tracker("local").errors == 1 and router.failovers == 1
+
+
+@pytest.mark.asyncio
+async def test_single_provider_failure_is_raised(two_providers, monkeypatch):
+    monkeypatch.setattr(settings, "llm_providers", "")
+    monkeypatch.setattr(settings, "llm_provider", "local")
+    router = ProviderRouter()
+
+    async def send(provider):
+        raise httpx.ConnectError("refused")
+
+    with pytest.raises(httpx.ConnectError):
+        await router.call(send)
+    assert router.failovers == 0
@@ -0,0 +1,118 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from interview_core import llm_service, resilience
+from interview_core.config import settings
+from interview_core.llm_service import provider_clients
+from interview_core.question_bank import QuestionBank, get_question_bank
+from interview_core.resilience import CircuitBreakers
+from interview_core.schemas import ConversationTurn, InterviewContext
+
+from build_question_bank import build
+
+
+@pytest.fixture
+def openai_provider(monkeypatch):
+    monkeypatch.setattr(resilience, "circuit_breakers", CircuitBreakers())
+    monkeypatch.setattr(settings, "llm_provider", "openai")
+    monkeypatch.setattr(settings, "llm_providers", "")
+    monkeypatch.setattr(settings, "llm_retry_attempts", 1)
+    monkeypatch.setattr(settings, "llm_context_token_budget", 0)
+
+
+@pytest.fixture
+def bank_file(monkeypatch, tmp_path):
+    path = tmp_path / "bank.jsonl"
+    entries = [("python", "What is the GIL?"), ("python", "Explain asyncio."), ("general", "Why us?")]
+    path.write_text("".join(json.dumps({"topic": t, "question": q}) + "\n" for t, q in entries))
+    monkeypatch.setattr(settings, "question_bank_path", str(path))
+    get_question_bank.cache_clear()
+    yield path
+    get_question_bank.cache_clear()
+
+
+def test_pick_skips_asked_questions_and_falls_back_to_general():
+    bank = QuestionBank(
+        [("python", "What is the GIL?"), ("sql", "What is an index?"), ("general", "Why us?")]
+    )
+    asked = [ConversationTurn(role="interviewer", message="What is the GIL?")]
+
+    assert bank.pick(["python"], []) == "What is the GIL?"
+    assert bank.pick(["python", "sql"], asked) == "What is an index?"
+    assert bank.pick(["python"], asked) is None
+    assert bank.pick(["rust"], asked) == "Why us?"
+    assert not bank.add("python", "What is the GIL?")
+
+
+@pytest.mark.asyncio
+async def test_failed_and_slow_llm_calls_are_answered_from_the_bank(
+    monkeypatch, openai_provider, bank_file
+):
+    delay = 0.0
+
+    async def handler(request):
+        await asyncio.sleep(delay)
+        return httpx.Response(500)
+
+    await provider_clients.aclose()
+    provider_clients._clients["openai"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    context = InterviewContext(job_description="Python developer")
+    asked = [ConversationTurn(role="interviewer", message="What is the GIL?")]
+    try:
+        failed = await llm_service.generate_next_question(context, asked, use_cache=False)
+        delay = 1.0
+        monkeypatch.setattr(settings, "question_bank_deadline", 0.05)
+        slow = await llm_service.generate_next_question(context, [], use_cache=False)
+    finally:
+        await provider_clients.aclose()
+
+    assert failed == "Explain asyncio."
+    assert slow == "What is the GIL?"
+
+
+@pytest.mark.asyncio
+async def test_fast_mode_skips_the_llm(monkeypatch, bank_file):
+    monkeypatch.setattr(settings, "question_bank_fast_mode", True)
+    context = InterviewContext(job_description="Python developer")
+
+    question = await llm_service.generate_next_question(context, [])
+    deltas = [d async for d in llm_service.stream_next_question(context, [])]
+
+    assert question == "What is the GIL?"
+    assert deltas == ["What is the GIL?"]
+
+
+@pytest.mark.asyncio
+async def test_build_question_bank_generates_per_topic_and_resumes(openai_provider, tmp_path):
+    count = 0
+
+    def handler(request):
+        nonlocal count
+        count += 1
+        prompt = json.loads(request.content)["messages"][0]["content"]
+        topic = prompt.split("question about ")[1].split(".")[0]
+        return httpx.Response(
+            200, json={"choices": [{"message": {"content": f"{topic} question {count}?"}}]}
+        )
+
+    jobs = tmp_path / "jobs.txt"
+    jobs.write_text("Python developer\nPostgreSQL and Python engineer\n")
+    output = tmp_path / "bank.jsonl"
+    provider_clients._clients["openai"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    first = await build(jobs, output, per_topic=2, concurrency=2)
+    provider_clients._clients["openai"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    second = await build(jobs, output, per_topic=2, concurrency=2)
+
+    bank = QuestionBank.from_file(output)
+    assert sorted(bank.topics()) == ["postgresql", "python"]
+    assert all(len(bank.questions(topic)) == 2 for topic in bank.topics())
+    assert first["added"] == 4 and second["added"] == 0
+    assert count == 4
@@ -0,0 +1,171 @@
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from interview_core import resilience
+from interview_core.config import settings
+from interview_core.llm_service import provider_clients
+from interview_core.resilience import (
+    CircuitBreaker,
+    CircuitBreakers,
+    CircuitOpen,
+    call_with_retries,
+    retry_after_seconds,
+)
+
+from main import app
+
+
+def status_error(status, headers=None):
+    request = httpx.Request("POST", "http://llm")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+@pytest.fixture
+def fresh_breakers(monkeypatch):
+    breakers = CircuitBreakers()
+    monkeypatch.setattr(resilience, "circuit_breakers", breakers)
+    monkeypatch.setattr(settings, "llm_retry_base_delay", 0.001)
+    monkeypatch.setattr(settings, "llm_retry_attempts", 3)
+    monkeypatch.setattr(settings, "llm_retry_deadline", 5.0)
+    return breakers
+
+
+def test_retry_after_accepts_seconds_and_dates():
+    assert retry_after_seconds(status_error(429, {"Retry-After": "2"})) == 2.0
+    assert retry_after_seconds(
+        status_error(503, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    ) == 0.0
+    assert retry_after_seconds(status_error(503)) is None
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried(fresh_breakers):
+    outcomes = [status_error(503), httpx.ConnectError("reset"), "Question?"]
+
+    async def send():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert await call_with_retries("openai", send) == "Question?"
+    assert fresh_breakers.get("openai").state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_client_errors_and_long_retry_after_are_not_retried(fresh_breakers):
+    calls = []
+
+    async def bad_request():
+        calls.append("400")
+        raise status_error(400)
+
+    async def rate_limited():
+        calls.append("429")
+        raise status_error(429, {"Retry-After": "60"})
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await call_with_retries("openai", bad_request)
+    with pytest.raises(httpx.HTTPStatusError):
+        await call_with_retries("openai", rate_limited)
+    assert calls == ["400", "429"]
+
+
+def test_breaker_opens_probes_and_closes(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: clock[0])
+    breaker = CircuitBreaker("local", failure_threshold=2, reset_timeout=10)
+
+    breaker.before_call()
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()
+
+    clock[0] += 10
+    breaker.before_call()
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpen):
+        breaker.before_call()
+    breaker.record_success()
+
+    assert breaker.state == "closed"
+    assert breaker.stats()["transitions"] == {
+        "closed->open": 1,
+        "open->half_open": 1,
+        "half_open->closed": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_with_503(fresh_breakers, monkeypatch):
+    monkeypatch.setattr(settings, "llm_provider", "openai")
+    monkeypatch.setattr(settings, "llm_providers", "")
+    breaker = fresh_breakers.get("openai")
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+    def handler(request):
+        raise AssertionError("provider must not be called while the circuit is open")
+
+    await provider_clients.aclose()
+    provider_clients._clients["openai"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    payload = {"context": {"job_description": "Backend developer"}, "history": []}
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            response = await ac.post("/api/v1/interview/generate-question", json=payload)
+    finally:
+        await provider_clients.aclose()
+
+    assert response.status_code == 503
+    assert int(response.headers["Retry-After"]) >= 1
+
+
+@pytest.mark.asyncio
+async def test_stream_retry_backs_off_without_holding_a_slot(fresh_breakers, monkeypatch):
+    from types import SimpleNamespace
+
+    from interview_core import llm_service
+    from interview_core.admission import AdmissionControl
+    from interview_core.schemas import InterviewContext
+
+    control = AdmissionControl()
+    monkeypatch.setattr(llm_service, "admission_control", control)
+    monkeypatch.setattr(settings, "llm_provider", "openai")
+    monkeypatch.setattr(settings, "llm_providers", "")
+    monkeypatch.setattr(settings, "llm_max_concurrency", 1)
+    in_flight_while_waiting = []
+
+    async def sleep(delay):
+        in_flight_while_waiting.append(control.limiter("openai").in_flight)
+
+    monkeypatch.setattr(resilience, "asyncio", SimpleNamespace(sleep=sleep))
+    responses = [
+        httpx.Response(503),
+        httpx.Response(200, text='data: {"choices": [{"delta": {"content": "Why?"}}]}\n\n'),
+    ]
+
+    await provider_clients.aclose()
+    provider_clients._clients["openai"] = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: responses.pop(0))
+    )
+    context = InterviewContext(job_description="Backend developer")
+    try:
+        deltas = [delta async for delta in llm_service.stream_next_question(context, [])]
+    finally:
+        await provider_clients.aclose()
+
+    assert deltas == ["Why?"]
+    assert in_flight_while_waiting == [0]
+    assert control.limiter("openai").in_flight == 0
+    assert control.limiter("openai").admitted == 2
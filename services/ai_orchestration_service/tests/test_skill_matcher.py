@@ -0,0 +1,55 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from interview_core.schemas import InterviewContext
+from interview_core.skill_matcher import SkillMatcher, get_skill_matcher, tokenize
+from interview_core.topic_service import determine_topics
+
+
+def test_tokenize_keeps_symbols_inside_terms():
+    assert tokenize("Node.js, C++ and CI/CD.") == [
+        "node", ".", "js", "c++", "and", "ci", "/", "cd",
+    ]
+
+
+def test_matches_on_word_boundaries_only():
+    matcher = SkillMatcher([
+        {"name": "java", "aliases": []},
+        {"name": "javascript", "aliases": ["js"]},
+    ])
+    assert matcher.match("Senior JavaScript engineer") == ["javascript"]
+    assert matcher.match("Java and JS") == ["java", "javascript"]
+
+
+def test_prefers_longest_term():
+    matcher = SkillMatcher([
+        {"name": "spark", "aliases": ["apache spark"]},
+        {"name": "spark streaming", "aliases": []},
+        {"name": "apache", "aliases": []},
+    ])
+    assert matcher.match("Apache Spark and Spark Streaming") == ["spark", "spark streaming"]
+
+
+def test_match_name_false_skips_bare_name():
+    matcher = SkillMatcher([{"name": "go", "aliases": ["golang"], "match_name": False}])
+    assert matcher.match("ready to go") == []
+    assert matcher.match("Golang services") == ["go"]
+
+
+def test_bundled_taxonomy_maps_aliases():
+    matcher = get_skill_matcher()
+    assert matcher.term_count > 1000
+    assert matcher.match("Django REST APIs on k8s with node.js tooling") == [
+        "python", "backend", "kubernetes", "javascript",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_determine_topics_defaults_to_general():
+    topics = await determine_topics(InterviewContext(job_description="Friendly team"))
+    assert topics == ["general"]
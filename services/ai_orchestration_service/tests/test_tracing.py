@@ -0,0 +1,84 @@
+import json
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from interview_core.config import settings
+from interview_core.llm_service import provider_clients, tracer
+from interview_core.tracing import NOOP_SPAN, JsonlExporter, otlp_payload, parse_traceparent
+
+from main import app
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+PARENT_ID = "00f067aa0ba902b7"
+
+
+def test_parse_traceparent():
+    assert parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-01") == (TRACE_ID, PARENT_ID, True)
+    assert parse_traceparent(f"00-{TRACE_ID}-{PARENT_ID}-00") == (TRACE_ID, PARENT_ID, False)
+    assert parse_traceparent("00-" + "0" * 32 + f"-{PARENT_ID}-01") is None
+    assert parse_traceparent("garbage") is None
+
+
+def test_sampling_off_records_nothing(monkeypatch):
+    monkeypatch.setattr(settings, "trace_sample_rate", 0.0)
+    with tracer.span("work") as span:
+        assert span is NOOP_SPAN
+        assert tracer.headers() == {}
+
+
+def test_unsampled_trace_propagates_without_recording(monkeypatch):
+    monkeypatch.setattr(settings, "trace_sample_rate", 1e-9)
+    monkeypatch.setattr("interview_core.tracing.random.random", lambda: 0.5)
+    buffered = len(tracer._buffer)
+    with tracer.span("root") as root:
+        with tracer.span("child") as child:
+            assert tracer.headers()["traceparent"].endswith("-00")
+    assert child.trace_id == root.trace_id and not child.sampled
+    assert len(tracer._buffer) == buffered
+
+
+@pytest.mark.asyncio
+async def test_request_continues_caller_trace_to_provider_span(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "trace_sample_rate", 1.0)
+    monkeypatch.setattr(settings, "llm_provider", "openai")
+    monkeypatch.setattr(settings, "llm_providers", "")
+    monkeypatch.setattr(settings, "llm_context_token_budget", 0)
+    monkeypatch.setattr(tracer, "_exporter", JsonlExporter(str(tmp_path / "traces.jsonl")))
+    await tracer.flush()
+
+    def handler(request):
+        return httpx.Response(200, json={"choices": [{"message": {"content": "Why?"}}]})
+
+    await provider_clients.aclose()
+    provider_clients._clients["openai"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    payload = {"context": {"job_description": "Backend developer"}, "history": []}
+    headers = {"traceparent": f"00-{TRACE_ID}-{PARENT_ID}-01"}
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+            response = await ac.post(
+                "/api/v1/interview/generate-question", json=payload, headers=headers
+            )
+    finally:
+        await provider_clients.aclose()
+    await tracer.flush()
+
+    assert response.status_code == 200
+    spans = [json.loads(line) for line in (tmp_path / "traces.jsonl").read_text().splitlines()]
+    server = next(s for s in spans if s["name"] == "POST /api/v1/interview/generate-question")
+    provider = next(s for s in spans if s["name"] == "llm.request")
+    assert server["trace_id"] == provider["trace_id"] == TRACE_ID
+    assert server["parent_id"] == PARENT_ID
+    assert provider["parent_id"] == server["span_id"]
+    assert server["attributes"]["http.status_code"] == 200
+    assert provider["attributes"]["provider"] == "openai"
+
+    otlp = otlp_payload(spans)["resourceSpans"][0]
+    assert otlp["resource"]["attributes"][0]["value"]["stringValue"] == "ai-orchestration"
+    assert {s["spanId"] for s in otlp["scopeSpans"][0]["spans"]} == {s["span_id"] for s in spans}
@@ -0,0 +1,5 @@
+"""Code shared by the interview services.
+
+Each service imports it as ``interview_core`` with the repository's
+``services`` directory on ``PYTHONPATH``.
+"""
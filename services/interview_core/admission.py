@@ -0,0 +1,261 @@
+"""Per-provider admission control for LLM calls."""
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Awaitable, Callable, Deque, Dict, Optional
+
+from .config import settings
+from .metrics import registry
+
+
+QUEUE_WAIT = registry.histogram(
+    "llm_queue_wait_seconds",
+    "Time LLM calls waited for an admission slot.",
+    ("provider",),
+)
+REJECTED = registry.counter(
+    "llm_admission_rejected",
+    "LLM calls rejected because the provider's wait queue was full.",
+    ("provider",),
+)
+
+# Called with the caller's queue position (1 = next) and estimated wait in seconds
+QueueListener = Callable[[int, float], Awaitable[None]]
+
+# Set by a caller that wants to be told when its request has to wait
+queue_listener: ContextVar[Optional[QueueListener]] = ContextVar(
+    "queue_listener", default=None
+)
+
+
+class ProviderSaturated(Exception):
+    """Raised when a provider's wait queue is full."""
+
+    def __init__(self, provider: str, retry_after: float) -> None:
+        super().__init__(f"LLM provider '{provider}' is saturated")
+        self.provider = provider
+        self.retry_after = retry_after
+
+
+class AdmissionLimiter:
+    """Limit the calls in flight to one provider, with a bounded FIFO queue.
+
+    Up to ``max_concurrency`` calls run at once (``0`` means unlimited).
+    Further callers wait in arrival order, and once ``max_queue`` are waiting
+    new callers are rejected with ``ProviderSaturated`` instead of piling up
+    until they all hit the request timeout. Wait estimates use an
+    exponentially weighted average of recent call durations.
+
+    Background calls, such as history summaries, only take a free slot when
+    no live call is waiting, and at most ``max_background`` of them hold
+    slots at once (``0`` means no cap), so they never delay a live turn by
+    more than the calls already running.
+    """
+
+    def __init__(
+        self, provider: str, max_concurrency: int, max_queue: int, max_background: int = 0
+    ) -> None:
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_background = max_background
+        self.in_flight = 0
+        self.background_in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._background_waiters: Deque[asyncio.Future] = deque()
+        self._service_time: Optional[float] = None
+        self.admitted = 0
+        self.rejected = 0
+        self.peak_queue_depth = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def saturated(self) -> bool:
+        """Return ``True`` when a new caller would be rejected."""
+
+        return self._must_wait() and self.queue_depth >= self.max_queue
+
+    def estimated_wait(self, position: int) -> float:
+        """Estimate how long the caller at ``position`` will wait, in seconds."""
+
+        if not self._service_time or self.max_concurrency <= 0:
+            return 0.0
+        return math.ceil(position / self.max_concurrency) * self._service_time
+
+    @asynccontextmanager
+    async def slot(self, background: bool = False) -> AsyncIterator[None]:
+        """Hold one of the provider's concurrency slots for the enclosed call."""
+
+        if background:
+            await self._acquire_background()
+        else:
+            await self._acquire()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._observe(time.perf_counter() - start)
+            self._release(background)
+
+    def stats(self) -> dict:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "mean_wait": self.total_wait / self.admitted if self.admitted else 0.0,
+            "max_wait": self.max_wait,
+            "estimated_wait": self.estimated_wait(self.queue_depth + 1),
+            "background_in_flight": self.background_in_flight,
+            "background_queue_depth": len(self._background_waiters),
+        }
+
+    def _must_wait(self) -> bool:
+        return self.max_concurrency > 0 and (
+            self.in_flight >= self.max_concurrency or bool(self._waiters)
+        )
+
+    async def _acquire(self) -> None:
+        if not self._must_wait():
+            self.in_flight += 1
+            self._admit(0.0)
+            return
+        if self.queue_depth >= self.max_queue:
+            self.rejected += 1
+            REJECTED.inc(self.provider)
+            raise ProviderSaturated(self.provider, self.estimated_wait(self.queue_depth + 1))
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+        start = time.perf_counter()
+        try:
+            listener = queue_listener.get()
+            if listener is not None:
+                position = self.queue_depth
+                await listener(position, self.estimated_wait(position))
+            # ``_release`` hands its slot over by resolving the future.
+            await future
+        except BaseException:
+            if future.done() and not future.cancelled():
+                self._release()
+            else:
+                future.cancel()
+                try:
+                    self._waiters.remove(future)
+                except ValueError:
+                    pass
+            raise
+        self._admit(time.perf_counter() - start)
+
+    def _background_allowed(self) -> bool:
+        return self.max_background <= 0 or self.background_in_flight < self.max_background
+
+    async def _acquire_background(self) -> None:
+        if self.max_concurrency <= 0 or (
+            not self._must_wait() and not self._background_waiters and self._background_allowed()
+        ):
+            self.in_flight += 1
+            self.background_in_flight += 1
+            self._admit(0.0)
+            return
+        if len(self._background_waiters) >= self.max_queue:
+            self.rejected += 1
+            REJECTED.inc(self.provider)
+            raise ProviderSaturated(self.provider, self.estimated_wait(self.queue_depth + 1))
+
+        # No queue listener: a background call has no client waiting on it
+        future = asyncio.get_running_loop().create_future()
+        self._background_waiters.append(future)
+        start = time.perf_counter()
+        try:
+            await future
+        except BaseException:
+            if future.done() and not future.cancelled():
+                self._release(background=True)
+            else:
+                future.cancel()
+                try:
+                    self._background_waiters.remove(future)
+                except ValueError:
+                    pass
+            raise
+        self._admit(time.perf_counter() - start)
+
+    def _admit(self, waited: float) -> None:
+        QUEUE_WAIT.observe(waited, self.provider)
+        self.admitted += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def _release(self, background: bool = False) -> None:
+        if background:
+            self.background_in_flight -= 1
+        # Live calls take a freed slot first
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        while self._background_waiters and self._background_allowed():
+            future = self._background_waiters.popleft()
+            if not future.done():
+                self.background_in_flight += 1
+                future.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def _observe(self, duration: float) -> None:
+        if self._service_time is None:
+            self._service_time = duration
+        else:
+            self._service_time += 0.2 * (duration - self._service_time)
+
+
+class AdmissionControl:
+    """Create one ``AdmissionLimiter`` per provider from the settings."""
+
+    def __init__(self) -> None:
+        self._limiters: Dict[str, AdmissionLimiter] = {}
+
+    def limiter(self, provider: str) -> AdmissionLimiter:
+        limiter = self._limiters.get(provider)
+        if limiter is None:
+            limiter = AdmissionLimiter(
+                provider,
+                settings.llm_max_concurrency,
+                settings.llm_max_queue,
+                settings.llm_summary_max_concurrency,
+            )
+            self._limiters[provider] = limiter
+        return limiter
+
+    def stats(self) -> Dict[str, dict]:
+        return {provider: limiter.stats() for provider, limiter in self._limiters.items()}
+
+
+admission_control = AdmissionControl()
+
+registry.gauge(
+    "llm_queue_depth",
+    "LLM calls waiting for an admission slot.",
+    ("provider",),
+    collect=lambda: {(p,): s["queue_depth"] for p, s in admission_control.stats().items()},
+)
+registry.gauge(
+    "llm_in_flight",
+    "LLM calls currently holding an admission slot.",
+    ("provider",),
+    collect=lambda: {(p,): s["in_flight"] for p, s in admission_control.stats().items()},
+)
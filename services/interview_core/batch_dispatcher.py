@@ -0,0 +1,90 @@
+"""Micro-batching of concurrent requests to a single backend."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional, Tuple, Union
+
+
+logger = logging.getLogger(__name__)
+
+# Sends a batch and returns one result (or exception) per item, in order
+BatchSender = Callable[[List[Any]], Awaitable[List[Union[Any, BaseException]]]]
+
+
+class BatchDispatcher:
+    """Collect concurrent submissions and send them to the backend together.
+
+    A batch is dispatched as soon as ``max_size`` items are waiting, or
+    ``max_wait`` seconds after its first item arrived, whichever comes first.
+    Each caller awaits only its own result; a failure of one item is raised
+    to that caller alone.
+    """
+
+    def __init__(self, send: BatchSender, max_size: int, max_wait: float) -> None:
+        self._send = send
+        self.max_size = max(max_size, 1)
+        self.max_wait = max(max_wait, 0.0)
+        self._waiting: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._inflight: set = set()
+        self.batches = 0
+        self.items = 0
+
+    async def submit(self, item: Any) -> Any:
+        """Queue ``item`` for the next batch and wait for its result."""
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._waiting.append((item, future))
+        if len(self._waiting) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def stats(self) -> dict:
+        return {
+            "max_size": self.max_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch_size": self.items / self.batches if self.batches else 0.0,
+            "waiting": len(self._waiting),
+        }
+
+    async def aclose(self) -> None:
+        """Dispatch anything still waiting and wait for in-flight batches."""
+
+        self._flush()
+        await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._waiting:
+            batch = self._waiting[: self.max_size]
+            del self._waiting[: self.max_size]
+            task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        self.batches += 1
+        self.items += len(batch)
+        try:
+            results = await self._send([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Batch backend returned {len(results)} results for {len(batch)} items"
+                )
+        except Exception as exc:
+            logger.warning("Batch of %d items failed: %s", len(batch), exc)
+            results = [exc] * len(batch)
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
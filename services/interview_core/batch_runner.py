@@ -0,0 +1,45 @@
+"""Run many independent requests with bounded concurrency."""
+
+import asyncio
+import logging
+from typing import AsyncIterator, Awaitable, Callable, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+Item = TypeVar("Item")
+
+
+async def run_batch(
+    items: Sequence[Item],
+    work: Callable[[Item], Awaitable[dict]],
+    concurrency: int,
+) -> AsyncIterator[dict]:
+    """Yield one result per item, in completion order.
+
+    At most ``concurrency`` items run at a time. Each result carries the
+    ``index`` of its item. ``work`` returns the fields of a successful
+    result; if it raises, the result is ``{"index": i, "error": {...}}``
+    and the remaining items keep running. Items still running when the
+    consumer stops iterating are cancelled.
+    """
+
+    results: asyncio.Queue = asyncio.Queue()
+    pending = iter(enumerate(items))
+
+    async def worker() -> None:
+        for index, item in pending:
+            try:
+                result = {"index": index, **await work(item)}
+            except Exception as exc:
+                logger.warning("Batch item %d failed: %r", index, exc)
+                result = {"index": index, "error": {"type": type(exc).__name__, "detail": str(exc)}}
+            await results.put(result)
+
+    workers = [asyncio.create_task(worker()) for _ in range(min(max(concurrency, 1), len(items)))]
+    try:
+        for _ in range(len(items)):
+            yield await results.get()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,197 @@
+"""Memoization of LLM completions keyed on the exact prompt sent."""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from .config import settings
+
+
+def completion_key(provider: str, model: str, messages: List[dict]) -> str:
+    """Return a stable hash of the provider, model and full ``messages`` list."""
+
+    raw = json.dumps(
+        [provider, model, messages], sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class CompletionCache:
+    """Base class for completion caches with LRU eviction and a TTL.
+
+    Subclasses implement ``_get`` and ``_set``; this class keeps the hit and
+    miss counters. Used directly it is a disabled cache that stores nothing.
+    """
+
+    backend = "none"
+    enabled = False
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self._get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        await self._set(key, value)
+
+    async def stats(self) -> Dict[str, object]:
+        return {
+            "backend": self.backend,
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": await self.size(),
+        }
+
+    async def size(self) -> int:
+        return 0
+
+    async def aclose(self) -> None:
+        return None
+
+    async def _get(self, key: str) -> Optional[str]:
+        return None
+
+    async def _set(self, key: str, value: str) -> None:
+        return None
+
+
+class MemoryCompletionCache(CompletionCache):
+    """In-process cache backed by an ordered dict."""
+
+    backend = "memory"
+    enabled = True
+
+    def __init__(self, max_entries: int, ttl: float) -> None:
+        super().__init__(max_entries, ttl)
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    async def _get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def _set(self, key: str, value: str) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def size(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCompletionCache(CompletionCache):
+    """On-disk cache stored in a local SQLite database.
+
+    Queries run in a worker thread so the event loop is never blocked on
+    disk I/O.
+    """
+
+    backend = "sqlite"
+    enabled = True
+
+    def __init__(self, path: str, max_entries: int, ttl: float) -> None:
+        super().__init__(max_entries, ttl)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS completions ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._db.commit()
+
+    async def _get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get_sync, key)
+
+    async def _set(self, key: str, value: str) -> None:
+        await asyncio.to_thread(self._set_sync, key, value)
+
+    async def size(self) -> int:
+        return await asyncio.to_thread(self._size_sync)
+
+    async def aclose(self) -> None:
+        await asyncio.to_thread(self._close_sync)
+
+    def _size_sync(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM completions").fetchone()[0]
+
+    def _close_sync(self) -> None:
+        # Closing the last connection checkpoints the WAL into the database
+        with self._lock:
+            self._db.close()
+
+    def _get_sync(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value, expires_at FROM completions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at < now:
+                self._db.execute("DELETE FROM completions WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+            self._db.execute(
+                "UPDATE completions SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._db.commit()
+            return value
+
+    def _set_sync(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO completions VALUES (?, ?, ?, ?)",
+                (key, value, now + self.ttl, now),
+            )
+            self._db.execute(
+                "DELETE FROM completions WHERE key IN ("
+                "SELECT key FROM completions ORDER BY accessed_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._db.commit()
+
+
+def build_completion_cache() -> CompletionCache:
+    """Create the cache backend selected by ``settings.llm_cache_backend``."""
+
+    backend = settings.llm_cache_backend.lower()
+    if backend == "memory":
+        return MemoryCompletionCache(settings.llm_cache_max_entries, settings.llm_cache_ttl)
+    if backend == "sqlite":
+        return SQLiteCompletionCache(
+            settings.llm_cache_path, settings.llm_cache_max_entries, settings.llm_cache_ttl
+        )
+    if backend == "none":
+        return CompletionCache(settings.llm_cache_max_entries, settings.llm_cache_ttl)
+    raise ValueError(f"Unsupported LLM cache backend: {settings.llm_cache_backend}")
+
+
+completion_cache = build_completion_cache()
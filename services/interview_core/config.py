@@ -0,0 +1,150 @@
+"""Settings of the interview engine: providers, caching, resilience and tracing."""
+
+import os
+from pathlib import Path
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# The AI orchestration service serves the engine over HTTP, and its ``.env``
+# is the engine's configuration. A process whose copy of ``interview_core``
+# has no such sibling, such as the session service's image, names the file
+# in ``INTERVIEW_ENGINE_ENV_FILE`` or sets the variables directly.
+ENV_FILE = os.getenv("INTERVIEW_ENGINE_ENV_FILE") or (
+    Path(__file__).resolve().parents[1] / "ai_orchestration_service" / ".env"
+)
+
+
+class Settings(BaseSettings):
+    """LLM provider configuration and engine tuning.
+
+    Variables set in the environment take precedence over ``ENV_FILE``; a
+    missing file is ignored, so required settings then have to come from
+    the environment.
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=ENV_FILE,
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    # Which LLM backend to use: "openai", "gemini", or "local"
+    llm_provider: str
+
+    # API keys or URLs for the various providers
+    openai_api_key: str
+    # Default OpenAI model to use
+    openai_model: str
+    gemini_api_key: str
+    # Default endpoint for a locally hosted model.
+    # `host.docker.internal` lets containers reach services on the host.
+    # local_llm_url: str = "http://host.docker.internal:1234/v1/chat/completions"
+    local_llm_url: str
+
+    # Timeout (in seconds) for outgoing HTTP requests to LLM providers
+    llm_timeout: float
+
+    # Connection pool limits for the shared per-provider HTTP clients
+    llm_max_connections: int = 20
+    llm_max_keepalive_connections: int = 10
+    # Seconds an idle keep-alive connection is kept open
+    llm_keepalive_expiry: float = 30.0
+    # Negotiate HTTP/2 with providers (requires the optional ``h2`` package)
+    llm_http2: bool = False
+
+    # Completion cache: "none", "memory" or "sqlite"
+    llm_cache_backend: str = "none"
+    llm_cache_max_entries: int = 1024
+    # Seconds a cached completion stays valid
+    llm_cache_ttl: float = 3600.0
+    # Database file used by the "sqlite" backend
+    llm_cache_path: str = "completion_cache.sqlite3"
+
+    # JSON skills taxonomy used for topic inference; empty uses the bundled file
+    topic_taxonomy_path: str = ""
+
+    # Compact job descriptions and resumes once per session before they are
+    # used in prompts; token budgets of 0 keep all relevant sections
+    context_preprocessing: bool = True
+    context_job_description_max_tokens: int = 800
+    context_resume_max_tokens: int = 1500
+
+    # Token budget for the prompt sent per turn; 0 sends the full history
+    llm_context_token_budget: int = 3000
+    # Most recent turns always sent verbatim when the budget is exceeded
+    llm_context_recent_turns: int = 6
+    # Target length of the rolling summary of older turns
+    llm_summary_max_words: int = 150
+    # Number of rolling summaries kept in memory
+    llm_summary_cache_size: int = 1024
+
+    # Comma-separated providers to route between (e.g. "local,openai");
+    # empty uses only ``llm_provider``
+    llm_providers: str = ""
+    # Latency samples kept per provider for routing and hedging
+    llm_latency_window: int = 200
+    # Send a duplicate request once the primary exceeds this latency percentile
+    llm_hedge_enabled: bool = False
+    llm_hedge_percentile: float = 95.0
+    # Latency samples required before hedging starts
+    llm_hedge_min_samples: int = 20
+
+    # Attempts per provider call for 408/425/429/5xx and connection errors
+    llm_retry_attempts: int = 3
+    # Full-jitter exponential backoff between attempts, in seconds
+    llm_retry_base_delay: float = 0.2
+    llm_retry_max_delay: float = 5.0
+    # Seconds after the first attempt when no further retry is started
+    llm_retry_deadline: float = 20.0
+    # Consecutive failures that open a provider's circuit, and seconds
+    # before a half-open probe is let through
+    llm_breaker_failure_threshold: int = 5
+    llm_breaker_reset_timeout: float = 30.0
+
+    # Provider calls in flight at once per provider (0 = unlimited)
+    llm_max_concurrency: int = 16
+    # Calls allowed to wait for a slot; further calls are rejected with 503
+    llm_max_queue: int = 64
+    # Slots per provider that history summaries may hold at once (0 = no cap);
+    # summaries only take slots no live call is waiting for
+    llm_summary_max_concurrency: int = 4
+
+    # Micro-batch concurrent requests to the "local" provider
+    llm_batch_enabled: bool = False
+    # Dispatch a batch once it holds this many requests ...
+    llm_batch_max_size: int = 8
+    # ... or this many milliseconds after its first request arrived
+    llm_batch_max_wait_ms: float = 5.0
+    # Optional batch endpoint taking a JSON array of chat completion requests;
+    # empty sends each batch as concurrent requests to ``local_llm_url``
+    local_llm_batch_url: str = ""
+
+    # Opening questions kept ready per pre-warmed job posting
+    job_question_pool_size: int = 3
+    # Estimated word-shingle similarity at which a job description counts as
+    # a near-duplicate of a registered posting and reuses its topics and
+    # opening questions (0 disables)
+    job_similarity_threshold: float = 0.8
+
+    # JSON Lines question bank built by ``build_question_bank.py``; empty
+    # disables it. With a bank, a failed LLM call is answered from the bank.
+    question_bank_path: str = ""
+    # Serve from the bank first and call the LLM only when it has no match
+    question_bank_fast_mode: bool = False
+    # Seconds to wait for the LLM before answering from the bank (0 waits)
+    question_bank_deadline: float = 0.0
+
+    # Fraction of new traces recorded (0 disables tracing); traces continued
+    # from an incoming ``traceparent`` header keep the caller's decision
+    trace_sample_rate: float = 0.0
+    # Where finished spans go: "jsonl" (``trace_jsonl_path``) or "otlp"
+    trace_exporter: str = "jsonl"
+    trace_jsonl_path: str = "traces.jsonl"
+    trace_otlp_endpoint: str = "http://localhost:4318/v1/traces"
+    # Seconds between exports, and spans kept in memory before dropping
+    trace_export_interval: float = 5.0
+    trace_max_buffered_spans: int = 10000
+    trace_service_name: str = "ai-orchestration"
+
+
+settings = Settings()
@@ -0,0 +1,195 @@
+"""Shrink job descriptions and resumes before they are put into prompts.
+
+Compaction normalizes whitespace, drops boilerplate sections (benefits,
+equal opportunity statements, company blurbs, application instructions),
+removes repeated bullet points and, given a token budget, keeps the most
+relevant sections first: requirements and skills, then responsibilities
+and experience, then everything else. Kept lines stay in their original
+order. Compacting compacted text returns it unchanged, so every hop may
+apply it.
+"""
+
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from .tokens import estimate_tokens
+
+_BULLET_RE = re.compile(r"^(?:[-*•·▪●>]+|\d+[.)])\s*")
+_HEADING_RE = re.compile(r"^#*\s*([A-Za-z][\w &/',()-]{0,60}?)\s*:?$")
+
+BOILERPLATE_SECTIONS = re.compile(
+    r"benefit|perk|what we offer|compensation|salary|equal opportunit|eeo|diversity"
+    r"|about (?:us|the company|our company)|who we are|how to apply|application process"
+    r"|privacy|disclaimer|references"
+)
+BOILERPLATE_LINES = re.compile(
+    r"equal opportunity employer|without regard to (?:race|age)|reasonable accommodation"
+    r"|references available|apply now|click apply|privacy (?:policy|notice)",
+    re.IGNORECASE,
+)
+# Lower value is kept first when trimming to a budget
+SECTION_PRIORITIES: Tuple[Tuple[str, int], ...] = (
+    ("require", 0), ("qualification", 0), ("skill", 0), ("must have", 0), ("stack", 0),
+    ("responsib", 1), ("what you", 1), ("role", 1), ("experience", 1), ("employment", 1),
+    ("project", 2), ("summary", 2), ("profile", 2),
+    ("nice to have", 3), ("preferred", 3), ("bonus", 3), ("education", 3),
+    ("certif", 3), ("interest", 4), ("hobb", 4),
+)
+INTRO_PRIORITY = 1
+DEFAULT_PRIORITY = 2
+# An all-caps line without a colon is only a heading if it names a section;
+# otherwise it is content, such as "PYTHON" in a list of skills
+SECTION_KEYWORDS = re.compile(
+    r"\b(?:"
+    + "|".join(re.escape(keyword) for keyword, _ in SECTION_PRIORITIES)
+    + r"|about|overview|description|objective|duties|tool|technolog|language|achievement"
+    r"|award|publication|volunteer|contact|work history|career|background)",
+    re.IGNORECASE,
+)
+# A mixed-case line without a colon is only a heading if it is a common
+# section name as a whole, such as "Responsibilities" or "About Us";
+# "Experience with Kafka" is content
+SECTION_NAMES = re.compile(
+    r"(?:(?:key|core|main|technical|professional|relevant|required|preferred|minimum"
+    r"|basic|additional|job|work|your|our)\s+)*"
+    r"(?:requirements|qualifications|skills(?:\s*(?:and|&)\s*\w+)?|responsibilities|duties"
+    r"|experience|employment(?: history)?|work history|projects|summary|profile|overview"
+    r"|objective|education|certifications|interests|hobbies|nice to have|bonus points"
+    r"|tech(?:nology)? stack|tools|technologies|languages|achievements|awards|publications"
+    r"|description|the role|role|what you(?:'ll| will) do|benefits|perks|compensation"
+    r"|what we offer|about (?:us|the company|our company|the role)|who we are"
+    r"|how to apply|application process)",
+    re.IGNORECASE,
+)
+
+
+class _Section:
+    __slots__ = ("heading", "priority", "lines")
+
+    def __init__(self, heading: Optional[str], priority: int) -> None:
+        self.heading = heading
+        self.priority = priority
+        self.lines: List[str] = []
+
+
+def _heading(line: str) -> Optional[str]:
+    """Return the section name if ``line`` looks like a heading."""
+
+    if _BULLET_RE.match(line) or len(line.split()) > 6:
+        return None
+    match = _HEADING_RE.match(line)
+    if match is None:
+        return None
+    name = match.group(1).strip()
+    if line.endswith(":") or line.startswith("#"):
+        return name
+    if line.isupper() and (
+        SECTION_KEYWORDS.search(name) or BOILERPLATE_SECTIONS.search(name.lower())
+    ):
+        return name
+    if SECTION_NAMES.fullmatch(name):
+        return name
+    return None
+
+
+def _priority(heading: str) -> int:
+    lowered = heading.lower()
+    for keyword, priority in SECTION_PRIORITIES:
+        if keyword in lowered:
+            return priority
+    return DEFAULT_PRIORITY
+
+
+def _sections(text: str) -> List[_Section]:
+    sections = [_Section(None, INTRO_PRIORITY)]
+    seen = set()
+    after_blank = False
+    for raw in text.splitlines():
+        line = " ".join(raw.split())
+        if not line:
+            after_blank = True
+            continue
+        # A boilerplate section ends at the next paragraph that is not a bullet
+        if after_blank and sections[-1].priority < 0 and not _BULLET_RE.match(line):
+            sections.append(_Section(None, INTRO_PRIORITY))
+        after_blank = False
+        heading = _heading(line)
+        if heading is not None:
+            sections.append(_Section(heading, _priority(heading)))
+            if BOILERPLATE_SECTIONS.search(heading.lower()):
+                sections[-1].priority = -1
+            continue
+        if sections[-1].priority < 0 or BOILERPLATE_LINES.search(line):
+            continue
+        bullet = _BULLET_RE.match(line)
+        if bullet:
+            line = "- " + line[bullet.end():]
+        key = line.lstrip("- ").rstrip(".;").lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        sections[-1].lines.append(line)
+    return [s for s in sections if s.priority >= 0 and s.lines]
+
+
+@lru_cache(maxsize=256)
+def compact_text(text: str, max_tokens: int = 0) -> str:
+    """Return ``text`` compacted and, if ``max_tokens`` > 0, trimmed to fit it."""
+
+    sections = _sections(text)
+    kept = {id(section): len(section.lines) for section in sections}
+    if max_tokens > 0 and sections:
+        # Fill the budget in priority order; the first section that does not
+        # fit is cut short and everything of lower priority is dropped.
+        remaining = max_tokens
+        kept = {}
+        for section in sorted(sections, key=lambda s: s.priority):
+            if section.heading:
+                remaining -= estimate_tokens(section.heading + ":")
+            count = 0
+            for line in section.lines:
+                cost = estimate_tokens(line)
+                if cost > remaining:
+                    break
+                remaining -= cost
+                count += 1
+            if count:
+                kept[id(section)] = count
+            if count < len(section.lines):
+                break
+        if not kept:
+            # Not even one line fits: keep the leading words of the most
+            # relevant line rather than nothing
+            first = min(sections, key=lambda s: s.priority).lines[0]
+            words = []
+            remaining = max_tokens
+            for word in first.split():
+                remaining -= estimate_tokens(word)
+                if remaining < 0:
+                    break
+                words.append(word)
+            return " ".join(words)
+    lines = []
+    for section in sections:
+        count = kept.get(id(section), 0)
+        if not count:
+            continue
+        if section.heading:
+            lines.append(section.heading + ":")
+        lines.extend(section.lines[:count])
+    return "\n".join(lines)
+
+
+def compact_context(
+    job_description: str,
+    candidate_resume: Optional[str],
+    job_description_max_tokens: int = 0,
+    resume_max_tokens: int = 0,
+) -> Tuple[str, Optional[str]]:
+    """Compact both parts of an interview context with their own budgets."""
+
+    job_description = compact_text(job_description, job_description_max_tokens)
+    if candidate_resume:
+        candidate_resume = compact_text(candidate_resume, resume_max_tokens)
+    return job_description, candidate_resume
@@ -0,0 +1,126 @@
+"""Token-budgeted history window with rolling summaries of older turns."""
+
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .config import settings
+from .tokens import estimate_tokens
+
+
+logger = logging.getLogger(__name__)
+
+# Chat formatting overhead per message (role markers and separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+Summarizer = Callable[[Optional[str], List[dict]], Awaitable[str]]
+
+
+def message_tokens(message: dict) -> int:
+    return estimate_tokens(message["content"]) + MESSAGE_OVERHEAD_TOKENS
+
+
+def _prefix_keys(system: dict, turns: List[dict]) -> List[str]:
+    """Return a chained hash identifying each prefix ``turns[:i + 1]``."""
+
+    digest = hashlib.sha1(system["content"].encode("utf-8")).digest()
+    keys = []
+    for turn in turns:
+        digest = hashlib.sha1(
+            digest + turn["role"].encode("utf-8") + b"\0" + turn["content"].encode("utf-8")
+        ).digest()
+        keys.append(digest.hex())
+    return keys
+
+
+class ContextWindow:
+    """Fit chat messages into a token budget.
+
+    The system prompt and the most recent turns are always kept verbatim.
+    Older turns are folded into a summary that is extended incrementally by
+    a background task, so summarization never delays the current turn. Until
+    a summary covers them, older turns are kept verbatim newest-first while
+    they fit and dropped otherwise, which keeps every prompt within budget.
+    """
+
+    def __init__(self, summarize: Summarizer) -> None:
+        self._summarize = summarize
+        self._summaries: "OrderedDict[str, str]" = OrderedDict()
+        self._pending: Dict[str, asyncio.Task] = {}
+
+    def fit(self, messages: List[dict]) -> List[dict]:
+        """Return ``messages`` trimmed to ``settings.llm_context_token_budget``."""
+
+        budget = settings.llm_context_token_budget
+        if budget <= 0 or sum(message_tokens(m) for m in messages) <= budget:
+            return messages
+
+        system, turns = messages[0], messages[1:]
+        keep = max(settings.llm_context_recent_turns, 1)
+        recent = turns[-keep:]
+        older = turns[: len(turns) - len(recent)]
+
+        summary, covered = None, 0
+        if older:
+            keys = _prefix_keys(system, older)
+            summary, covered = self._latest_summary(keys)
+            if covered < len(older):
+                self._schedule(keys[-1], summary, older[covered:])
+
+        if summary:
+            system = {
+                "role": system["role"],
+                "content": f"{system['content']} Summary of the earlier conversation: {summary}",
+            }
+
+        remaining = budget - message_tokens(system)
+        while len(recent) > 1 and sum(message_tokens(m) for m in recent) > remaining:
+            recent = recent[1:]
+        remaining -= sum(message_tokens(m) for m in recent)
+
+        middle: List[dict] = []
+        for turn in reversed(older[covered:]):
+            cost = message_tokens(turn)
+            if cost > remaining:
+                break
+            middle.insert(0, turn)
+            remaining -= cost
+        return [system] + middle + recent
+
+    async def aclose(self) -> None:
+        """Cancel summaries still being computed."""
+
+        tasks = list(self._pending.values())
+        self._pending.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _latest_summary(self, keys: List[str]) -> Tuple[Optional[str], int]:
+        """Find the summary covering the longest known prefix of the history."""
+
+        for index in range(len(keys) - 1, -1, -1):
+            summary = self._summaries.get(keys[index])
+            if summary is not None:
+                self._summaries.move_to_end(keys[index])
+                return summary, index + 1
+        return None, 0
+
+    def _schedule(self, key: str, summary: Optional[str], turns: List[dict]) -> None:
+        if key in self._pending:
+            return
+        task = asyncio.create_task(self._extend(key, summary, turns))
+        self._pending[key] = task
+        task.add_done_callback(lambda _: self._pending.pop(key, None))
+
+    async def _extend(self, key: str, summary: Optional[str], turns: List[dict]) -> None:
+        try:
+            extended = await self._summarize(summary, turns)
+        except Exception as exc:
+            logger.warning("History summarization failed: %s", exc)
+            return
+        self._summaries[key] = extended
+        while len(self._summaries) > settings.llm_summary_cache_size:
+            self._summaries.popitem(last=False)
@@ -0,0 +1,141 @@
+"""The interview engine as one object, for the services that run it."""
+
+from typing import AsyncIterator, Iterable, List, Optional
+
+from .admission import QueueListener, queue_listener
+from .completion_cache import completion_cache
+from .config import settings
+from .job_registry import job_registry
+from .llm_service import (
+    context_window,
+    generate_next_question,
+    local_batcher,
+    prepare_context,
+    provider_clients,
+    stream_next_question,
+    tracer,
+)
+from .question_bank import get_question_bank
+from .schemas import ConversationTurn, InterviewContext
+from .skill_matcher import get_skill_matcher
+from .topic_service import determine_topics
+
+
+class InterviewEngine:
+    """Question generation, topic inference and pre-warmed jobs behind one interface.
+
+    The AI orchestration service serves it over HTTP; the session service
+    can run the same engine in its own process instead. Either way a
+    question goes through the same prompt, completion cache, context
+    window, retries, circuit breakers, admission control and question bank.
+    ``startup`` opens the provider clients and tracer and loads the skills
+    taxonomy and question bank; ``aclose`` releases them.
+
+    ``on_queued`` receives the queue position and estimated wait (seconds)
+    when a request has to wait for a provider slot.
+    """
+
+    tracer = tracer
+
+    async def startup(self) -> None:
+        await provider_clients.startup()
+        await tracer.startup()
+        get_skill_matcher(settings.topic_taxonomy_path)
+        get_question_bank()
+
+    async def aclose(self) -> None:
+        await job_registry.aclose()
+        await context_window.aclose()
+        await local_batcher.aclose()
+        await provider_clients.aclose()
+        await completion_cache.aclose()
+        await tracer.aclose()
+
+    def prepare_context(self, context: InterviewContext) -> InterviewContext:
+        return prepare_context(context)
+
+    async def generate_question(
+        self,
+        context: InterviewContext,
+        history: Iterable[ConversationTurn],
+        use_cache: bool = True,
+        on_queued: Optional[QueueListener] = None,
+    ) -> str:
+        """Return the next question for a prepared ``context``.
+
+        An opening question for a near-duplicate of a registered job posting
+        is taken from that posting's ready pool.
+        """
+
+        question = None if history else job_registry.take_ready_question(context)
+        if question is not None:
+            return question
+        token = queue_listener.set(on_queued)
+        try:
+            return await generate_next_question(context, history, use_cache=use_cache)
+        finally:
+            queue_listener.reset(token)
+
+    async def stream_question(
+        self,
+        context: InterviewContext,
+        history: Iterable[ConversationTurn],
+        use_cache: bool = True,
+        on_queued: Optional[QueueListener] = None,
+    ) -> AsyncIterator[str]:
+        """Yield the next question for a prepared ``context`` as the LLM produces it."""
+
+        question = None if history else job_registry.take_ready_question(context)
+        if question is not None:
+            yield question
+            return
+        token = queue_listener.set(on_queued)
+        try:
+            async for delta in stream_next_question(context, history, use_cache=use_cache):
+                yield delta
+        finally:
+            try:
+                queue_listener.reset(token)
+            except ValueError:
+                # An async generator finalized from another context.
+                pass
+
+    async def determine_topics(self, context: InterviewContext) -> List[str]:
+        """Infer topics, reusing a near-duplicate posting's when there is no resume."""
+
+        job = None
+        if not context.candidate_resume:
+            job = job_registry.find_similar(context.job_description)
+        if job is not None:
+            return job.topics
+        return await determine_topics(context)
+
+    async def start_job(self, job_id: str, candidate_resume: Optional[str]) -> Optional[dict]:
+        """Serve the precomputed first turn of an interview for a registered posting.
+
+        Returns ``job_id``, ``context``, ``topics`` and ``question_text``, or
+        ``None`` if the job is unknown. Topics are only recomputed when the
+        candidate supplies a resume; the opening question depends on the job
+        description alone.
+        """
+
+        job = job_registry.get(job_id)
+        if job is None:
+            return None
+        context = InterviewContext(
+            job_description=job.context.job_description,
+            candidate_resume=candidate_resume,
+        )
+        topics = job.topics
+        if candidate_resume:
+            topics = await determine_topics(context)
+        question = await job_registry.take_opening_question(job)
+        return {
+            "job_id": job.job_id,
+            "context": context,
+            "topics": topics,
+            "question_text": question,
+        }
+
+
+engine = InterviewEngine()
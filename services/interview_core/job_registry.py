@@ -0,0 +1,203 @@
+"""Pre-warmed job postings with precomputed topics and opening questions."""
+
+import asyncio
+import logging
+import uuid
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from .config import settings
+from .llm_service import generate_next_question, prepare_context
+from .metrics import registry
+from .near_duplicates import NearDuplicateIndex
+from .schemas import InterviewContext
+from .topic_service import determine_topics
+
+
+logger = logging.getLogger(__name__)
+
+NEAR_DUPLICATE_HITS = registry.counter(
+    "job_near_duplicate_hits",
+    "Job descriptions matched to a near-identical registered posting, by use.",
+    ("use",),
+)
+
+
+def normalize_job_description(job_description: str) -> str:
+    """Collapse whitespace so equivalent postings produce identical prompts."""
+
+    return " ".join(job_description.split())
+
+
+class PrewarmedJob:
+    """A registered job posting and its pool of ready opening questions."""
+
+    def __init__(
+        self,
+        job_id: str,
+        context: InterviewContext,
+        topics: list,
+        pool_size: int,
+        duplicate_of: Optional["PrewarmedJob"] = None,
+    ) -> None:
+        self.job_id = job_id
+        self.context = context
+        self.topics = topics
+        self.pool_size = pool_size
+        # Near-identical postings share one pool of opening questions
+        self.duplicate_of = duplicate_of
+        self.questions: Deque[str] = (
+            duplicate_of.questions if duplicate_of is not None else deque()
+        )
+
+
+class JobRegistry:
+    """Register job postings ahead of time and serve their first turn instantly.
+
+    The first question of every interview for a posting has an empty history,
+    so it can be generated before any candidate joins. Each posting keeps a
+    small pool of such questions that is refilled in the background as
+    sessions consume it.
+
+    Postings that differ only by a few words, such as the same role in
+    another location, are matched to the first registered one with a
+    MinHash/LSH index and reuse its topics and question pool.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: Dict[str, PrewarmedJob] = {}
+        self._refills: Dict[str, asyncio.Task] = {}
+        self._similar: NearDuplicateIndex[str] = NearDuplicateIndex()
+
+    async def register(
+        self,
+        job_description: str,
+        job_id: Optional[str] = None,
+        pool_size: Optional[int] = None,
+    ) -> PrewarmedJob:
+        """Precompute topics and fill the opening question pool for a posting.
+
+        A near-duplicate of a registered posting takes over its topics and
+        shares its question pool instead. Registering an existing ``job_id``
+        again replaces that posting, and the postings matched to it are
+        matched again against the new text.
+        """
+
+        compacted = prepare_context(InterviewContext(job_description=job_description))
+        context = InterviewContext(
+            job_description=normalize_job_description(compacted.job_description)
+        )
+        job_id = job_id or uuid.uuid4().hex
+        previous = self._jobs.get(job_id)
+        # Drop the previous text of a re-registered posting so it is matched afresh
+        self._similar.remove(job_id)
+        original = self.find_similar(context.job_description)
+        if original is not None:
+            NEAR_DUPLICATE_HITS.inc("register")
+            logger.info("Job %s is a near-duplicate of %s", job_id, original.job_id)
+            job = PrewarmedJob(
+                job_id, context, list(original.topics), original.pool_size, original
+            )
+            self._jobs[job_id] = job
+            self._schedule_refill(original)
+            await self._rematch_duplicates(previous)
+            return job
+        topics = await determine_topics(context)
+        job = PrewarmedJob(
+            job_id,
+            context,
+            topics,
+            pool_size or settings.job_question_pool_size,
+        )
+        self._jobs[job.job_id] = job
+        if settings.job_similarity_threshold > 0:
+            self._similar.add(job.job_id, context.job_description)
+        await self._fill(job)
+        await self._rematch_duplicates(previous)
+        return job
+
+    def get(self, job_id: str) -> Optional[PrewarmedJob]:
+        return self._jobs.get(job_id)
+
+    def find_similar(self, job_description: str) -> Optional[PrewarmedJob]:
+        """Return the registered posting near-identical to ``job_description``."""
+
+        if settings.job_similarity_threshold <= 0:
+            return None
+        match = self._similar.query(
+            normalize_job_description(job_description), settings.job_similarity_threshold
+        )
+        return self._jobs.get(match[0]) if match is not None else None
+
+    def take_ready_question(self, context: InterviewContext) -> Optional[str]:
+        """Pop a ready opening question of a posting near-identical to ``context``.
+
+        Returns ``None`` without calling the LLM when there is no such
+        posting or its pool is empty.
+        """
+
+        job = self.find_similar(context.job_description)
+        if job is None or not job.questions:
+            return None
+        NEAR_DUPLICATE_HITS.inc("opening_question")
+        question = job.questions.popleft()
+        self._schedule_refill(job.duplicate_of or job)
+        return question
+
+    async def take_opening_question(self, job: PrewarmedJob) -> str:
+        """Pop a ready opening question, generating one only if the pool is empty."""
+
+        if job.questions:
+            question = job.questions.popleft()
+        else:
+            question = await generate_next_question(job.context, [], use_cache=False)
+        self._schedule_refill(job.duplicate_of or job)
+        return question
+
+    async def aclose(self) -> None:
+        """Cancel any background refills."""
+
+        tasks = list(self._refills.values())
+        self._refills.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _rematch_duplicates(self, previous: Optional[PrewarmedJob]) -> None:
+        """Register the duplicates of a replaced posting again.
+
+        Otherwise they would keep its old topics and orphaned question pool.
+        """
+
+        if previous is None:
+            return
+        for job in [job for job in self._jobs.values() if job.duplicate_of is previous]:
+            await self.register(job.context.job_description, job.job_id, job.pool_size)
+
+    def _schedule_refill(self, job: PrewarmedJob) -> None:
+        if job.job_id in self._refills:
+            return
+        task = asyncio.create_task(self._fill(job))
+        self._refills[job.job_id] = task
+        task.add_done_callback(lambda _: self._refills.pop(job.job_id, None))
+
+    async def _fill(self, job: PrewarmedJob) -> None:
+        missing = job.pool_size - len(job.questions)
+        if missing <= 0:
+            return
+        # Bypass the completion cache: the same prompt must yield varied openers.
+        results = await asyncio.gather(
+            *(
+                generate_next_question(job.context, [], use_cache=False)
+                for _ in range(missing)
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("Opening question for job %s failed: %s", job.job_id, result)
+            else:
+                job.questions.append(result)
+
+
+job_registry = JobRegistry()
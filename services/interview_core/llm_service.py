@@ -0,0 +1,408 @@
+"""Service for interacting with various LLM providers."""
+
+import asyncio
+import json
+import logging
+import time
+from contextlib import AsyncExitStack
+from typing import AsyncIterator, Iterable, List, Optional, Tuple, Union
+
+import httpx
+
+from .admission import admission_control
+from .batch_dispatcher import BatchDispatcher
+from .completion_cache import completion_cache, completion_key
+from .config import settings
+from .context_preprocessor import compact_context
+from .context_window import ContextWindow
+from .metrics import registry
+from .provider_clients import ProviderClients
+from .provider_router import provider_router
+from .question_bank import get_question_bank
+from .resilience import CircuitOpen, call_with_retries
+from .schemas import ConversationTurn, InterviewContext
+from .topic_service import determine_topics
+from .tracing import Tracer
+
+logger = logging.getLogger(__name__)
+
+provider_clients = ProviderClients(settings)
+tracer = Tracer(settings)
+
+LLM_REQUEST_DURATION = registry.histogram(
+    "llm_request_duration_seconds",
+    "Duration of a single LLM provider request attempt.",
+    ("provider", "model"),
+)
+LLM_TIME_TO_FIRST_TOKEN = registry.histogram(
+    "llm_time_to_first_token_seconds",
+    "Time from sending a streamed LLM request to its first content fragment.",
+    ("provider", "model"),
+)
+LLM_ERRORS = registry.counter(
+    "llm_errors",
+    "Failed LLM provider request attempts by error class.",
+    ("provider", "error"),
+)
+QUESTION_BANK_SERVED = registry.counter(
+    "question_bank_served",
+    "Questions answered from the offline question bank, by reason.",
+    ("reason",),
+)
+
+
+def build_messages(
+    context: InterviewContext, history: Iterable[ConversationTurn]
+) -> List[dict]:
+    """Build the chat ``messages`` list sent to the provider.
+
+    ``history`` only needs ``role`` and ``message`` attributes, so a
+    session's ``TurnLog`` is read as-is instead of being converted to models.
+    """
+
+    system_prompt = (
+        "You are an AI technical interviewer. "
+        f"The job description is: {context.job_description}. "
+        "Ask the candidate the next question based on the conversation so far."
+    )
+
+    messages = [{"role": "system", "content": system_prompt}]
+    for turn in history:
+        role = "user" if turn.role == "candidate" else "assistant"
+        messages.append({"role": role, "content": turn.message})
+    return messages
+
+
+def prepare_context(context: InterviewContext) -> InterviewContext:
+    """Return ``context`` compacted for prompting (see ``interview_core.context_preprocessor``).
+
+    Callers compact a context once, when a session or posting starts, and
+    keep the result. Compaction is memoized on the text as well.
+    """
+
+    if not settings.context_preprocessing:
+        return context
+    job_description, candidate_resume = compact_context(
+        context.job_description,
+        context.candidate_resume,
+        settings.context_job_description_max_tokens,
+        settings.context_resume_max_tokens,
+    )
+    return context.model_copy(
+        update={"job_description": job_description, "candidate_resume": candidate_resume}
+    )
+
+
+def _provider_request(
+    provider: str, messages: List[dict], stream: bool = False
+) -> Tuple[str, dict, dict]:
+    """Return the URL, headers and payload for a chat completion request."""
+
+    if provider == "openai":
+        payload = {"model": settings.openai_model, "messages": messages}
+        if stream:
+            payload["stream"] = True
+        headers = {"Authorization": f"Bearer {settings.openai_api_key}"}
+        url = "https://api.openai.com/v1/chat/completions"
+    elif provider == "local":
+        payload = {"model": "google/gemma-3-1b", "messages": messages, "stream": stream}
+        headers = {"Content-Type": "application/json"}
+        url = settings.local_llm_url
+        if not url:
+            raise ValueError("local_llm_url must be configured for local LLM provider")
+        if not url.startswith(("http://", "https://")):
+            url = f"http://{url}"
+    else:
+        raise ValueError(f"Unsupported LLM provider: {provider}")
+    return url, headers, payload
+
+
+def _completion_text(data: dict) -> str:
+    return data["choices"][0]["message"]["content"].strip()
+
+
+async def _send_local_batch(payloads: List[dict]) -> List[Union[str, BaseException]]:
+    """Send a batch of chat completion payloads to the local LLM server.
+
+    With ``local_llm_batch_url`` set, the whole batch is posted as a JSON
+    array and the server must answer with an array of completions in the
+    same order. Otherwise the requests are released together over the pooled
+    client, so a server with continuous batching schedules them as one batch.
+    """
+
+    client = provider_clients.get("local")
+    headers = {"Content-Type": "application/json"}
+    if settings.local_llm_batch_url:
+        response = await client.post(settings.local_llm_batch_url, headers=headers, json=payloads)
+        response.raise_for_status()
+        return [_completion_text(data) for data in response.json()]
+
+    async def one(payload: dict) -> str:
+        response = await client.post(settings.local_llm_url, headers=headers, json=payload)
+        response.raise_for_status()
+        return _completion_text(response.json())
+
+    return await asyncio.gather(*(one(p) for p in payloads), return_exceptions=True)
+
+
+local_batcher = BatchDispatcher(
+    _send_local_batch,
+    max_size=settings.llm_batch_max_size,
+    max_wait=settings.llm_batch_max_wait_ms / 1000,
+)
+
+
+def _cache_key(messages: List[dict]) -> str:
+    """Key completions on the routed providers and models, not the one that answered."""
+
+    providers = provider_router.providers()
+    models = [_provider_request(p, messages)[2]["model"] for p in providers]
+    return completion_key(",".join(providers), ",".join(models), messages)
+
+
+async def _call_provider(provider: str, messages: List[dict], background: bool = False) -> str:
+    url, headers, payload = _provider_request(provider, messages)
+
+    async def send() -> str:
+        attributes = {"provider": provider, "model": payload["model"]}
+        with tracer.span("llm.request", attributes) as span:
+            queued = time.perf_counter()
+            async with admission_control.limiter(provider).slot(background):
+                start = time.perf_counter()
+                span.set_attribute("queue_wait_ms", round((start - queued) * 1000, 3))
+                try:
+                    if provider == "local" and settings.llm_batch_enabled:
+                        content = await local_batcher.submit(payload)
+                    else:
+                        client = provider_clients.get(provider)
+                        response = await client.post(url, headers=headers, json=payload)
+                        response.raise_for_status()
+                        content = _completion_text(response.json())
+                except Exception as exc:
+                    LLM_ERRORS.inc(provider, type(exc).__name__)
+                    raise
+                LLM_REQUEST_DURATION.observe(
+                    time.perf_counter() - start, provider, payload["model"]
+                )
+                return content
+
+    # A failed background call is not retried; its caller can try again later
+    return await call_with_retries(provider, send, attempts=1 if background else None)
+
+
+async def _complete(messages: List[dict], use_cache: bool = True, background: bool = False) -> str:
+    """Request a chat completion, consulting the completion cache first.
+
+    A ``background`` completion yields admission slots to live calls, is not
+    hedged and is tried once.
+    """
+
+    cache_key = None
+    if use_cache and completion_cache.enabled:
+        cache_key = _cache_key(messages)
+        cached = await completion_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    if background:
+        content = await _call_provider(provider_router.choose(), messages, background=True)
+    else:
+        content = await provider_router.call(lambda provider: _call_provider(provider, messages))
+    if cache_key is not None:
+        await completion_cache.set(cache_key, content)
+    return content
+
+
+async def summarize_turns(previous_summary: Optional[str], turns: List[dict]) -> str:
+    """Fold ``turns`` into a running summary of the interview.
+
+    Summaries run in the background, so they yield admission slots to live
+    turns and a failed one is simply retried on a later turn.
+    """
+
+    transcript = "\n".join(
+        f"{'Candidate' if turn['role'] == 'user' else 'Interviewer'}: {turn['content']}"
+        for turn in turns
+    )
+    prompt = (
+        "Summarize this technical interview so far in at most "
+        f"{settings.llm_summary_max_words} words. Keep the topics covered, the "
+        "candidate's key claims and any weaknesses worth probing."
+    )
+    if previous_summary:
+        prompt += f" Summary so far: {previous_summary}"
+    messages = [
+        {"role": "system", "content": prompt},
+        {"role": "user", "content": transcript},
+    ]
+    return await _complete(messages, background=True)
+
+
+context_window = ContextWindow(summarize_turns)
+
+
+async def _bank_question(
+    context: InterviewContext, history: Iterable[ConversationTurn], reason: str
+) -> Optional[str]:
+    bank = get_question_bank()
+    if bank is None:
+        return None
+    question = bank.pick(await determine_topics(context), history)
+    if question is not None:
+        QUESTION_BANK_SERVED.inc(reason)
+    return question
+
+
+async def generate_next_question(
+    context: InterviewContext,
+    history: Iterable[ConversationTurn],
+    use_cache: bool = True,
+) -> str:
+    """Generate the next interview question using the configured LLM.
+
+    The history is fitted to the configured token budget before sending and
+    the request is routed to the fastest healthy provider. Provider calls
+    pass through the provider's admission limiter and raise
+    ``ProviderSaturated`` when its wait queue is full. Completions are
+    memoized on the exact prompt when a cache backend is configured; pass
+    ``use_cache=False`` to always call the provider.
+
+    With a question bank configured, a question not yet asked is served
+    from the bank when the LLM call fails or misses
+    ``question_bank_deadline``, and in fast mode before calling the LLM at
+    all. The error is raised only when the bank has no match.
+    """
+
+    if settings.question_bank_fast_mode:
+        question = await _bank_question(context, history, "fast_mode")
+        if question is not None:
+            return question
+    messages = context_window.fit(build_messages(context, history))
+    if get_question_bank() is None:
+        return await _complete(messages, use_cache)
+    try:
+        if settings.question_bank_deadline > 0:
+            return await asyncio.wait_for(
+                _complete(messages, use_cache), settings.question_bank_deadline
+            )
+        return await _complete(messages, use_cache)
+    except Exception as exc:
+        reason = "deadline" if isinstance(exc, asyncio.TimeoutError) else "error"
+        question = await _bank_question(context, history, reason)
+        if question is None:
+            raise
+        logger.warning("Serving a bank question after LLM %s: %r", reason, exc)
+        return question
+
+
+async def generate_topic_question(context: InterviewContext, topic: str) -> str:
+    """Generate a self-contained question on ``topic`` for the question bank."""
+
+    system_prompt = (
+        "You are an AI technical interviewer. "
+        f"The job description is: {context.job_description}. "
+        f"Ask the candidate one self-contained interview question about {topic}. "
+        "Reply with the question only."
+    )
+    return await _complete([{"role": "system", "content": system_prompt}], use_cache=False)
+
+
+async def stream_next_question(
+    context: InterviewContext,
+    history: Iterable[ConversationTurn],
+    use_cache: bool = True,
+) -> AsyncIterator[str]:
+    """Yield the next interview question incrementally as the LLM produces it.
+
+    The provider is asked for an OpenAI-compatible server-sent event stream
+    and each non-empty ``delta.content`` fragment is yielded as it arrives.
+    A cached completion is yielded as a single fragment. Streams go to the
+    fastest healthy provider but are never hedged, and are retried only
+    until the provider starts responding. A question bank question is also
+    yielded as a single fragment, in fast mode or when the stream fails
+    before its first fragment.
+    """
+
+    if settings.question_bank_fast_mode:
+        question = await _bank_question(context, history, "fast_mode")
+        if question is not None:
+            yield question
+            return
+    messages = context_window.fit(build_messages(context, history))
+
+    cache_key = None
+    if use_cache and completion_cache.enabled:
+        cache_key = _cache_key(messages)
+        cached = await completion_cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
+    provider = provider_router.choose()
+    url, headers, payload = _provider_request(provider, messages, stream=True)
+    parts = []
+    client = provider_clients.get(provider)
+    limiter = admission_control.limiter(provider)
+
+    model = payload["model"]
+    queued = admitted = time.perf_counter()
+
+    async def open_stream() -> Tuple[httpx.Response, AsyncExitStack]:
+        # Like ``_call_provider``, each attempt takes its own slot so retry
+        # backoff does not hold one; a successful attempt keeps its slot
+        # and response open until the stream is read.
+        nonlocal admitted
+        held = AsyncExitStack()
+        await held.enter_async_context(limiter.slot())
+        admitted = time.perf_counter()
+        try:
+            request = client.build_request("POST", url, headers=headers, json=payload)
+            response = await client.send(request, stream=True)
+            held.push_async_callback(response.aclose)
+            if response.is_error:
+                await response.aread()
+            response.raise_for_status()
+        except BaseException as exc:
+            if isinstance(exc, Exception):
+                LLM_ERRORS.inc(provider, type(exc).__name__)
+            await held.aclose()
+            raise
+        return response, held
+
+    try:
+        with tracer.span("llm.stream", {"provider": provider, "model": model}) as span:
+            response, held = await call_with_retries(provider, open_stream)
+            span.set_attribute("queue_wait_ms", round((admitted - queued) * 1000, 3))
+            async with held:
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[len("data:"):].strip()
+                    if data == "[DONE]":
+                        break
+                    chunk = json.loads(data)
+                    choices = chunk.get("choices") or [{}]
+                    delta = choices[0].get("delta", {}).get("content")
+                    if delta:
+                        if not parts:
+                            LLM_TIME_TO_FIRST_TOKEN.observe(
+                                time.perf_counter() - admitted, provider, model
+                            )
+                        parts.append(delta)
+                        yield delta
+            finished = time.perf_counter()
+            LLM_REQUEST_DURATION.observe(finished - admitted, provider, model)
+        # Measured like ``provider_router.call``: queueing, retries and the
+        # whole response, so streamed and plain calls rank providers alike
+        provider_router.record_latency(provider, finished - queued)
+    except (httpx.HTTPError, CircuitOpen) as exc:
+        provider_router.record_failure(provider)
+        question = None if parts else await _bank_question(context, history, "error")
+        if question is None:
+            raise
+        logger.warning("Serving a bank question after LLM stream error: %r", exc)
+        yield question
+        return
+
+    if cache_key is not None:
+        await completion_cache.set(cache_key, "".join(parts).strip())
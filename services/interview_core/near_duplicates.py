@@ -0,0 +1,117 @@
+"""MinHash/LSH index for finding near-identical texts."""
+
+import random
+import re
+import zlib
+from collections import OrderedDict, defaultdict
+from typing import Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+Key = TypeVar("Key", bound=Hashable)
+
+_TOKEN = re.compile(r"\w+")
+# Mersenne prime for the universal hash family ``(a * x + b) % P``
+_PRIME = (1 << 61) - 1
+
+
+def shingles(text: str, size: int = 3) -> set:
+    """Word ``size``-grams of ``text`` after lowercasing and dropping punctuation."""
+
+    tokens = _TOKEN.findall(text.lower())
+    if len(tokens) <= size:
+        return {" ".join(tokens)}
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+class NearDuplicateIndex(Generic[Key]):
+    """Find the indexed text most similar to a query.
+
+    Each text is reduced to a MinHash signature of ``num_perm`` values, whose
+    agreement estimates the Jaccard similarity of the word shingles. The
+    signature is split into ``bands`` and each band is hashed into a bucket,
+    so a query only compares against texts sharing a bucket: lookup cost
+    depends on the number of near matches, not on the size of the index.
+    With the defaults (32 bands of 4 rows), texts at similarity 0.8 share a
+    bucket with near certainty while unrelated texts rarely do.
+
+    Computing a signature costs tens of milliseconds for a long posting, and
+    the same text tends to be queried repeatedly (every session for a
+    posting), so the last ``memo_size`` signatures are kept by text.
+    """
+
+    def __init__(
+        self, num_perm: int = 128, bands: int = 32, seed: int = 1, memo_size: int = 256
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)
+        ]
+        self._buckets: List[Dict[tuple, List[Key]]] = [defaultdict(list) for _ in range(bands)]
+        self._signatures: Dict[Key, Tuple[int, ...]] = {}
+        self._memo_size = memo_size
+        self._memo: "OrderedDict[str, Tuple[int, ...]]" = OrderedDict()
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        signature = self._memo.get(text)
+        if signature is not None:
+            self._memo.move_to_end(text)
+            return signature
+        # CRC32 rather than ``hash()`` so signatures do not vary between processes
+        hashes = [zlib.crc32(shingle.encode("utf-8")) for shingle in shingles(text)]
+        signature = tuple(min([(a * h + b) % _PRIME for h in hashes]) for a, b in self._perms)
+        if self._memo_size > 0:
+            self._memo[text] = signature
+            if len(self._memo) > self._memo_size:
+                self._memo.popitem(last=False)
+        return signature
+
+    def add(self, key: Key, text: str) -> None:
+        """Index ``text`` under ``key``, replacing any text already indexed for it."""
+
+        signature = self.signature(text)
+        if self._signatures.get(key) == signature:
+            return
+        self.remove(key)
+        self._signatures[key] = signature
+        for band, bucket in zip(self._bands(signature), self._buckets):
+            bucket[band].append(key)
+
+    def remove(self, key: Key) -> None:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band, bucket in zip(self._bands(signature), self._buckets):
+            keys = bucket[band]
+            keys.remove(key)
+            if not keys:
+                del bucket[band]
+
+    def query(self, text: str, threshold: float) -> Optional[Tuple[Key, float]]:
+        """Return the most similar indexed key at or above ``threshold``.
+
+        The result is the key and its estimated similarity, or ``None``.
+        """
+
+        if not self._signatures:
+            return None
+        signature = self.signature(text)
+        candidates = set()
+        for band, bucket in zip(self._bands(signature), self._buckets):
+            candidates.update(bucket.get(band, ()))
+        best = None
+        for key in candidates:
+            other = self._signatures[key]
+            similarity = sum(x == y for x, y in zip(signature, other)) / len(signature)
+            if similarity >= threshold and (best is None or similarity > best[1]):
+                best = (key, similarity)
+        return best
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _bands(self, signature: Tuple[int, ...]) -> List[tuple]:
+        rows = self.rows
+        return [signature[i * rows:(i + 1) * rows] for i in range(self.bands)]
@@ -0,0 +1,93 @@
+"""Pooled HTTP clients shared by every request to an LLM provider."""
+
+import logging
+from typing import Dict
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderClients:
+    """Keep one long-lived ``httpx.AsyncClient`` per LLM provider.
+
+    Clients are opened in the application lifespan (or lazily on first use)
+    so interview turns reuse keep-alive connections instead of paying a new
+    TCP/TLS handshake on every request. ``settings`` is the owning service's
+    configuration, read for ``llm_provider``, ``llm_timeout`` and the
+    ``llm_*`` pool options.
+    """
+
+    def __init__(self, settings) -> None:
+        self.settings = settings
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def get(self, provider: str) -> httpx.AsyncClient:
+        """Return the pooled client for ``provider``, creating it if needed."""
+
+        client = self._clients.get(provider)
+        if client is None:
+            client = self._create_client()
+            self._clients[provider] = client
+        return client
+
+    async def startup(self) -> None:
+        """Open the client for the configured provider ahead of traffic."""
+
+        self.get(self.settings.llm_provider.lower())
+
+    async def aclose(self) -> None:
+        """Close every pooled client and forget it."""
+
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Report connection pool usage per provider."""
+
+        return {
+            provider: _pool_stats(client) for provider, client in self._clients.items()
+        }
+
+    def _create_client(self) -> httpx.AsyncClient:
+        settings = self.settings
+        limits = httpx.Limits(
+            max_connections=settings.llm_max_connections,
+            max_keepalive_connections=settings.llm_max_keepalive_connections,
+            keepalive_expiry=settings.llm_keepalive_expiry,
+        )
+        http2 = settings.llm_http2
+        if http2:
+            try:
+                import h2  # noqa: F401
+            except ModuleNotFoundError:
+                logger.warning(
+                    "LLM_HTTP2 set but the 'h2' package is not installed; "
+                    "falling back to HTTP/1.1"
+                )
+                http2 = False
+        return httpx.AsyncClient(timeout=settings.llm_timeout, limits=limits, http2=http2)
+
+
+def _pool_stats(client: httpx.AsyncClient) -> Dict[str, int]:
+    """Read connection counts from the client's underlying connection pool.
+
+    httpx exposes no public pool API, so this reads httpx and httpcore
+    internals; httpx is pinned below 0.29 and
+    ``test_pool_stats_track_a_real_connection_pool`` fails if they move.
+    """
+
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = list(getattr(pool, "connections", []))
+    requests = list(getattr(pool, "_requests", []))
+    idle = sum(1 for connection in connections if connection.is_idle())
+    waiting = sum(1 for request in requests if request.is_queued())
+    return {
+        "connections": len(connections),
+        "in_use": len(connections) - idle,
+        "idle": idle,
+        "waiting": waiting,
+    }
+
@@ -0,0 +1,195 @@
+"""Latency-aware routing and request hedging across LLM providers."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, TypeVar
+
+from .config import settings
+from .resilience import circuit_breakers
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Rolling latency and error record for one provider."""
+
+    def __init__(self, window: int, alpha: float = 0.2) -> None:
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.alpha = alpha
+        self.ewma: Optional[float] = None
+        self.requests = 0
+        self.errors = 0
+
+    def observe(self, seconds: float) -> None:
+        self.requests += 1
+        self.samples.append(seconds)
+        self.ewma = seconds if self.ewma is None else self.ewma + self.alpha * (seconds - self.ewma)
+
+    def record_failure(self) -> None:
+        self.requests += 1
+        self.errors += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def stats(self) -> dict:
+        def ms(value: Optional[float]) -> Optional[float]:
+            return None if value is None else round(value * 1000, 2)
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "samples": len(self.samples),
+            "ewma_ms": ms(self.ewma),
+            "p50_ms": ms(self.percentile(50)),
+            "p95_ms": ms(self.percentile(95)),
+            "p99_ms": ms(self.percentile(99)),
+        }
+
+
+class ProviderRouter:
+    """Send each request to the fastest healthy provider, optionally hedged.
+
+    ``settings.llm_providers`` lists the providers to route between; when it
+    is empty only ``settings.llm_provider`` is used. Providers without
+    latency samples rank first so they are measured early, and providers
+    whose circuit breaker is open rank last. With hedging on, a duplicate
+    request goes to the next-best provider (or the same one when it is the
+    only provider) once the primary has been outstanding longer than its
+    ``llm_hedge_percentile`` latency. The first response wins and
+    the other request is cancelled, so only the slowest few percent of
+    requests cost a second call. A primary that fails outright, before any
+    hedge was sent, is retried once on the next-best provider.
+    """
+
+    def __init__(self) -> None:
+        self._trackers: Dict[str, LatencyTracker] = {}
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+
+    def providers(self) -> List[str]:
+        configured = [p.strip().lower() for p in settings.llm_providers.split(",") if p.strip()]
+        return configured or [settings.llm_provider.lower()]
+
+    def tracker(self, provider: str) -> LatencyTracker:
+        tracker = self._trackers.get(provider)
+        if tracker is None:
+            tracker = LatencyTracker(settings.llm_latency_window)
+            self._trackers[provider] = tracker
+        return tracker
+
+    def ranked(self) -> List[str]:
+        """Return providers from fastest to slowest, healthy ones first."""
+
+        providers = self.providers()
+        order = {provider: index for index, provider in enumerate(providers)}
+
+        def key(provider: str) -> tuple:
+            healthy = circuit_breakers.get(provider).available()
+            return (not healthy, self.tracker(provider).ewma or 0.0, order[provider])
+
+        return sorted(providers, key=key)
+
+    def choose(self) -> str:
+        return self.ranked()[0]
+
+    async def call(self, send: Callable[[str], Awaitable[T]]) -> T:
+        """Run ``send(provider)`` on the best provider, hedging if configured."""
+
+        ranked = self.ranked()
+        primary = ranked[0]
+        delay = self._hedge_delay(primary)
+        if delay is None:
+            try:
+                return await self._attempt(primary, send)
+            except Exception as exc:
+                return await self._fail_over(ranked, send, exc)
+
+        first = asyncio.create_task(self._attempt(primary, send))
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        if done:
+            if first.exception() is None:
+                return first.result()
+            return await self._fail_over(ranked, send, first.exception())
+
+        backup = ranked[1] if len(ranked) > 1 else primary
+        self.hedges += 1
+        logger.info("Hedging slow %s request to %s after %.3fs", primary, backup, delay)
+        second = asyncio.create_task(self._attempt(backup, send))
+        pending = {first, second}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is second:
+                            self.hedge_wins += 1
+                        return task.result()
+            return first.result()
+        finally:
+            for task in (first, second):
+                task.cancel()
+
+    def record_failure(self, provider: str) -> None:
+        self.tracker(provider).record_failure()
+
+    def record_latency(self, provider: str, seconds: float) -> None:
+        """Record a successful call made outside ``call``, such as a stream."""
+
+        self.tracker(provider).observe(seconds)
+
+    def stats(self) -> dict:
+        return {
+            "providers": {
+                p: {
+                    "healthy": circuit_breakers.get(p).available(),
+                    **self.tracker(p).stats(),
+                }
+                for p in self.providers()
+            },
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "failovers": self.failovers,
+        }
+
+    def _hedge_delay(self, provider: str) -> Optional[float]:
+        if not settings.llm_hedge_enabled:
+            return None
+        tracker = self.tracker(provider)
+        if len(tracker.samples) < settings.llm_hedge_min_samples:
+            return None
+        return tracker.percentile(settings.llm_hedge_percentile)
+
+    async def _fail_over(
+        self, ranked: List[str], send: Callable[[str], Awaitable[T]], error: BaseException
+    ) -> T:
+        """Retry a failed primary request on the next-best provider, if any."""
+
+        if len(ranked) < 2:
+            raise error
+        logger.warning("%s request failed (%s); failing over to %s", ranked[0], error, ranked[1])
+        self.failovers += 1
+        return await self._attempt(ranked[1], send)
+
+    async def _attempt(self, provider: str, send: Callable[[str], Awaitable[T]]) -> T:
+        start = time.perf_counter()
+        try:
+            result = await send(provider)
+        except Exception:
+            self.tracker(provider).record_failure()
+            raise
+        self.tracker(provider).observe(time.perf_counter() - start)
+        return result
+
+
+provider_router = ProviderRouter()
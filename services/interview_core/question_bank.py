@@ -0,0 +1,100 @@
+"""Pre-generated interview questions served without calling an LLM."""
+
+import json
+import logging
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .config import settings
+from .schemas import ConversationTurn
+
+logger = logging.getLogger(__name__)
+
+
+class QuestionBank:
+    """Questions indexed by topic, as produced by ``build_question_bank.py``.
+
+    The bank is a JSON Lines file with one ``{"topic": ..., "question": ...}``
+    object per line, topics being those returned by ``determine_topics``.
+    Picking a question is a dictionary lookup per topic plus a set of the
+    questions already asked in the session, so it takes microseconds.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, str]] = ()) -> None:
+        self._by_topic: Dict[str, List[str]] = defaultdict(list)
+        self._seen = set()
+        for topic, question in entries:
+            self.add(topic, question)
+
+    @classmethod
+    def from_file(cls, path: Path) -> "QuestionBank":
+        return cls(read_entries(path))
+
+    def add(self, topic: str, question: str) -> bool:
+        """Add a question unless the topic already has it; return whether it was added."""
+
+        if (topic, question) in self._seen:
+            return False
+        self._seen.add((topic, question))
+        self._by_topic[topic].append(question)
+        return True
+
+    def questions(self, topic: str) -> List[str]:
+        return list(self._by_topic.get(topic, ()))
+
+    def topics(self) -> List[str]:
+        return list(self._by_topic)
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def pick(
+        self, topics: List[str], history: Iterable[ConversationTurn]
+    ) -> Optional[str]:
+        """Return a question on one of ``topics`` not yet asked in ``history``.
+
+        Successive turns rotate through the topics. Falls back to the
+        ``general`` topic when none of the topics is in the bank, and
+        returns ``None`` when every matching question was already asked.
+        """
+
+        asked = {turn.message for turn in history if turn.role == "interviewer"}
+        candidates = [topic for topic in topics if topic in self._by_topic]
+        if not candidates and "general" in self._by_topic:
+            candidates = ["general"]
+        start = len(asked)
+        for offset in range(len(candidates)):
+            topic = candidates[(start + offset) % len(candidates)]
+            for question in self._by_topic[topic]:
+                if question not in asked:
+                    return question
+        return None
+
+
+def read_entries(path: Path) -> Iterator[Tuple[str, str]]:
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                entry = json.loads(line)
+                yield entry["topic"], entry["question"]
+
+
+@lru_cache(maxsize=1)
+def get_question_bank() -> Optional[QuestionBank]:
+    """Return the configured question bank, or ``None`` when there is none.
+
+    A missing file is logged and treated as no bank, so the service still
+    starts before a bank has been built.
+    """
+
+    if not settings.question_bank_path:
+        return None
+    path = Path(settings.question_bank_path)
+    if not path.exists():
+        logger.warning("Question bank %s not found; serving from the LLM only", path)
+        return None
+    bank = QuestionBank.from_file(path)
+    logger.info("Loaded %d questions on %d topics from %s", len(bank), len(bank.topics()), path)
+    return bank
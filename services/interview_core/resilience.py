@@ -0,0 +1,236 @@
+"""Retries with backoff and per-provider circuit breakers for LLM calls."""
+
+import asyncio
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+import httpx
+
+from .config import settings
+from .metrics import registry
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Statuses that signal a transient provider problem worth retrying
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+RETRIES = registry.counter(
+    "llm_retries", "LLM request attempts retried after a transient error.", ("provider",)
+)
+TRANSITIONS = registry.counter(
+    "llm_circuit_transitions",
+    "Circuit breaker state transitions.",
+    ("provider", "from_state", "to_state"),
+)
+
+
+class CircuitOpen(Exception):
+    """Raised without calling the provider while its circuit is open."""
+
+    def __init__(self, provider: str, retry_after: float) -> None:
+        super().__init__(f"Circuit for LLM provider '{provider}' is open")
+        self.provider = provider
+        self.retry_after = retry_after
+
+
+def is_retryable(exc: Exception) -> bool:
+    """Return ``True`` for errors that indicate a transient provider failure."""
+
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(exc, httpx.TransportError)
+
+
+def retry_after_seconds(exc: Exception) -> Optional[float]:
+    """Read a ``Retry-After`` header (seconds or HTTP date) from an HTTP error."""
+
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return None
+    value = exc.response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class CircuitBreaker:
+    """Stop calling a provider after repeated failures, then probe for recovery.
+
+    ``failure_threshold`` consecutive failures open the circuit and calls
+    fail immediately with ``CircuitOpen``. After ``reset_timeout`` seconds a
+    single probe call is let through (half-open): success closes the circuit
+    and failure opens it again. Every transition is logged and counted.
+    """
+
+    def __init__(self, provider: str, failure_threshold: int, reset_timeout: float) -> None:
+        self.provider = provider
+        self.failure_threshold = max(failure_threshold, 1)
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self.rejected = 0
+        self.transitions: Dict[str, int] = {}
+
+    def available(self) -> bool:
+        """Return ``True`` if a call would currently be let through."""
+
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN:
+            return self._retry_in() <= 0
+        return not self._probing
+
+    def before_call(self) -> None:
+        """Admit a call or raise ``CircuitOpen``."""
+
+        if self.state == OPEN and self._retry_in() <= 0:
+            self._transition(HALF_OPEN)
+        if self.state == OPEN or (self.state == HALF_OPEN and self._probing):
+            self.rejected += 1
+            raise CircuitOpen(self.provider, max(self._retry_in(), 0.0))
+        if self.state == HALF_OPEN:
+            self._probing = True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._probing = False
+        if self.state != CLOSED:
+            self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probing = False
+        if self.state == HALF_OPEN or (
+            self.state == CLOSED and self.failures >= self.failure_threshold
+        ):
+            self.opened_at = time.monotonic()
+            self._transition(OPEN)
+
+    def release(self) -> None:
+        """End a call whose outcome says nothing about provider health."""
+
+        self._probing = False
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "rejected": self.rejected,
+            "retry_in": max(self._retry_in(), 0.0) if self.state == OPEN else 0.0,
+            "transitions": dict(self.transitions),
+        }
+
+    def _retry_in(self) -> float:
+        return self.opened_at + self.reset_timeout - time.monotonic()
+
+    def _transition(self, state: str) -> None:
+        name = f"{self.state}->{state}"
+        self.transitions[name] = self.transitions.get(name, 0) + 1
+        TRANSITIONS.inc(self.provider, self.state, state)
+        log = logger.warning if state == OPEN else logger.info
+        log("Circuit for LLM provider %s: %s", self.provider, name)
+        self.state = state
+
+
+class CircuitBreakers:
+    """Create one ``CircuitBreaker`` per provider from the settings."""
+
+    def __init__(self) -> None:
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, provider: str) -> CircuitBreaker:
+        breaker = self._breakers.get(provider)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                provider,
+                settings.llm_breaker_failure_threshold,
+                settings.llm_breaker_reset_timeout,
+            )
+            self._breakers[provider] = breaker
+        return breaker
+
+    def stats(self) -> Dict[str, dict]:
+        return {provider: breaker.stats() for provider, breaker in self._breakers.items()}
+
+
+circuit_breakers = CircuitBreakers()
+
+registry.gauge(
+    "llm_circuit_open",
+    "1 while a provider's circuit breaker is open or half-open.",
+    ("provider",),
+    collect=lambda: {
+        (p,): float(s["state"] != CLOSED) for p, s in circuit_breakers.stats().items()
+    },
+)
+
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff for the given retry number (1-based)."""
+
+    ceiling = min(settings.llm_retry_max_delay, settings.llm_retry_base_delay * 2 ** (attempt - 1))
+    return random.uniform(0, ceiling)
+
+
+async def call_with_retries(
+    provider: str, send: Callable[[], Awaitable[T]], attempts: Optional[int] = None
+) -> T:
+    """Call ``send`` through the provider's circuit breaker, retrying transient errors.
+
+    Retries stop after ``attempts`` attempts (default ``llm_retry_attempts``),
+    or when the next wait would pass the ``llm_retry_deadline`` measured from
+    the first attempt. A ``Retry-After`` header from the provider replaces the
+    backoff delay.
+    """
+
+    breaker = circuit_breakers.get(provider)
+    deadline = time.monotonic() + settings.llm_retry_deadline
+    attempt = 0
+    while True:
+        breaker.before_call()
+        attempt += 1
+        try:
+            result = await send()
+        except Exception as exc:
+            if is_retryable(exc):
+                breaker.record_failure()
+            elif isinstance(exc, httpx.HTTPStatusError):
+                breaker.record_success()
+            else:
+                breaker.release()
+            if not is_retryable(exc) or attempt >= (attempts or settings.llm_retry_attempts):
+                raise
+            delay = retry_after_seconds(exc)
+            if delay is None:
+                delay = backoff_delay(attempt)
+            if time.monotonic() + delay >= deadline:
+                raise
+            logger.info(
+                "Retrying %s after %s in %.2fs (attempt %d)", provider, exc, delay, attempt
+            )
+            RETRIES.inc(provider)
+            await asyncio.sleep(delay)
+            continue
+        except BaseException:
+            breaker.release()
+            raise
+        breaker.record_success()
+        return result
@@ -0,0 +1,19 @@
+"""Pydantic models the interview engine works with."""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class InterviewContext(BaseModel):
+    """Context for the interview such as job description."""
+
+    job_description: str
+    candidate_resume: Optional[str] = None
+
+
+class ConversationTurn(BaseModel):
+    """A single turn in the interview conversation."""
+
+    role: str
+    message: str
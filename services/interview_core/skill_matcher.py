@@ -0,0 +1,113 @@
+"""Single-pass matching of taxonomy skills and their aliases in free text."""
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+
+DEFAULT_TAXONOMY_PATH = Path(__file__).resolve().parent / "data" / "skills_taxonomy.json"
+
+# Words are runs of letters/digits with optional trailing ``+``/``#`` (c++, c#).
+# ``.``, ``/`` and ``-`` become tokens of their own only when glued to the next
+# word, so "node.js", "ci/cd" and "front-end" keep their shape while
+# sentence punctuation is dropped.
+_TOKEN_RE = re.compile(r"[a-z0-9]+[+#]*|[./\-](?=[a-z0-9])")
+
+_TERMINAL = ""
+
+
+def tokenize(text: str) -> List[str]:
+    """Split ``text`` into lowercase match tokens."""
+
+    return _TOKEN_RE.findall(text.lower())
+
+
+class SkillMatcher:
+    """Token trie over every skill name and alias in a taxonomy.
+
+    Matching walks the text once, taking the longest term that starts at each
+    token and skipping past it. The work per token is bounded by the longest
+    term (a handful of tokens), so matching is linear in the size of the text
+    and independent of how many terms the taxonomy holds. Because terms are
+    compared token by token they only match on word boundaries: "java" does
+    not match inside "javascript".
+    """
+
+    def __init__(self, skills: Iterable[dict]) -> None:
+        self._root: Dict[str, dict] = {}
+        self.term_count = 0
+        for skill in skills:
+            name = skill["name"]
+            terms = list(skill.get("aliases", []))
+            if skill.get("match_name", True):
+                terms.append(name)
+            for term in terms:
+                self._add(term, name)
+
+    @classmethod
+    def from_file(cls, path: Path) -> "SkillMatcher":
+        """Compile a matcher from a JSON taxonomy file."""
+
+        with open(path, encoding="utf-8") as fh:
+            taxonomy = json.load(fh)
+        return cls(taxonomy["skills"])
+
+    def _add(self, term: str, name: str) -> None:
+        tokens = tokenize(term)
+        if not tokens:
+            return
+        node = self._root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        if _TERMINAL not in node:
+            self.term_count += 1
+        node[_TERMINAL] = name
+
+    def find(self, text: str) -> List[Tuple[int, str]]:
+        """Return ``(token_index, skill)`` for every leftmost-longest match."""
+
+        tokens = tokenize(text)
+        root = self._root
+        matches = []
+        i = 0
+        n = len(tokens)
+        while i < n:
+            node = root.get(tokens[i])
+            if node is None:
+                i += 1
+                continue
+            j = i + 1
+            end = j if _TERMINAL in node else 0
+            skill = node.get(_TERMINAL)
+            while j < n:
+                node = node.get(tokens[j])
+                if node is None:
+                    break
+                j += 1
+                if _TERMINAL in node:
+                    end, skill = j, node[_TERMINAL]
+            if end:
+                matches.append((i, skill))
+                i = end
+            else:
+                i += 1
+        return matches
+
+    def match(self, text: str) -> List[str]:
+        """Return the distinct skills found in ``text`` in order of appearance."""
+
+        return list(dict.fromkeys(skill for _, skill in self.find(text)))
+
+
+@lru_cache(maxsize=4)
+def get_skill_matcher(taxonomy_path: str = "") -> SkillMatcher:
+    """Return the process-wide matcher for a taxonomy, compiling it on first use.
+
+    An empty ``taxonomy_path`` selects the bundled taxonomy; services pass
+    their ``topic_taxonomy_path`` setting.
+    """
+
+    path = Path(taxonomy_path) if taxonomy_path else DEFAULT_TAXONOMY_PATH
+    return SkillMatcher.from_file(path)
@@ -0,0 +1,14 @@
+"""Tokenizer-free token estimates shared by prompt compaction and the history window."""
+
+import math
+import re
+
+# Rough BPE approximation: every word or symbol costs at least one token and
+# long words cost one token per four characters.
+_WORD_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens ``text`` occupies without a tokenizer."""
+
+    return sum(math.ceil(len(word) / 4) for word in _WORD_RE.findall(text))
@@ -0,0 +1,20 @@
+"""Topic inference service for interview preparation."""
+from typing import List
+
+from .config import settings
+from .schemas import InterviewContext
+from .skill_matcher import get_skill_matcher
+
+
+async def determine_topics(context: InterviewContext) -> List[str]:
+    """Infer interview topics from job description and resume.
+
+    Skills from the configured taxonomy, including their synonyms and
+    aliases, are matched on word boundaries in a single pass over the text.
+    A real implementation could additionally call an LLM to perform deeper
+    analysis.
+    """
+
+    text = f"{context.job_description} {context.candidate_resume or ''}"
+    topics = get_skill_matcher(settings.topic_taxonomy_path).match(text)
+    return topics or ["general"]
@@ -0,0 +1,307 @@
+"""Lightweight distributed tracing with W3C ``traceparent`` propagation.
+
+A span times one step of a request and records which span it ran inside.
+The current span lives in a ``ContextVar``, so nesting follows ``await``
+chains and tasks without passing anything around. Outgoing requests carry
+the current span in a ``traceparent`` header, and ``TracingMiddleware``
+continues that trace in the receiving service. Sampling is decided once,
+where a trace starts. Finished spans are buffered in memory and written in
+batches off the event loop, either to a JSONL file or to an OTLP/HTTP
+collector. With ``trace_sample_rate`` at 0 (the default), ``span`` does
+nothing but read one setting.
+
+Each service creates one ``Tracer`` from its own settings, which supply the
+``trace_*`` options, including the service name recorded on its spans.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from .metrics import route_template
+
+
+logger = logging.getLogger(__name__)
+
+TRACEPARENT = "traceparent"
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+class Span:
+    """One timed operation within a trace."""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "sampled",
+        "start_ns", "end_ns", "attributes", "error",
+    )
+
+    def __init__(
+        self, name: str, trace_id: str, parent_id: Optional[str], sampled: bool
+    ) -> None:
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.sampled = sampled
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes: Dict[str, object] = {}
+        self.error: Optional[str] = None
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def set_attribute(self, key: str, value: object) -> None:
+        if self.sampled:
+            self.attributes[key] = value
+
+    def to_dict(self, service: str) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "service": service,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+# Yielded when tracing is off so call sites never need a ``None`` check
+NOOP_SPAN = Span("", "0" * 32, None, sampled=False)
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def parse_traceparent(value: str) -> Optional[Tuple[str, str, bool]]:
+    """Return ``(trace_id, parent_span_id, sampled)`` from a header value."""
+
+    match = _TRACEPARENT_RE.match(value.strip().lower())
+    if match is None or match.group(1) == "0" * 32:
+        return None
+    return match.group(1), match.group(2), bool(int(match.group(3), 16) & 1)
+
+
+class JsonlExporter:
+    """Append one JSON object per span to a file."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def export(self, spans: List[dict]) -> None:
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.writelines(json.dumps(span) + "\n" for span in spans)
+
+
+class OtlpExporter:
+    """POST spans to an OTLP/HTTP collector using the JSON encoding."""
+
+    def __init__(self, endpoint: str) -> None:
+        self.endpoint = endpoint
+
+    def export(self, spans: List[dict]) -> None:
+        response = httpx.post(self.endpoint, json=otlp_payload(spans), timeout=5.0)
+        response.raise_for_status()
+
+
+def otlp_payload(spans: List[dict]) -> dict:
+    """Convert exported span dicts to an OTLP ``ExportTraceServiceRequest``."""
+
+    def attribute(key: str, value: object) -> dict:
+        if isinstance(value, bool):
+            return {"key": key, "value": {"boolValue": value}}
+        if isinstance(value, int):
+            return {"key": key, "value": {"intValue": str(value)}}
+        if isinstance(value, float):
+            return {"key": key, "value": {"doubleValue": value}}
+        return {"key": key, "value": {"stringValue": str(value)}}
+
+    otlp_spans = []
+    for span in spans:
+        otlp_span = {
+            "traceId": span["trace_id"],
+            "spanId": span["span_id"],
+            "name": span["name"],
+            "startTimeUnixNano": str(span["start_ns"]),
+            "endTimeUnixNano": str(span["end_ns"]),
+            "attributes": [attribute(k, v) for k, v in span["attributes"].items()],
+            "status": {"code": 2, "message": span["error"]} if span["error"] else {"code": 1},
+        }
+        if span["parent_id"]:
+            otlp_span["parentSpanId"] = span["parent_id"]
+        otlp_spans.append(otlp_span)
+    service = spans[0]["service"] if spans else ""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [attribute("service.name", service)]},
+                "scopeSpans": [{"scope": {"name": "ai-interview-flow"}, "spans": otlp_spans}],
+            }
+        ]
+    }
+
+
+def build_exporter(settings):
+    if settings.trace_exporter == "otlp":
+        return OtlpExporter(settings.trace_otlp_endpoint)
+    if settings.trace_exporter == "jsonl":
+        return JsonlExporter(settings.trace_jsonl_path)
+    raise ValueError(f"Unknown trace exporter: {settings.trace_exporter}")
+
+
+class Tracer:
+    """Create spans, propagate them in headers and export finished ones.
+
+    ``settings`` is read on every call, so changes to it apply immediately.
+    """
+
+    def __init__(self, settings) -> None:
+        self.settings = settings
+        self._buffer: List[dict] = []
+        self._exporter = None
+        self._task: Optional[asyncio.Task] = None
+        self.exported = 0
+        self.dropped = 0
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        attributes: Optional[Dict[str, object]] = None,
+        traceparent: Optional[str] = None,
+    ) -> Iterator[Span]:
+        """Time the enclosed block as a child of the current span.
+
+        Without a current span, the trace continues from ``traceparent`` if
+        one is given; otherwise a new trace starts and is sampled with
+        probability ``trace_sample_rate``.
+        """
+
+        rate = self.settings.trace_sample_rate
+        if rate <= 0:
+            yield NOOP_SPAN
+            return
+        parent = _current_span.get()
+        remote = parse_traceparent(traceparent) if traceparent else None
+        if parent is not None:
+            span = Span(name, parent.trace_id, parent.span_id, parent.sampled)
+        elif remote is not None:
+            span = Span(name, remote[0], remote[1], remote[2])
+        else:
+            span = Span(name, f"{random.getrandbits(128):032x}", None, random.random() < rate)
+        if attributes and span.sampled:
+            span.attributes.update(attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.error = type(exc).__name__
+            raise
+        finally:
+            try:
+                _current_span.reset(token)
+            except ValueError:
+                # An async generator finalized from another context.
+                pass
+            if span.sampled:
+                span.end_ns = time.time_ns()
+                self._record(span)
+
+    def headers(self) -> Dict[str, str]:
+        """Return the ``traceparent`` header for an outgoing request."""
+
+        span = _current_span.get()
+        return {TRACEPARENT: span.traceparent} if span is not None else {}
+
+    async def startup(self) -> None:
+        """Start exporting buffered spans in the background."""
+
+        if self.settings.trace_sample_rate > 0 and self._task is None:
+            self._task = asyncio.create_task(self._export_loop())
+
+    async def aclose(self) -> None:
+        """Stop the background exporter and flush what is left."""
+
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Export every buffered span in a worker thread."""
+
+        batch, self._buffer = self._buffer, []
+        if not batch:
+            return
+        if self._exporter is None:
+            self._exporter = build_exporter(self.settings)
+        try:
+            await asyncio.to_thread(self._exporter.export, batch)
+        except Exception:
+            logger.exception("Exporting %d spans failed", len(batch))
+            self.dropped += len(batch)
+            return
+        self.exported += len(batch)
+
+    def _record(self, span: Span) -> None:
+        if len(self._buffer) >= self.settings.trace_max_buffered_spans:
+            self.dropped += 1
+            return
+        self._buffer.append(span.to_dict(self.settings.trace_service_name))
+
+    async def _export_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.settings.trace_export_interval)
+            await self.flush()
+
+
+
+class TracingMiddleware:
+    """ASGI middleware opening a server span for every HTTP request.
+
+    The span continues the caller's trace from its ``traceparent`` header
+    and is named after the route template once routing has run.
+    """
+
+    def __init__(self, app, tracer: Tracer) -> None:
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or self.tracer.settings.trace_sample_rate <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or ())
+        traceparent = headers.get(TRACEPARENT.encode(), b"").decode("latin-1") or None
+        status = [500]
+
+        async def send_wrapper(message) -> None:
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        with self.tracer.span("http.server", traceparent=traceparent) as span:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = route_template(scope)
+                span.name = f"{scope['method']} {route}"
+                span.set_attribute("http.route", route)
+                span.set_attribute("http.status_code", status[0])
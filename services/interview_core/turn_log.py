@@ -0,0 +1,85 @@
+"""Compact in-memory conversation history for interview sessions."""
+
+import sys
+from typing import Iterable, Iterator, List, Union
+
+
+class Turn:
+    """One conversation turn, checked once when it is recorded.
+
+    Turns carry the same ``role`` and ``message`` attributes as the
+    ``ConversationTurn`` model, so the prompt builder reads them directly
+    without building a model per turn. Slots instead of a per-turn dict, and
+    interned role strings, keep a turn to a small fixed header plus its
+    message text.
+    """
+
+    __slots__ = ("role", "message")
+
+    def __init__(self, role: str, message: str) -> None:
+        if not isinstance(role, str) or not isinstance(message, str):
+            raise TypeError("Turn role and message must be strings")
+        self.role = sys.intern(role)
+        self.message = message
+
+    def to_dict(self) -> dict:
+        return {"role": self.role, "message": self.message}
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Turn):
+            return self.role == other.role and self.message == other.message
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Turn(role={self.role!r}, message={self.message!r})"
+
+
+def message_bytes(message: str) -> int:
+    """Size of a message as it is stored and sent, in UTF-8 bytes."""
+
+    return len(message.encode("utf-8"))
+
+
+class TurnLog:
+    """Append-only history of one interview.
+
+    ``nbytes`` is the UTF-8 size of all messages, kept up to date on append
+    so session limits and accounting need no pass over the history.
+    """
+
+    __slots__ = ("_turns", "nbytes")
+
+    def __init__(self, turns: Iterable[Union[Turn, dict]] = ()) -> None:
+        self._turns: List[Turn] = [
+            turn if isinstance(turn, Turn) else Turn(turn["role"], turn["message"])
+            for turn in turns
+        ]
+        self.nbytes = sum(message_bytes(turn.message) for turn in self._turns)
+
+    def append(self, role: str, message: str) -> Turn:
+        turn = Turn(role, message)
+        self._turns.append(turn)
+        self.nbytes += message_bytes(message)
+        return turn
+
+    def to_dicts(self, start: int = 0) -> List[dict]:
+        """Return the turns from ``start`` on as JSON-ready dicts."""
+
+        return [turn.to_dict() for turn in self._turns[start:]]
+
+    def __len__(self) -> int:
+        return len(self._turns)
+
+    def __iter__(self) -> Iterator[Turn]:
+        return iter(self._turns)
+
+    def __getitem__(self, index):
+        return self._turns[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TurnLog):
+            return self._turns == other._turns
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TurnLog({self._turns!r})"
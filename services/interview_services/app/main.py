@@ -1,19 +1,40 @@
-from fastapi import FastAPI
+import json
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
+from interview_core.batch_runner import run_batch
+from interview_core.engine import engine
+from interview_core.llm_service import provider_clients
+from interview_core.metrics import CONTENT_TYPE, MetricsMiddleware, registry
 
 from interview_services.ai_interview_service import (
     generate_next_question,
     determine_topics,
 )
+from interview_services.config import settings
 from interview_services.schemas import (
+    BatchQuestionRequest,
+    BatchTopicsRequest,
     InterviewRequest,
     InterviewResponse,
     InterviewContext,
     TopicsResponse,
 )
 
-app = FastAPI(title="Interview Service")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await engine.startup()
+    yield
+    await engine.aclose()
+
+
+app = FastAPI(title="Interview Service", lifespan=lifespan)
+
+app.add_middleware(MetricsMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -35,3 +56,52 @@ async def determine_topics_endpoint(context: InterviewContext) -> TopicsResponse
     """Infer interview topics from job description and resume."""
     topics = await determine_topics(context)
     return TopicsResponse(topics=topics)
+
+
+def _batch_response(items: list, work) -> StreamingResponse:
+    if len(items) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=413, detail=f"Batch exceeds {settings.batch_max_items} items"
+        )
+
+    async def body() -> AsyncIterator[str]:
+        async for result in run_batch(items, work, settings.batch_concurrency):
+            yield json.dumps(result) + "\n"
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+
+@app.post("/generate-question/batch")
+async def generate_question_batch(request: BatchQuestionRequest) -> StreamingResponse:
+    """Generate a question per item, streamed as NDJSON in completion order.
+
+    Each line is ``{"index": i, "question_text": "..."}`` or
+    ``{"index": i, "error": {"type": ..., "detail": ...}}``.
+    """
+
+    async def work(item: InterviewRequest) -> dict:
+        return {"question_text": await generate_next_question(item.context, item.history)}
+
+    return _batch_response(request.items, work)
+
+
+@app.post("/determine-topics/batch")
+async def determine_topics_batch(request: BatchTopicsRequest) -> StreamingResponse:
+    """Infer topics per context, streamed as ``{"index": i, "topics": [...]}`` lines."""
+
+    async def work(context: InterviewContext) -> dict:
+        return {"topics": await determine_topics(context)}
+
+    return _batch_response(request.items, work)
+
+
+@app.get("/pool-stats")
+async def pool_stats() -> Dict[str, Dict[str, int]]:
+    """Report connection pool usage for each provider client."""
+    return provider_clients.stats()
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Expose service metrics in the Prometheus text format."""
+    return Response(registry.render(), media_type=CONTENT_TYPE)
@@ -1,14 +1,15 @@
-class Settings:
-    """Simplified settings for LLM configuration."""
-    # Which LLM backend to use: "openai" or "local"
-    llm_provider: str = "local"
-    # API keys or URLs for the various providers
-    openai_api_key: str = ""
-    openai_model: str = "gpt-3.5-turbo"
-    gemini_api_key: str = ""
-    local_llm_url: str = "https://248e110186a5.ngrok-free.app/v1/chat/completions"
-    # Timeout (in seconds) for outgoing HTTP requests to LLM providers
-    llm_timeout: float = 10.0
+"""Settings of the interview service; the engine's are in ``interview_core.config``."""
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """Batch endpoint limits."""
+
+    model_config = SettingsConfigDict(extra="ignore")
+
+    # Largest batch accepted by the batch endpoints, and items run at once
+    batch_max_items: int = 1000
+    batch_concurrency: int = 8
 
 
 settings = Settings()
@@ -2,21 +2,28 @@
 from typing import Dict, List
 
 from fastapi import WebSocket
+from interview_core.engine import engine
+from interview_core.turn_log import TurnLog
 
 from .ai_interview_service import generate_next_question, determine_topics
-from .schemas import ConversationTurn, InterviewContext
+from .schemas import InterviewContext
 
 
 class ConnectionManager:
-    """Minimal connection manager for interview sessions."""
+    """Minimal connection manager for interview sessions.
+
+    The context is validated once when the session starts and each turn
+    once when it is recorded, so generating a question does not rebuild
+    models for the whole history.
+    """
 
     def __init__(self) -> None:
-        self.history: Dict[WebSocket, List[dict]] = {}
-        self.contexts: Dict[WebSocket, dict] = {}
+        self.history: Dict[WebSocket, TurnLog] = {}
+        self.contexts: Dict[WebSocket, InterviewContext] = {}
 
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
-        self.history[websocket] = []
+        self.history[websocket] = TurnLog()
 
     def disconnect(self, websocket: WebSocket) -> None:
         self.history.pop(websocket, None)
@@ -25,41 +32,45 @@ class ConnectionManager:
     async def handle_message(self, websocket: WebSocket, data: dict) -> None:
         """Process an incoming message from the client."""
 
-        conversation = self.history.setdefault(websocket, [])
+        conversation = self.history.get(websocket)
+        if conversation is None:
+            conversation = self.history[websocket] = TurnLog()
         event = data.get("event")
 
         if event == "join_session":
             payload = data.get("payload", {})
-            context = {
-                "job_description": payload.get("job_description", ""),
-                "candidate_resume": payload.get("candidate_resume", ""),
-            }
+            job_description = payload.get("job_description", "")
+            candidate_resume = payload.get("candidate_resume", "")
+            context = engine.prepare_context(
+                InterviewContext(
+                    job_description=job_description, candidate_resume=candidate_resume
+                )
+            )
             self.contexts[websocket] = context
             topics = await self._determine_topics(context)
             await websocket.send_json({"event": "session_started"})
             await websocket.send_json({"event": "topics", "payload": {"topics": topics}})
             question = await self._next_question(websocket, conversation)
-            conversation.append({"role": "interviewer", "message": question})
+            conversation.append("interviewer", question)
             await websocket.send_json(
                 {"event": "new_question", "payload": {"question_text": question}}
             )
 
         elif event == "send_answer":
             answer = data.get("payload", {}).get("answer_text", "")
-            conversation.append({"role": "candidate", "message": answer})
+            conversation.append("candidate", answer)
             await websocket.send_json({"event": "interviewer_typing"})
             question = await self._next_question(websocket, conversation)
-            conversation.append({"role": "interviewer", "message": question})
+            conversation.append("interviewer", question)
             await websocket.send_json(
                 {"event": "new_question", "payload": {"question_text": question}}
             )
 
-    async def _next_question(self, websocket: WebSocket, history: List[dict]) -> str:
-        context = self.contexts.get(websocket, {"job_description": ""})
-        interview_context = InterviewContext(**context)
-        turns = [ConversationTurn(**t) for t in history]
-        return await generate_next_question(interview_context, turns)
+    async def _next_question(self, websocket: WebSocket, history: TurnLog) -> str:
+        context = self.contexts.get(websocket)
+        if context is None:
+            context = InterviewContext(job_description="")
+        return await generate_next_question(context, history)
 
-    async def _determine_topics(self, context: dict) -> List[str]:
-        interview_context = InterviewContext(**context)
-        return await determine_topics(interview_context)
+    async def _determine_topics(self, context: InterviewContext) -> List[str]:
+        return await determine_topics(context)
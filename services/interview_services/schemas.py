@@ -1,27 +1,26 @@
 """Pydantic models for the interview module."""
-from typing import List, Optional
+from typing import List
 from pydantic import BaseModel, Field
+from interview_core.schemas import ConversationTurn, InterviewContext
 
 
-class InterviewContext(BaseModel):
-    """Context for the interview such as job description."""
+class InterviewRequest(BaseModel):
+    """Request model for generating the next interview question."""
 
-    job_description: str
-    candidate_resume: Optional[str] = None
+    context: InterviewContext
+    history: List[ConversationTurn] = Field(default_factory=list)
 
 
-class ConversationTurn(BaseModel):
-    """A single turn in the interview conversation."""
+class BatchQuestionRequest(BaseModel):
+    """Many question requests answered in one call."""
 
-    role: str
-    message: str
+    items: List[InterviewRequest] = Field(min_length=1)
 
 
-class InterviewRequest(BaseModel):
-    """Request model for generating the next interview question."""
+class BatchTopicsRequest(BaseModel):
+    """Many contexts whose topics are inferred in one call."""
 
-    context: InterviewContext
-    history: List[ConversationTurn] = Field(default_factory=list)
+    items: List[InterviewContext] = Field(min_length=1)
 
 
 class InterviewResponse(BaseModel):
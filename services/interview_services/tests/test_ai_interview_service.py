@@ -6,9 +6,11 @@ sys.path.append(str(Path(__file__).resolve().parents[2]))
 import httpx
 import pytest
 
+from interview_core.config import settings
+from interview_core.llm_service import provider_clients
+
 from interview_services import ai_interview_service as ai
 from interview_services.schemas import InterviewContext, ConversationTurn
-from interview_services.config import settings
 
 
 @pytest.mark.asyncio
@@ -51,6 +53,18 @@ async def test_determine_topics():
     assert topics == ["python", "database"]
 
 
+@pytest.mark.asyncio
+async def test_determine_topics_respects_word_boundaries():
+    topics = await ai.determine_topics(
+        InterviewContext(
+            job_description="JavaScript engineer for Data Science tooling",
+            candidate_resume="Built ML pipelines in py and Django",
+        )
+    )
+
+    assert topics == ["javascript", "data science", "machine learning", "python"]
+
+
 @pytest.mark.asyncio
 async def test_generate_next_question_uses_configured_timeout(monkeypatch):
     settings.llm_provider = "openai"
@@ -61,6 +75,7 @@ async def test_generate_next_question_uses_configured_timeout(monkeypatch):
     class DummyClient:
         def __init__(self, *args, **kwargs):
             captured["timeout"] = kwargs.get("timeout")
+            captured["instances"] = captured.get("instances", 0) + 1
 
         async def __aenter__(self):
             return self
@@ -68,6 +83,9 @@ async def test_generate_next_question_uses_configured_timeout(monkeypatch):
         async def __aexit__(self, exc_type, exc, tb):
             pass
 
+        async def aclose(self):
+            pass
+
         async def post(self, url, headers=None, json=None):
             return httpx.Response(
                 200,
@@ -75,14 +93,23 @@ async def test_generate_next_question_uses_configured_timeout(monkeypatch):
                 request=httpx.Request("POST", url),
             )
 
+    await provider_clients.aclose()
     monkeypatch.setattr(httpx, "AsyncClient", DummyClient)
 
-    await ai.generate_next_question(
-        InterviewContext(job_description="Backend developer"),
-        [ConversationTurn(role="candidate", message="Hi")],
-    )
+    try:
+        await ai.generate_next_question(
+            InterviewContext(job_description="Backend developer"),
+            [ConversationTurn(role="candidate", message="Hi")],
+        )
+        await ai.generate_next_question(
+            InterviewContext(job_description="Backend developer"),
+            [ConversationTurn(role="candidate", message="Hi")],
+        )
+    finally:
+        await provider_clients.aclose()
 
     assert captured["timeout"] == settings.llm_timeout
+    assert captured["instances"] == 1
 
 
 @pytest.mark.asyncio
@@ -122,7 +149,7 @@ async def test_missing_local_llm_url_raises_error(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_http_error_raises_runtime_error(monkeypatch):
+async def test_http_error_is_raised(monkeypatch):
     monkeypatch.setattr(settings, "llm_provider", "local")
     monkeypatch.setattr(settings, "local_llm_url", "http://localhost")
 
@@ -135,7 +162,7 @@ async def test_http_error_raises_runtime_error(monkeypatch):
 
     monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
 
-    with pytest.raises(RuntimeError, match="LLM provider request failed: 400"):
+    with pytest.raises(httpx.HTTPStatusError, match="400"):
         await ai.generate_next_question(
             InterviewContext(job_description="Backend"),
             [],
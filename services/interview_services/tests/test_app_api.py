@@ -1,3 +1,4 @@
+import json
 import sys
 from pathlib import Path
 
@@ -7,8 +8,10 @@ import httpx
 import pytest
 from fastapi.testclient import TestClient
 
+from interview_core.config import settings
+
 from interview_services.app.main import app
-from interview_services.config import settings
+from interview_services.config import settings as service_settings
 
 
 @pytest.fixture
@@ -45,3 +48,57 @@ def test_determine_topics_endpoint(client):
     resp = client.post("/determine-topics", json=payload)
     assert resp.status_code == 200
     assert resp.json() == {"topics": ["python", "database"]}
+
+
+def test_metrics_endpoint_reports_llm_latency(monkeypatch, client):
+    settings.llm_provider = "openai"
+
+    async def fake_post(self, url, headers=None, json=None):
+        return httpx.Response(
+            200,
+            json={"choices": [{"message": {"content": "Sample?"}}]},
+            request=httpx.Request("POST", url),
+        )
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+    payload = {"context": {"job_description": "Backend developer"}, "history": []}
+    client.post("/generate-question", json=payload)
+
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'llm_request_duration_seconds_count{provider="openai",model="' in resp.text
+    assert 'http_request_duration_seconds_count{method="POST",route="/generate-question",status="200"}' in resp.text
+
+
+def test_batch_endpoints_stream_results_with_item_errors(monkeypatch, client):
+    settings.llm_provider = "openai"
+
+    async def fake_post(self, url, headers=None, json=None):
+        failing = "Broken" in json["messages"][0]["content"]
+        return httpx.Response(
+            500 if failing else 200,
+            json={"choices": [{"message": {"content": "Sample?"}}]},
+            request=httpx.Request("POST", url),
+        )
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+
+    items = [{"context": {"job_description": jd}} for jd in ("Backend", "Broken", "Data")]
+    resp = client.post("/generate-question/batch", json={"items": items})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    lines = sorted((json.loads(line) for line in resp.text.splitlines()), key=lambda r: r["index"])
+    assert lines[0] == {"index": 0, "question_text": "Sample?"}
+    assert lines[1]["index"] == 1 and lines[1]["error"]["type"] == "HTTPStatusError"
+    assert lines[2] == {"index": 2, "question_text": "Sample?"}
+
+    resp = client.post(
+        "/determine-topics/batch", json={"items": [{"job_description": "Python developer"}]}
+    )
+    assert [json.loads(line) for line in resp.text.splitlines()] == [
+        {"index": 0, "topics": ["python"]}
+    ]
+
+    monkeypatch.setattr(service_settings, "batch_max_items", 2)
+    assert client.post("/generate-question/batch", json={"items": items}).status_code == 413
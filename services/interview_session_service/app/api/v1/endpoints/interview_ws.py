@@ -1,23 +1,55 @@
 """WebSocket endpoint for interview sessions."""
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect, status
+
+from interview_core.metrics import registry
 
 from services.connection_manager import ConnectionManager
+from services.wire_format import EncodedWebSocket, negotiate
 
 
 router = APIRouter()
 manager = ConnectionManager()
 
+registry.gauge(
+    "ws_session_bytes",
+    "Context and message bytes held by in-memory interview sessions.",
+    collect=lambda: {(): manager.stats(largest=0)["total_bytes"]},
+)
+
 
 @router.websocket("/ws/{interview_id}")
 async def websocket_endpoint(websocket: WebSocket, interview_id: str) -> None:
-    """Handle a WebSocket connection for a given interview."""
-
-    await manager.connect(websocket)
+    """Handle a WebSocket connection for a given interview.
+
+    Reconnecting with the same ``interview_id`` resumes the stored session.
+    Events are JSON unless the client negotiates another wire format (see
+    ``services.wire_format``); an unsupported ``format`` is refused. The
+    session is released however the connection ends.
+    """
+
+    codec, subprotocol = negotiate(
+        websocket.scope.get("subprotocols", []), websocket.query_params.get("format")
+    )
+    if codec is None:
+        await websocket.close(code=status.WS_1003_UNSUPPORTED_DATA)
+        return
+    connection = EncodedWebSocket(websocket, codec, subprotocol)
     try:
+        if not await manager.connect(connection, interview_id):
+            return
         while True:
-            data = await websocket.receive_json()
-            await manager.handle_message(websocket, data)
+            data = await connection.receive_json()
+            await manager.handle_message(connection, data)
     except WebSocketDisconnect:
-        manager.disconnect(websocket)
+        pass
+    finally:
+        manager.disconnect(connection)
+
+
+@router.get("/session-stats")
+async def session_stats(largest: int = Query(5, ge=0, le=100)) -> dict:
+    """Report the in-memory session count, bytes held and the largest sessions."""
+
+    return manager.stats(largest)
 
@@ -0,0 +1,69 @@
+# In services/interview_session_service/app/core/config.py
+from pathlib import Path
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """Session service settings for the hop to the AI orchestration service."""
+
+    model_config = SettingsConfigDict(
+        env_file=Path(__file__).resolve().parents[2] / ".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    # How questions and topics are produced: "http" calls the AI
+    # orchestration service, "inprocess" runs its engine (``interview_core``)
+    # inside this process
+    ai_orchestration_transport: str = "http"
+
+    # Overall and connect timeouts (in seconds) for orchestration requests
+    ai_orchestration_timeout: float = 30.0
+    ai_orchestration_connect_timeout: float = 5.0
+
+    # Connection pool limits for the shared orchestration client
+    ai_orchestration_max_connections: int = 100
+    ai_orchestration_max_keepalive_connections: int = 20
+    # Multiplex sessions over HTTP/2 (requires the optional ``h2`` package)
+    ai_orchestration_http2: bool = False
+    # Send only the turns added since the last question; the orchestration
+    # service keeps the rest and asks for a full resync when it lacks them
+    ai_orchestration_incremental_history: bool = True
+
+    # Where interview sessions are kept: "memory" or "sqlite"
+    session_store_backend: str = "memory"
+    # Database file used by the "sqlite" backend; share it between workers
+    session_store_path: str = "sessions.sqlite3"
+
+    # Compact job descriptions and resumes once per session before they are
+    # used in prompts; token budgets of 0 keep all relevant sections
+    context_preprocessing: bool = True
+    context_job_description_max_tokens: int = 800
+    context_resume_max_tokens: int = 1500
+
+    # Limits on sessions held in memory by one worker. New connections past
+    # ``session_max_count`` are refused; a join or turn that would take a
+    # session past its byte limits is rejected with an ``error`` event.
+    session_max_count: int = 10000
+    session_max_context_bytes: int = 256 * 1024
+    session_max_history_bytes: int = 1024 * 1024
+    # Sessions without a client event for this many seconds are closed
+    # (0 disables); a sweep runs every ``session_sweep_interval`` seconds
+    session_idle_ttl: float = 1800.0
+    session_sweep_interval: float = 60.0
+
+    # Fraction of new traces recorded (0 disables tracing); traces continued
+    # from an incoming ``traceparent`` header keep the caller's decision
+    trace_sample_rate: float = 0.0
+    # Where finished spans go: "jsonl" (``trace_jsonl_path``) or "otlp"
+    trace_exporter: str = "jsonl"
+    trace_jsonl_path: str = "traces.jsonl"
+    trace_otlp_endpoint: str = "http://localhost:4318/v1/traces"
+    # Seconds between exports, and spans kept in memory before dropping
+    trace_export_interval: float = 5.0
+    trace_max_buffered_spans: int = 10000
+    trace_service_name: str = "interview-session"
+
+
+settings = Settings()
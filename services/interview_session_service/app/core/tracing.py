@@ -0,0 +1,7 @@
+"""This service's tracer; spans, propagation and export are in ``interview_core.tracing``."""
+
+from interview_core.tracing import Tracer
+
+from core.config import settings
+
+tracer = Tracer(settings)
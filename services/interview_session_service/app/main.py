@@ -1,5 +1,31 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import Response
+
+from interview_core.metrics import CONTENT_TYPE, MetricsMiddleware, registry
+
 from api.v1.endpoints import interview_ws
+from core.tracing import tracer
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await interview_ws.manager.startup()
+    await tracer.startup()
+    yield
+    await interview_ws.manager.shutdown()
+    await interview_ws.manager.store.aclose()
+    await tracer.aclose()
 
-app = FastAPI(title="Interview Session Service")
+
+app = FastAPI(title="Interview Session Service", lifespan=lifespan)
+app.add_middleware(MetricsMiddleware)
 app.include_router(interview_ws.router, prefix="/api/v1")
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Expose service metrics in the Prometheus text format."""
+
+    return Response(registry.render(), media_type=CONTENT_TYPE)
@@ -1,61 +1,307 @@
 """Manage interview WebSocket sessions."""
 
+import asyncio
+import heapq
 import os
 import logging
-from typing import Dict, List
+import time
+import uuid
+from contextlib import contextmanager
+from typing import AsyncIterator, Awaitable, Dict, Iterator, List, Optional
 
 import httpx
-from fastapi import WebSocket
+from fastapi import WebSocket, status
 
+from interview_core.context_preprocessor import compact_context
+from interview_core.metrics import registry
+from interview_core.turn_log import TurnLog, message_bytes
+
+from core.config import settings
+from core.tracing import tracer
+from services.orchestration_transport import (
+    OrchestrationTransport,
+    QueueListener,
+    build_transport,
+)
+from services.session_store import SessionStore, build_session_store
 
 logger = logging.getLogger(__name__)
 
-AI_API_URL = os.getenv("AI_ORCHESTRATION_URL")
-USE_DIRECT = os.getenv("AI_ORCHESTRATION_USE_DIRECT", "false").lower() == "true"
+# Forward questions token-by-token as ``new_question_delta`` events
+STREAM_QUESTIONS = os.getenv("AI_ORCHESTRATION_STREAM", "false").lower() == "true"
+
+EVENT_DURATION = registry.histogram(
+    "ws_event_duration_seconds",
+    "Time to handle one client WebSocket event, including LLM calls.",
+    ("event",),
+)
+ACTIVE_SESSIONS = registry.gauge(
+    "ws_active_sessions", "Interview WebSockets currently connected."
+)
+ORCHESTRATION_IN_FLIGHT = registry.gauge(
+    "orchestration_in_flight",
+    "Requests to the AI orchestration service awaiting a response.",
+    ("operation",),
+)
+ORCHESTRATION_DURATION = registry.histogram(
+    "orchestration_request_duration_seconds",
+    "Duration of requests to the AI orchestration service.",
+    ("operation",),
+)
+SESSION_EVICTIONS = registry.counter(
+    "ws_session_evictions",
+    "Sessions closed or refused by the session limits, by reason.",
+    ("reason",),
+)
+SESSION_ERRORS = registry.counter(
+    "session_errors",
+    "Failed interview steps by step and error class.",
+    ("step", "error"),
+)
+
 
-if USE_DIRECT:
+@contextmanager
+def _track(operation: str) -> Iterator[None]:
+    """Count an orchestration call as in flight, time it and trace it."""
 
+    ORCHESTRATION_IN_FLIGHT.inc(operation)
+    start = time.perf_counter()
     try:
-        from ai_orchestration_service.app.schemas.interview import (
-            ConversationTurn,
-            InterviewContext,
-        )
-        from ai_orchestration_service.app.services.llm_service import (
-            generate_next_question as direct_generate_question,
-        )
-        from ai_orchestration_service.app.services.topic_service import (
-            determine_topics as direct_determine_topics,
-        )
-    except ModuleNotFoundError as exc:
-        logger.warning(
-            "AI_ORCHESTRATION_USE_DIRECT set but AI orchestration package not found; "
-            "falling back to HTTP. Error: %s",
-            exc,
-        )
-        USE_DIRECT = False
+        with tracer.span(f"orchestration.{operation}"):
+            yield
+    finally:
+        ORCHESTRATION_IN_FLIGHT.dec(operation)
+        ORCHESTRATION_DURATION.observe(time.perf_counter() - start, operation)
+
+
+class SessionLimitExceeded(Exception):
+    """Raised when a session would outgrow its configured byte limits."""
+
+
+class SessionNotStarted(Exception):
+    """Raised for an answer to an interview that was never joined or resumed."""
+
+
+class SessionExpired(Exception):
+    """Raised for an event on a socket whose session was closed as idle."""
+
+
+def context_bytes(context: dict) -> int:
+    return sum(message_bytes(value) for value in context.values() if isinstance(value, str))
 
 
 class ConnectionManager:
-    """Minimal connection manager for interview sessions."""
+    """Minimal connection manager for interview sessions.
+
+    Session state is keyed by ``interview_id`` and every change is written
+    through to a ``SessionStore``, so a client that reconnects (possibly to
+    another worker sharing the store) resumes where it left off.
+
+    The in-memory table is bounded: at most ``session_max_count`` sessions,
+    each within the context and history byte limits, and sessions idle for
+    ``session_idle_ttl`` seconds are closed by a background sweep. Closed
+    sessions stay in the store and can still be resumed.
 
-    def __init__(self) -> None:
-        self.history: Dict[WebSocket, List[dict]] = {}
-        self.contexts: Dict[WebSocket, dict] = {}
+    Questions and topics come from ``transport``: the AI orchestration
+    service over HTTP, or the interview engine in this process (see
+    ``services.orchestration_transport``).
+    """
 
-    async def connect(self, websocket: WebSocket) -> None:
+    def __init__(
+        self,
+        store: Optional[SessionStore] = None,
+        transport: Optional[OrchestrationTransport] = None,
+    ) -> None:
+        self.store = store or build_session_store()
+        self.transport = transport or build_transport()
+        self.interviews: Dict[WebSocket, str] = {}
+        # Open sockets per session; a reconnecting client briefly has two
+        self._sockets: Dict[str, int] = {}
+        self.history: Dict[str, TurnLog] = {}
+        self.contexts: Dict[str, dict] = {}
+        # ``time.monotonic()`` of the last client event per session
+        self.last_active: Dict[str, float] = {}
+        self._sweeper: Optional[asyncio.Task] = None
+
+    async def startup(self) -> None:
+        """Open the orchestration transport and start the idle sweep."""
+
+        await self.transport.startup()
+        if settings.session_idle_ttl > 0 and self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._sweep_idle())
+
+    async def shutdown(self) -> None:
+        """Stop the idle sweep and close the orchestration transport."""
+
+        sweeper, self._sweeper = self._sweeper, None
+        if sweeper is not None:
+            sweeper.cancel()
+            try:
+                await sweeper
+            except asyncio.CancelledError:
+                pass
+        await self.transport.aclose()
+
+    async def connect(self, websocket: WebSocket, interview_id: Optional[str] = None) -> bool:
+        """Accept the socket and resume the interview if it already exists.
+
+        Returns ``False`` after closing the socket when the session table is
+        full (1013) or the stored session exceeds the byte limits (1009).
+        The caller must still call ``disconnect`` once the socket is done.
+        """
+
+        interview_id = interview_id or uuid.uuid4().hex
+        record = await self.store.load(interview_id)
+        history = TurnLog(record.turns) if record is not None else TurnLog()
+        if interview_id not in self.history and len(self.history) >= settings.session_max_count:
+            logger.warning("Session table full; refusing interview %s", interview_id)
+            SESSION_EVICTIONS.inc("capacity")
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+            return False
+        if record is not None and (
+            context_bytes(record.context) > settings.session_max_context_bytes
+            or history.nbytes > settings.session_max_history_bytes
+        ):
+            logger.warning("Stored interview %s exceeds the session limits", interview_id)
+            SESSION_EVICTIONS.inc("too_large")
+            await websocket.close(code=status.WS_1009_MESSAGE_TOO_BIG)
+            return False
+        self.interviews[websocket] = interview_id
+        self._sockets[interview_id] = self._sockets.get(interview_id, 0) + 1
+        self.history[interview_id] = history
+        self.last_active[interview_id] = time.monotonic()
+        ACTIVE_SESSIONS.inc()
         await websocket.accept()
-        self.history[websocket] = []
+        if record is None:
+            return True
+        self.contexts[interview_id] = record.context
+        await websocket.send_json(
+            {
+                "event": "session_resumed",
+                "payload": {"interview_id": interview_id, "history": record.turns},
+            }
+        )
+        return True
 
     def disconnect(self, websocket: WebSocket) -> None:
-        self.history.pop(websocket, None)
-        self.contexts.pop(websocket, None)
+        """Forget the socket; the stored session remains available for resume.
+
+        Safe to call more than once and for sockets that were refused. The
+        session's state is kept while another socket for the same interview,
+        such as a client that reconnected first, is still open.
+        """
+
+        interview_id = self.interviews.pop(websocket, None)
+        if interview_id is None:
+            return
+        ACTIVE_SESSIONS.dec()
+        remaining = self._sockets.pop(interview_id, 1) - 1
+        if remaining > 0:
+            self._sockets[interview_id] = remaining
+        else:
+            self._forget(interview_id)
+
+    def _forget(self, interview_id: str) -> None:
+        self.history.pop(interview_id, None)
+        self.contexts.pop(interview_id, None)
+        self.transport.forget(interview_id)
+        self.last_active.pop(interview_id, None)
+
+    async def evict_idle(self) -> int:
+        """Close sessions without a client event for ``session_idle_ttl`` seconds.
+
+        Also drops state left without a socket. Returns the number of
+        sessions evicted.
+        """
+
+        deadline = time.monotonic() - settings.session_idle_ttl
+        idle = [
+            websocket
+            for websocket, interview_id in self.interviews.items()
+            if self.last_active.get(interview_id, 0.0) < deadline
+        ]
+        for websocket in idle:
+            self.disconnect(websocket)
+            try:
+                await websocket.close(code=status.WS_1001_GOING_AWAY)
+            except Exception:
+                logger.debug("Closing idle socket failed", exc_info=True)
+        connected = set(self.interviews.values())
+        orphaned = [
+            interview_id
+            for interview_id in self.history
+            if interview_id not in connected
+            and self.last_active.get(interview_id, 0.0) < deadline
+        ]
+        for interview_id in orphaned:
+            self._forget(interview_id)
+        evicted = len(idle) + len(orphaned)
+        if evicted:
+            logger.info("Evicted %d idle sessions", evicted)
+            SESSION_EVICTIONS.inc("idle", amount=evicted)
+        return evicted
+
+    async def _sweep_idle(self) -> None:
+        while True:
+            await asyncio.sleep(settings.session_sweep_interval)
+            try:
+                await self.evict_idle()
+            except Exception:
+                logger.exception("Idle session sweep failed")
+
+    def session_bytes(self, interview_id: str) -> int:
+        """Memory accounted to one session: its context and message bytes."""
+
+        history = self.history.get(interview_id)
+        context = self.contexts.get(interview_id)
+        return (history.nbytes if history is not None else 0) + (
+            context_bytes(context) if context is not None else 0
+        )
+
+    def stats(self, largest: int = 5) -> dict:
+        """Live accounting of the session table and its largest sessions."""
+
+        now = time.monotonic()
+        sizes = [(self.session_bytes(interview_id), interview_id) for interview_id in self.history]
+        return {
+            "sessions": len(self.history),
+            "connections": len(self.interviews),
+            "total_bytes": sum(size for size, _ in sizes),
+            "largest": [
+                {
+                    "interview_id": interview_id,
+                    "bytes": size,
+                    "turns": len(self.history[interview_id]),
+                    "idle_seconds": round(now - self.last_active.get(interview_id, now), 1),
+                }
+                for size, interview_id in heapq.nlargest(largest, sizes)
+            ],
+        }
 
     async def handle_message(self, websocket: WebSocket, data: dict) -> None:
         """Process an incoming message from the client."""
 
         logger.info("Received message: %s", data)
-        conversation = self.history.setdefault(websocket, [])
         event = data.get("event")
+        interview_id = self.interviews.get(websocket)
+        if interview_id is not None:
+            self.last_active[interview_id] = time.monotonic()
+        start = time.perf_counter()
+        attributes = {"event": str(event), "interview_id": self.interviews.get(websocket)}
+        try:
+            with tracer.span("ws.handle_message", attributes):
+                await self._handle_event(websocket, event, data)
+        finally:
+            EVENT_DURATION.observe(time.perf_counter() - start, str(event))
+
+    async def _handle_event(self, websocket: WebSocket, event: Optional[str], data: dict) -> None:
+        interview_id = self.interviews.get(websocket)
+        if interview_id is None:
+            # The idle sweep closed this session while the event was in flight
+            await self._reject(
+                websocket, "session", SessionExpired("Session expired; reconnect to resume")
+            )
+            return
 
         if event == "join_session":
             payload = data.get("payload", {})
@@ -63,56 +309,213 @@ class ConnectionManager:
                 "job_description": payload.get("job_description", ""),
                 "candidate_resume": payload.get("candidate_resume", ""),
             }
-            self.contexts[websocket] = context
-            topics = await self._determine_topics(context)
+            if await self._reject_oversized_context(websocket, context):
+                return
+            if settings.context_preprocessing:
+                # Compacted once here and reused by every later turn
+                context["job_description"], context["candidate_resume"] = compact_context(
+                    context["job_description"],
+                    context["candidate_resume"],
+                    settings.context_job_description_max_tokens,
+                    settings.context_resume_max_tokens,
+                )
+            self.history[interview_id] = TurnLog()
+            self.contexts[interview_id] = context
+            self.transport.forget(interview_id)
+            await self.store.start(interview_id, context)
             await websocket.send_json({"event": "session_started"})
-            await websocket.send_json({"event": "topics", "payload": {"topics": topics}})
-            question = await self._next_question(websocket, conversation)
-            conversation.append({"role": "interviewer", "message": question})
-            await websocket.send_json(
-                {"event": "new_question", "payload": {"question_text": question}}
+            job_id = payload.get("job_id")
+            if job_id and await self._join_prewarmed(
+                websocket, interview_id, job_id, context["candidate_resume"]
+            ):
+                return
+            # The opening question does not depend on the topics, so both
+            # branches run concurrently and each result is sent when ready.
+            await asyncio.gather(
+                self._run_step(websocket, "topics", self._send_topics(websocket, context)),
+                self._run_step(
+                    websocket, "question", self._ask_question(websocket, interview_id)
+                ),
             )
 
         elif event == "send_answer":
             answer = data.get("payload", {}).get("answer_text", "")
-            conversation.append({"role": "candidate", "message": answer})
+            if interview_id not in self.contexts:
+                # Nothing is persisted for an interview without a context
+                await self._reject(
+                    websocket, "answer", SessionNotStarted("Join the session before answering")
+                )
+                return
+            try:
+                await self._record_turn(interview_id, {"role": "candidate", "message": answer})
+            except SessionLimitExceeded as exc:
+                await self._reject(websocket, "answer", exc)
+                return
             await websocket.send_json({"event": "interviewer_typing"})
-            question = await self._next_question(websocket, conversation)
-            conversation.append({"role": "interviewer", "message": question})
+            # A failed turn is reported to the client instead of closing the
+            # connection.
+            await self._run_step(websocket, "question", self._ask_question(websocket, interview_id))
+
+    async def _record_turn(self, interview_id: str, turn: dict) -> None:
+        """Append a turn to the session and write it through to the store.
+
+        Raises ``SessionLimitExceeded`` instead when the turn would take the
+        history past ``session_max_history_bytes``.
+        """
+
+        history = self.history.get(interview_id)
+        if history is None:
+            history = self.history[interview_id] = TurnLog()
+        limit = settings.session_max_history_bytes
+        if history.nbytes + message_bytes(turn["message"]) > limit:
+            raise SessionLimitExceeded(f"History exceeds {limit} bytes")
+        history.append(turn["role"], turn["message"])
+        await self.store.append_turn(interview_id, turn)
+
+    async def _join_prewarmed(
+        self,
+        websocket: WebSocket,
+        interview_id: str,
+        job_id: str,
+        candidate_resume: str,
+    ) -> bool:
+        """Open the session from a pre-warmed job posting.
+
+        The topics and opening question were computed when the job was
+        registered, so the first turn needs no LLM call. Returns ``False``
+        when the job is unknown or cannot be reached, in which case the
+        caller falls back to the regular join pipeline. The job's context is
+        held to the same byte limit as a context sent by the client.
+        """
+
+        try:
+            start = await self._start_job(job_id, candidate_resume)
+        except Exception:
+            logger.exception("Pre-warmed start for job %s failed", job_id)
+            return False
+        if start is None:
+            logger.info("Job %s is not registered; using regular join", job_id)
+            return False
+        if await self._reject_oversized_context(websocket, start["context"]):
+            return True
+        self.contexts[interview_id] = start["context"]
+        await self.store.start(interview_id, start["context"])
+        await websocket.send_json({"event": "topics", "payload": {"topics": start["topics"]}})
+        await self._record_turn(
+            interview_id, {"role": "interviewer", "message": start["question_text"]}
+        )
+        await websocket.send_json(
+            {"event": "new_question", "payload": {"question_text": start["question_text"]}}
+        )
+        return True
+
+    async def _run_step(self, websocket: WebSocket, step: str, work: Awaitable[None]) -> None:
+        """Run one step of a turn, reporting its failure to the client.
+
+        A failing step sends an ``error`` event instead of raising, so the
+        other join branch still completes and the WebSocket handler survives.
+        When the orchestration service rejected the call with a
+        ``Retry-After`` header, the event includes ``retry_after`` seconds.
+        """
+
+        try:
+            await work
+        except Exception as exc:
+            logger.exception("%s step failed", step)
+            SESSION_ERRORS.inc(step, type(exc).__name__)
+            payload = {"step": step, "detail": str(exc)}
+            if isinstance(exc, httpx.HTTPStatusError):
+                retry_after = exc.response.headers.get("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    payload["retry_after"] = int(retry_after)
+            await websocket.send_json({"event": "error", "payload": payload})
+
+    async def _reject_oversized_context(self, websocket: WebSocket, context: dict) -> bool:
+        """Reject a join whose context exceeds ``session_max_context_bytes``."""
+
+        limit = settings.session_max_context_bytes
+        if context_bytes(context) <= limit:
+            return False
+        await self._reject(websocket, "join", SessionLimitExceeded(f"Context exceeds {limit} bytes"))
+        return True
+
+    async def _reject(self, websocket: WebSocket, step: str, exc: Exception) -> None:
+        """Report a refused event to the client without running the step."""
+
+        logger.warning("%s step rejected: %s", step, exc)
+        SESSION_ERRORS.inc(step, type(exc).__name__)
+        await websocket.send_json({"event": "error", "payload": {"step": step, "detail": str(exc)}})
+
+    async def _send_topics(self, websocket: WebSocket, context: dict) -> None:
+        topics = await self._determine_topics(context)
+        await websocket.send_json({"event": "topics", "payload": {"topics": topics}})
+
+    async def _ask_question(self, websocket: WebSocket, interview_id: str) -> None:
+        """Generate the next question and send it to the client.
+
+        In streaming mode each fragment is forwarded as a ``new_question_delta``
+        event as soon as it arrives; the complete ``new_question`` event is
+        always sent last. When the LLM provider is busy and the request has to
+        wait, a ``queued`` event reports the position and estimated wait in
+        seconds. The in-process transport reports it in either mode, the HTTP
+        transport only in streaming mode: a plain HTTP response cannot carry
+        it before the question. A full queue fails the turn in every mode,
+        with ``retry_after`` when the service sent ``Retry-After``.
+        """
+
+        async def on_queued(position: int, estimated_wait: float) -> None:
             await websocket.send_json(
-                {"event": "new_question", "payload": {"question_text": question}}
+                {
+                    "event": "queued",
+                    "payload": {"position": position, "estimated_wait": estimated_wait},
+                }
             )
 
-    async def _next_question(self, websocket: WebSocket, history: List[dict]) -> str:
-        context = self.contexts.get(websocket, {"job_description": ""})
-        if USE_DIRECT:
-            interview_context = InterviewContext(**context)
-            turns = [ConversationTurn(**t) for t in history]
-            question = await direct_generate_question(interview_context, turns)
-            logger.info("Direct generate_question response: %s", question)
-            return question
-        payload = {"context": context, "history": history}
-        logger.info("POST %s/generate-question payload=%s", AI_API_URL, payload)
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(f"{AI_API_URL}/generate-question", json=payload)
-            logger.info("Response status %s", getattr(resp, "status_code", "unknown"))
-            resp.raise_for_status()
-            data = resp.json()
-        logger.info("Response body: %s", data)
-        return data["question_text"]
+        conversation = self.history[interview_id]
+        if STREAM_QUESTIONS:
+            parts = []
+            async for delta in self._stream_question(interview_id, conversation, on_queued):
+                parts.append(delta)
+                await websocket.send_json(
+                    {"event": "new_question_delta", "payload": {"delta": delta}}
+                )
+            question = "".join(parts).strip()
+        else:
+            question = await self._next_question(interview_id, conversation, on_queued)
+        await self._record_turn(interview_id, {"role": "interviewer", "message": question})
+        await websocket.send_json(
+            {"event": "new_question", "payload": {"question_text": question}}
+        )
 
-    async def _determine_topics(self, context: dict) -> List[str]:
-        if USE_DIRECT:
-            interview_context = InterviewContext(**context)
-            topics = await direct_determine_topics(interview_context)
-            logger.info("Direct determine_topics response: %s", topics)
-            return topics
-        logger.info("POST %s/determine-topics payload=%s", AI_API_URL, context)
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(f"{AI_API_URL}/determine-topics", json=context)
-            logger.info("Response status %s", getattr(resp, "status_code", "unknown"))
-            resp.raise_for_status()
-            data = resp.json()
-        logger.info("Response body: %s", data)
-        return data.get("topics", [])
+    async def _next_question(
+        self,
+        interview_id: str,
+        history: TurnLog,
+        on_queued: Optional[QueueListener] = None,
+    ) -> str:
+        with _track("generate_question"):
+            context = self.contexts.get(interview_id, {"job_description": ""})
+            return await self.transport.generate_question(
+                interview_id, context, history, on_queued
+            )
+
+    async def _stream_question(
+        self,
+        interview_id: str,
+        history: TurnLog,
+        on_queued: Optional[QueueListener] = None,
+    ) -> AsyncIterator[str]:
+        with _track("stream_question"):
+            context = self.contexts.get(interview_id, {"job_description": ""})
+            async for delta in self.transport.stream_question(
+                interview_id, context, history, on_queued
+            ):
+                yield delta
 
+    async def _start_job(self, job_id: str, candidate_resume: str) -> Optional[dict]:
+        with _track("start_job"):
+            return await self.transport.start_job(job_id, candidate_resume)
+
+    async def _determine_topics(self, context: dict) -> List[str]:
+        with _track("determine_topics"):
+            return await self.transport.determine_topics(context)
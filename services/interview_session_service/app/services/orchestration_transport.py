@@ -0,0 +1,331 @@
+"""How the session service reaches the interview engine.
+
+``ai_orchestration_transport`` selects the implementation:
+
+``http`` (default)
+    Calls the AI orchestration service, with pre-warmed jobs, admission
+    queueing and incremental history.
+``inprocess``
+    Runs the same ``interview_core`` engine inside the session process,
+    saving the network hop and JSON round trip of every turn. Only jobs
+    registered with this process's engine start pre-warmed; other
+    ``job_id`` joins use the regular pipeline.
+"""
+
+import json
+import logging
+import os
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+from interview_core.turn_log import TurnLog
+
+from core.config import settings
+from core.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+AI_API_URL = os.getenv("AI_ORCHESTRATION_URL")
+
+# Receives the queue position and estimated wait (seconds) of a delayed request
+QueueListener = Callable[[int, float], Awaitable[None]]
+
+
+class OrchestrationTransport(ABC):
+    """Operations the session service needs from the interview engine.
+
+    ``interview_id`` lets a transport keep per-session state, which
+    ``forget`` drops when the session ends or restarts. A transport must
+    implement question generation, streaming and topic inference to be
+    instantiated.
+    """
+
+    name = ""
+
+    async def startup(self) -> None:
+        return None
+
+    async def aclose(self) -> None:
+        return None
+
+    @abstractmethod
+    async def generate_question(
+        self,
+        interview_id: str,
+        context: dict,
+        history: TurnLog,
+        on_queued: Optional[QueueListener] = None,
+    ) -> str:
+        """Return the next question for the conversation in ``history``."""
+
+    @abstractmethod
+    def stream_question(
+        self,
+        interview_id: str,
+        context: dict,
+        history: TurnLog,
+        on_queued: Optional[QueueListener] = None,
+    ) -> AsyncIterator[str]:
+        """Yield the next question in fragments as they are produced."""
+
+    @abstractmethod
+    async def determine_topics(self, context: dict) -> List[str]:
+        """Return the interview topics for ``context``."""
+
+    async def start_job(self, job_id: str, candidate_resume: str) -> Optional[dict]:
+        """Open a session from a pre-warmed job, or ``None`` if the job is unknown."""
+
+        return None
+
+    def forget(self, interview_id: str) -> None:
+        return None
+
+
+class HttpTransport(OrchestrationTransport):
+    """Call the AI orchestration service over one shared keep-alive client."""
+
+    name = "http"
+
+    def __init__(self) -> None:
+        self._client: Optional[httpx.AsyncClient] = None
+        # Conversation version the orchestration service last confirmed
+        self.versions: Dict[str, int] = {}
+
+    async def startup(self) -> None:
+        self._get_client()
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the long-lived client used for every orchestration request.
+
+        All sessions share one keep-alive pool, so WebSocket events reuse warm
+        connections instead of opening a new one per request.
+        """
+
+        if self._client is None:
+            timeout = httpx.Timeout(
+                settings.ai_orchestration_timeout,
+                connect=settings.ai_orchestration_connect_timeout,
+            )
+            limits = httpx.Limits(
+                max_connections=settings.ai_orchestration_max_connections,
+                max_keepalive_connections=settings.ai_orchestration_max_keepalive_connections,
+            )
+            http2 = settings.ai_orchestration_http2
+            if http2:
+                try:
+                    import h2  # noqa: F401
+                except ModuleNotFoundError:
+                    logger.warning(
+                        "AI_ORCHESTRATION_HTTP2 set but the 'h2' package is not "
+                        "installed; falling back to HTTP/1.1"
+                    )
+                    http2 = False
+            self._client = httpx.AsyncClient(timeout=timeout, limits=limits, http2=http2)
+        return self._client
+
+    def forget(self, interview_id: str) -> None:
+        self.versions.pop(interview_id, None)
+
+    async def generate_question(
+        self,
+        interview_id: str,
+        context: dict,
+        history: TurnLog,
+        on_queued: Optional[QueueListener] = None,
+    ) -> str:
+        payload = self._question_payload(interview_id, context, history)
+        while True:
+            logger.info("POST %s/generate-question payload=%s", AI_API_URL, payload)
+            resp = await self._get_client().post(
+                f"{AI_API_URL}/generate-question", json=payload, headers=tracer.headers()
+            )
+            logger.info("Response status %s", getattr(resp, "status_code", "unknown"))
+            if resp.status_code == 409 and "base_version" in payload:
+                payload = self._question_payload(interview_id, context, history, full=True)
+                continue
+            break
+        resp.raise_for_status()
+        data = resp.json()
+        logger.info("Response body: %s", data)
+        self._remember_version(interview_id, data.get("version"))
+        return data["question_text"]
+
+    async def stream_question(
+        self,
+        interview_id: str,
+        context: dict,
+        history: TurnLog,
+        on_queued: Optional[QueueListener] = None,
+    ) -> AsyncIterator[str]:
+        payload = self._question_payload(interview_id, context, history)
+        while True:
+            logger.info("POST %s/generate-question/stream payload=%s", AI_API_URL, payload)
+            async with self._get_client().stream(
+                "POST",
+                f"{AI_API_URL}/generate-question/stream",
+                json=payload,
+                headers=tracer.headers(),
+            ) as resp:
+                logger.info("Response status %s", resp.status_code)
+                if resp.status_code == 409 and "base_version" in payload:
+                    payload = self._question_payload(interview_id, context, history, full=True)
+                    continue
+                resp.raise_for_status()
+                async for line in resp.aiter_lines():
+                    if not line:
+                        continue
+                    event = json.loads(line)
+                    if "queued" in event:
+                        if on_queued is not None:
+                            await on_queued(
+                                event["queued"]["position"],
+                                event["queued"]["estimated_wait"],
+                            )
+                        continue
+                    if "version" in event:
+                        self._remember_version(interview_id, event["version"])
+                        continue
+                    yield event["delta"]
+                return
+
+    def _question_payload(
+        self, interview_id: str, context: dict, history: TurnLog, full: bool = False
+    ) -> dict:
+        """Build a question request, sending only the turns added since the last one.
+
+        The orchestration service answers ``409`` when it no longer holds the
+        conversation at the expected version, and the caller then retries
+        with ``full=True``.
+        """
+
+        if not settings.ai_orchestration_incremental_history:
+            return {"context": context, "history": history.to_dicts()}
+        version = self.versions.get(interview_id)
+        if full or version is None or version > len(history):
+            return {
+                "session_id": interview_id,
+                "context": context,
+                "history": history.to_dicts(),
+            }
+        return {
+            "session_id": interview_id,
+            "base_version": version,
+            "history": history.to_dicts(version),
+        }
+
+    def _remember_version(self, interview_id: str, version: Optional[int]) -> None:
+        if version is None:
+            self.versions.pop(interview_id, None)
+        else:
+            self.versions[interview_id] = version
+
+    async def start_job(self, job_id: str, candidate_resume: str) -> Optional[dict]:
+        url = f"{AI_API_URL}/jobs/{job_id}/start"
+        logger.info("POST %s", url)
+        resp = await self._get_client().post(
+            url, json={"candidate_resume": candidate_resume}, headers=tracer.headers()
+        )
+        logger.info("Response status %s", getattr(resp, "status_code", "unknown"))
+        if resp.status_code == 404:
+            return None
+        resp.raise_for_status()
+        return resp.json()
+
+    async def determine_topics(self, context: dict) -> List[str]:
+        logger.info("POST %s/determine-topics payload=%s", AI_API_URL, context)
+        resp = await self._get_client().post(
+            f"{AI_API_URL}/determine-topics", json=context, headers=tracer.headers()
+        )
+        logger.info("Response status %s", getattr(resp, "status_code", "unknown"))
+        resp.raise_for_status()
+        data = resp.json()
+        logger.info("Response body: %s", data)
+        return data.get("topics", [])
+
+
+class InProcessTransport(OrchestrationTransport):
+    """Run the orchestration service's interview engine in this process.
+
+    The engine is imported on first use, so the HTTP transport does not need
+    its provider settings. The session's ``TurnLog`` is handed to the engine
+    as-is; the context dict becomes the engine's ``InterviewContext`` once
+    per call.
+    """
+
+    name = "inprocess"
+
+    def __init__(self) -> None:
+        from interview_core.engine import engine
+        from interview_core.schemas import InterviewContext
+
+        self.engine = engine
+        self._context_model = InterviewContext
+
+    async def startup(self) -> None:
+        await self.engine.startup()
+
+    async def aclose(self) -> None:
+        await self.engine.aclose()
+
+    async def generate_question(
+        self,
+        interview_id: str,
+        context: dict,
+        history: TurnLog,
+        on_queued: Optional[QueueListener] = None,
+    ) -> str:
+        return await self.engine.generate_question(
+            self._context_model(**context), history, on_queued=on_queued
+        )
+
+    async def stream_question(
+        self,
+        interview_id: str,
+        context: dict,
+        history: TurnLog,
+        on_queued: Optional[QueueListener] = None,
+    ) -> AsyncIterator[str]:
+        async for delta in self.engine.stream_question(
+            self._context_model(**context), history, on_queued=on_queued
+        ):
+            yield delta
+
+    async def determine_topics(self, context: dict) -> List[str]:
+        return await self.engine.determine_topics(self._context_model(**context))
+
+    async def start_job(self, job_id: str, candidate_resume: str) -> Optional[dict]:
+        start = await self.engine.start_job(job_id, candidate_resume)
+        if start is not None:
+            start["context"] = start["context"].model_dump()
+        return start
+
+
+TRANSPORTS = {"http": HttpTransport, "inprocess": InProcessTransport}
+
+
+def build_transport(name: Optional[str] = None) -> OrchestrationTransport:
+    """Create the transport named by ``name`` or ``ai_orchestration_transport``.
+
+    The retired ``AI_ORCHESTRATION_USE_DIRECT=true`` still selects the
+    in-process transport.
+    """
+
+    if name is None:
+        name = settings.ai_orchestration_transport
+        if os.getenv("AI_ORCHESTRATION_USE_DIRECT", "false").lower() == "true":
+            logger.warning(
+                "AI_ORCHESTRATION_USE_DIRECT is deprecated; "
+                "set AI_ORCHESTRATION_TRANSPORT=inprocess instead"
+            )
+            name = "inprocess"
+    name = name.lower()
+    if name not in TRANSPORTS:
+        raise ValueError(f"Unknown orchestration transport: {name}")
+    return TRANSPORTS[name]()
@@ -0,0 +1,167 @@
+"""Persistence for interview sessions keyed by ``interview_id``."""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+from core.config import settings
+
+
+class SessionRecord:
+    """Stored state of one interview: its context and the turns so far."""
+
+    def __init__(self, interview_id: str, context: dict, turns: List[dict]) -> None:
+        self.interview_id = interview_id
+        self.context = context
+        self.turns = turns
+
+
+class SessionStore(ABC):
+    """Interface for session stores.
+
+    Turns are only ever appended, so a backend can persist each one with a
+    single small write instead of rewriting the whole history.
+    """
+
+    @abstractmethod
+    async def load(self, interview_id: str) -> Optional[SessionRecord]:
+        """Return the stored session, or ``None`` if there is none."""
+
+    @abstractmethod
+    async def start(self, interview_id: str, context: dict) -> None:
+        """Create or reset a session with a fresh context and no turns."""
+
+    @abstractmethod
+    async def append_turn(self, interview_id: str, turn: dict) -> None:
+        """Append a turn to a started session."""
+
+    @abstractmethod
+    async def delete(self, interview_id: str) -> None:
+        """Remove the session and its turns."""
+
+    async def aclose(self) -> None:
+        return None
+
+
+class MemorySessionStore(SessionStore):
+    """Process-local store; sessions survive reconnects but not restarts."""
+
+    def __init__(self) -> None:
+        self._sessions: Dict[str, SessionRecord] = {}
+
+    async def load(self, interview_id: str) -> Optional[SessionRecord]:
+        record = self._sessions.get(interview_id)
+        if record is None:
+            return None
+        return SessionRecord(interview_id, dict(record.context), list(record.turns))
+
+    async def start(self, interview_id: str, context: dict) -> None:
+        self._sessions[interview_id] = SessionRecord(interview_id, dict(context), [])
+
+    async def append_turn(self, interview_id: str, turn: dict) -> None:
+        record = self._sessions.get(interview_id)
+        if record is not None:
+            record.turns.append(dict(turn))
+
+    async def delete(self, interview_id: str) -> None:
+        self._sessions.pop(interview_id, None)
+
+
+class SQLiteSessionStore(SessionStore):
+    """Local persistent store in a SQLite database using write-ahead logging.
+
+    WAL mode lets several worker processes on the same host read while one
+    writes, so any worker can resume a session another worker started.
+    Queries run in a worker thread to keep the event loop responsive.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "interview_id TEXT PRIMARY KEY, context TEXT NOT NULL, "
+            "created_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS turns ("
+            "seq INTEGER PRIMARY KEY AUTOINCREMENT, interview_id TEXT NOT NULL, "
+            "role TEXT NOT NULL, message TEXT NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS turns_by_interview ON turns (interview_id, seq)"
+        )
+        self._db.commit()
+
+    async def load(self, interview_id: str) -> Optional[SessionRecord]:
+        return await asyncio.to_thread(self._load_sync, interview_id)
+
+    async def start(self, interview_id: str, context: dict) -> None:
+        await asyncio.to_thread(self._start_sync, interview_id, context)
+
+    async def append_turn(self, interview_id: str, turn: dict) -> None:
+        await asyncio.to_thread(self._append_sync, interview_id, turn)
+
+    async def delete(self, interview_id: str) -> None:
+        await asyncio.to_thread(self._delete_sync, interview_id)
+
+    async def aclose(self) -> None:
+        await asyncio.to_thread(self._close_sync)
+
+    def _close_sync(self) -> None:
+        # Closing the last connection checkpoints the WAL into the database
+        with self._lock:
+            self._db.close()
+
+    def _load_sync(self, interview_id: str) -> Optional[SessionRecord]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT context FROM sessions WHERE interview_id = ?", (interview_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            turns = [
+                {"role": role, "message": message}
+                for role, message in self._db.execute(
+                    "SELECT role, message FROM turns WHERE interview_id = ? ORDER BY seq",
+                    (interview_id,),
+                )
+            ]
+        return SessionRecord(interview_id, json.loads(row[0]), turns)
+
+    def _start_sync(self, interview_id: str, context: dict) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM turns WHERE interview_id = ?", (interview_id,))
+            self._db.execute(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?)",
+                (interview_id, json.dumps(context), time.time()),
+            )
+
+    def _append_sync(self, interview_id: str, turn: dict) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT INTO turns (interview_id, role, message) VALUES (?, ?, ?)",
+                (interview_id, turn["role"], turn["message"]),
+            )
+
+    def _delete_sync(self, interview_id: str) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM turns WHERE interview_id = ?", (interview_id,))
+            self._db.execute("DELETE FROM sessions WHERE interview_id = ?", (interview_id,))
+
+
+def build_session_store() -> SessionStore:
+    """Create the store selected by ``settings.session_store_backend``."""
+
+    backend = settings.session_store_backend.lower()
+    if backend == "memory":
+        return MemorySessionStore()
+    if backend == "sqlite":
+        return SQLiteSessionStore(settings.session_store_path)
+    raise ValueError(f"Unsupported session store backend: {settings.session_store_backend}")
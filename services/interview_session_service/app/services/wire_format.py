@@ -0,0 +1,130 @@
+"""Wire formats for interview WebSocket events.
+
+Clients choose how events are encoded when they connect, either by offering
+a WebSocket subprotocol (``interview.json`` or ``interview.msgpack``) or
+with a ``format`` query parameter. JSON travels in text frames and is the
+default, so existing clients keep working. MessagePack travels in binary
+frames and needs the optional ``msgpack`` package. JSON uses ``orjson``
+when it is installed.
+
+permessage-deflate is an extension of the WebSocket handshake and is
+negotiated by the ASGI server, not by the application: uvicorn offers it
+with its ``websockets`` implementation unless started with
+``--ws-per-message-deflate false``.
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+try:
+    import msgpack
+except ModuleNotFoundError:
+    msgpack = None
+
+SUBPROTOCOL_PREFIX = "interview."
+
+
+class JsonCodec:
+    name = "json"
+    binary = False
+
+    def encode(self, event: dict) -> str:
+        if orjson is not None:
+            return orjson.dumps(event).decode()
+        return json.dumps(event, separators=(",", ":"), ensure_ascii=False)
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+
+class MsgpackCodec:
+    name = "msgpack"
+    binary = True
+
+    def encode(self, event: dict) -> bytes:
+        return msgpack.packb(event, use_bin_type=True)
+
+    def decode(self, data: Union[str, bytes]) -> Any:
+        if isinstance(data, str):
+            data = data.encode()
+        return msgpack.unpackb(data, raw=False)
+
+
+def available_codecs() -> Dict[str, Union[JsonCodec, MsgpackCodec]]:
+    codecs: Dict[str, Union[JsonCodec, MsgpackCodec]] = {"json": JsonCodec()}
+    if msgpack is not None:
+        codecs["msgpack"] = MsgpackCodec()
+    return codecs
+
+
+def negotiate(
+    subprotocols: List[str], requested: Optional[str]
+) -> Tuple[Optional[Union[JsonCodec, MsgpackCodec]], Optional[str]]:
+    """Pick the codec and the subprotocol to accept for a new connection.
+
+    The first offered ``interview.*`` subprotocol that the server supports
+    wins. Otherwise the ``format`` query parameter is used, defaulting to
+    JSON. Returns ``(None, None)`` when the requested format is unknown or
+    not installed.
+    """
+
+    codecs = available_codecs()
+    for subprotocol in subprotocols:
+        if subprotocol.startswith(SUBPROTOCOL_PREFIX):
+            codec = codecs.get(subprotocol[len(SUBPROTOCOL_PREFIX):])
+            if codec is not None:
+                return codec, subprotocol
+    return codecs.get((requested or "json").lower()), None
+
+
+class EncodedWebSocket:
+    """WebSocket that sends and receives events in the negotiated format.
+
+    It keeps the ``accept``/``send_json``/``receive_json`` interface the
+    ``ConnectionManager`` already uses; ``send_json`` takes any JSON-like
+    event, whichever format ends up on the wire.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        codec: Union[JsonCodec, MsgpackCodec],
+        subprotocol: Optional[str] = None,
+    ) -> None:
+        self.websocket = websocket
+        self.codec = codec
+        self.subprotocol = subprotocol
+
+    async def accept(self) -> None:
+        await self.websocket.accept(subprotocol=self.subprotocol)
+
+    async def close(self, code: int = 1000) -> None:
+        await self.websocket.close(code=code)
+
+    async def send_json(self, event: dict) -> None:
+        data = self.codec.encode(event)
+        if self.codec.binary:
+            await self.websocket.send_bytes(data)
+        else:
+            await self.websocket.send_text(data)
+
+    async def receive_json(self) -> Any:
+        message = await self.websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+        data = message.get("bytes")
+        if data is None:
+            data = message.get("text", "")
+        return self.codec.decode(data)
@@ -1,4 +1,8 @@
+import asyncio
+import json
 import sys
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
 import importlib.util
 import httpx
@@ -11,28 +15,60 @@ ROOT = Path(__file__).resolve().parents[3]
 SESSION_APP_PATH = ROOT / "services/interview_session_service/app"
 sys.path.insert(0, str(SESSION_APP_PATH))
 sys.path.append(str(ROOT))
+# Makes the shared ``interview_core`` package importable
+sys.path.append(str(ROOT / "services"))
 
 spec_cm = importlib.util.spec_from_file_location("services.connection_manager", SESSION_APP_PATH / "services/connection_manager.py")
 connection_manager = importlib.util.module_from_spec(spec_cm)
 sys.modules["services.connection_manager"] = connection_manager
 spec_cm.loader.exec_module(connection_manager)
 
+from core.config import settings
+from core.tracing import tracer
+from interview_core.tracing import JsonlExporter
+from interview_core.turn_log import Turn, TurnLog
+from services import orchestration_transport
+from services.session_store import MemorySessionStore, SQLiteSessionStore
+from services.wire_format import negotiate
+
 spec_ws = importlib.util.spec_from_file_location("interview_ws", SESSION_APP_PATH / "api/v1/endpoints/interview_ws.py")
 interview_ws = importlib.util.module_from_spec(spec_ws)
 spec_ws.loader.exec_module(interview_ws)
 
-session_app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app):
+    await interview_ws.manager.startup()
+    yield
+    await interview_ws.manager.shutdown()
+
+
+session_app = FastAPI(lifespan=lifespan)
 session_app.include_router(interview_ws.router, prefix="/api/v1")
 
 
 @pytest.fixture(autouse=True)
 def patch_ai_url(monkeypatch):
-    monkeypatch.setattr(connection_manager, "AI_API_URL", "http://ai/interview")
+    monkeypatch.setattr(orchestration_transport, "AI_API_URL", "http://ai/interview")
+    monkeypatch.setattr(interview_ws.manager, "store", MemorySessionStore())
+
+
+class RecordingWebSocket:
+    def __init__(self):
+        self.sent = []
+        self.start = time.perf_counter()
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, data):
+        self.sent.append((time.perf_counter() - self.start, data))
 
 
 class DummyResponse:
-    def __init__(self, data):
+    def __init__(self, data, status_code=200):
         self._data = data
+        self.status_code = status_code
 
     def json(self):
         return self._data
@@ -43,7 +79,7 @@ class DummyResponse:
 
 @pytest.mark.asyncio
 async def test_join_session_sends_first_question(monkeypatch):
-    async def fake_post(self, url, json=None):
+    async def fake_post(self, url, json=None, headers=None):
         if url.endswith("/determine-topics"):
             return DummyResponse({"topics": ["python"]})
         assert url == "http://ai/interview/generate-question"
@@ -74,7 +110,7 @@ async def test_join_session_sends_first_question(monkeypatch):
 async def test_send_answer_triggers_followup(monkeypatch):
     questions = iter(["First question?", "Second question?"])
 
-    async def fake_post(self, url, json=None):
+    async def fake_post(self, url, json=None, headers=None):
         if url.endswith("/determine-topics"):
             return DummyResponse({"topics": ["python"]})
         return DummyResponse({"question_text": next(questions)})
@@ -104,3 +140,743 @@ async def test_send_answer_triggers_followup(monkeypatch):
         "event": "new_question",
         "payload": {"question_text": "Second question?"},
     }
+
+
+@pytest.mark.asyncio
+async def test_streaming_forwards_question_deltas(monkeypatch):
+    real_client = httpx.AsyncClient
+
+    def handler(request):
+        if request.url.path.endswith("/determine-topics"):
+            return Response(200, json={"topics": ["python"]})
+        assert request.url.path == "/interview/generate-question/stream"
+        body = "".join(json.dumps({"delta": d}) + "\n" for d in ["First ", "question?"])
+        return Response(200, text=body)
+
+    monkeypatch.setattr(connection_manager, "STREAM_QUESTIONS", True)
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        lambda *args, **kwargs: real_client(transport=httpx.MockTransport(handler)),
+    )
+
+    with TestClient(session_app) as client:
+        with client.websocket_connect("/api/v1/ws/test") as websocket:
+            websocket.send_json({
+                "event": "join_session",
+                "payload": {"job_description": "Backend dev"},
+            })
+            events = [websocket.receive_json() for _ in range(5)]
+
+    assert events[2:] == [
+        {"event": "new_question_delta", "payload": {"delta": "First "}},
+        {"event": "new_question_delta", "payload": {"delta": "question?"}},
+        {"event": "new_question", "payload": {"question_text": "First question?"}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_streaming_reports_queue_position(monkeypatch):
+    def handler(request):
+        lines = [
+            {"queued": {"position": 3, "estimated_wait": 1.5}},
+            {"delta": "Ready?"},
+        ]
+        return Response(200, text="".join(json.dumps(line) + "\n" for line in lines))
+
+    monkeypatch.setattr(connection_manager, "STREAM_QUESTIONS", True)
+    manager = connection_manager.ConnectionManager()
+    manager.transport._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    ws = RecordingWebSocket()
+    await manager.connect(ws, "iv-queued")
+    manager.contexts["iv-queued"] = {"job_description": "Python", "candidate_resume": ""}
+    await manager.handle_message(ws, {"event": "send_answer", "payload": {"answer_text": "Hi"}})
+    await manager.shutdown()
+
+    assert [data for _, data in ws.sent] == [
+        {"event": "interviewer_typing"},
+        {"event": "queued", "payload": {"position": 3, "estimated_wait": 1.5}},
+        {"event": "new_question_delta", "payload": {"delta": "Ready?"}},
+        {"event": "new_question", "payload": {"question_text": "Ready?"}},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failed_turn_sends_error_and_keeps_session():
+    def handler(request):
+        return Response(503, json={"detail": "saturated"}, headers={"Retry-After": "4"})
+
+    manager = connection_manager.ConnectionManager()
+    manager.transport._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    ws = RecordingWebSocket()
+    await manager.connect(ws, "iv-busy")
+    manager.contexts["iv-busy"] = {"job_description": "Python", "candidate_resume": ""}
+    await manager.handle_message(ws, {"event": "send_answer", "payload": {"answer_text": "Hi"}})
+    await manager.shutdown()
+
+    events = [data for _, data in ws.sent]
+    assert events[-1]["event"] == "error"
+    assert events[-1]["payload"]["step"] == "question"
+    assert events[-1]["payload"]["retry_after"] == 4
+    assert manager.history["iv-busy"].to_dicts() == [{"role": "candidate", "message": "Hi"}]
+
+
+def test_metrics_report_event_handling_and_sessions(monkeypatch):
+    async def fake_post(self, url, json=None, headers=None):
+        if url.endswith("/determine-topics"):
+            return DummyResponse({"topics": ["python"]})
+        return DummyResponse({"question_text": "First question?"})
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+    spec_main = importlib.util.spec_from_file_location("session_main", SESSION_APP_PATH / "main.py")
+    session_main = importlib.util.module_from_spec(spec_main)
+    spec_main.loader.exec_module(session_main)
+    before = connection_manager.EVENT_DURATION.count("join_session")
+
+    with TestClient(session_app) as client:
+        with client.websocket_connect("/api/v1/ws/metrics") as websocket:
+            websocket.send_json({"event": "join_session", "payload": {"job_description": "Python"}})
+            for _ in range(3):
+                websocket.receive_json()
+            assert connection_manager.ACTIVE_SESSIONS.value() >= 1
+        response = TestClient(session_main.app).get("/metrics")
+
+    assert connection_manager.EVENT_DURATION.count("join_session") == before + 1
+    assert 'ws_event_duration_seconds_count{event="join_session"}' in response.text
+    assert "ws_active_sessions" in response.text
+
+
+@pytest.mark.asyncio
+async def test_turn_is_traced_and_propagated_to_orchestration(monkeypatch, tmp_path):
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("traceparent"))
+        return Response(200, json={"question_text": "Next?"})
+
+    monkeypatch.setattr(settings, "trace_sample_rate", 1.0)
+    monkeypatch.setattr(tracer, "_exporter", JsonlExporter(str(tmp_path / "traces.jsonl")))
+    await tracer.flush()
+    manager = connection_manager.ConnectionManager()
+    manager.transport._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    ws = RecordingWebSocket()
+    await manager.connect(ws, "iv-traced")
+    manager.contexts["iv-traced"] = {"job_description": "Python", "candidate_resume": ""}
+    await manager.handle_message(ws, {"event": "send_answer", "payload": {"answer_text": "Hi"}})
+    await manager.shutdown()
+    await tracer.flush()
+
+    spans = {
+        span["name"]: span
+        for span in map(json.loads, (tmp_path / "traces.jsonl").read_text().splitlines())
+    }
+    root = spans["ws.handle_message"]
+    hop = spans["orchestration.generate_question"]
+    assert root["parent_id"] is None
+    assert root["attributes"] == {"event": "send_answer", "interview_id": "iv-traced"}
+    assert hop["trace_id"] == root["trace_id"] and hop["parent_id"] == root["span_id"]
+    assert seen == [f"00-{root['trace_id']}-{hop['span_id']}-01"]
+
+
+def test_negotiate_prefers_offered_subprotocol(monkeypatch):
+    codec, subprotocol = negotiate(["chat", "interview.json"], "msgpack")
+    assert (codec.name, subprotocol) == ("json", "interview.json")
+    assert negotiate([], None)[0].name == "json"
+    assert negotiate([], "xml") == (None, None)
+
+    monkeypatch.setattr("services.wire_format.msgpack", None)
+    codec, subprotocol = negotiate(["interview.msgpack", "interview.json"], None)
+    assert (codec.name, subprotocol) == ("json", "interview.json")
+    assert negotiate([], "msgpack") == (None, None)
+
+
+def test_msgpack_session_uses_binary_frames(monkeypatch):
+    msgpack = pytest.importorskip("msgpack")
+
+    async def fake_post(self, url, json=None, headers=None):
+        if url.endswith("/determine-topics"):
+            return DummyResponse({"topics": ["python"]})
+        return DummyResponse({"question_text": "First question?"})
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+
+    with TestClient(session_app) as client:
+        with client.websocket_connect(
+            "/api/v1/ws/packed", subprotocols=["interview.msgpack"]
+        ) as websocket:
+            assert websocket.accepted_subprotocol == "interview.msgpack"
+            websocket.send_bytes(
+                msgpack.packb({"event": "join_session", "payload": {"job_description": "Python"}})
+            )
+            events = [msgpack.unpackb(websocket.receive_bytes()) for _ in range(3)]
+
+    assert events[0] == {"event": "session_started"}
+    assert {"event": "new_question", "payload": {"question_text": "First question?"}} in events
+
+
+def test_unsupported_format_is_refused():
+    from starlette.websockets import WebSocketDisconnect
+
+    with TestClient(session_app) as client:
+        with pytest.raises(WebSocketDisconnect) as excinfo:
+            with client.websocket_connect("/api/v1/ws/xml?format=xml"):
+                pass
+    assert excinfo.value.code == 1003
+
+
+@pytest.mark.asyncio
+async def test_questions_send_only_new_turns_and_resync_on_conflict():
+    payloads = []
+
+    def handler(request):
+        payload = json.loads(request.content)
+        payloads.append(payload)
+        if len(payloads) == 3:
+            return Response(409, json={"detail": "out of sync", "version": None})
+        base = payload.get("base_version", 0)
+        version = base + len(payload["history"]) + 1
+        return Response(200, json={"question_text": f"Q{version}", "version": version})
+
+    manager = connection_manager.ConnectionManager()
+    manager.transport._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    ws = RecordingWebSocket()
+    await manager.connect(ws, "iv-delta")
+    manager.contexts["iv-delta"] = {"job_description": "Backend developer"}
+    for answer in ("A1", "A2", "A3"):
+        await manager.handle_message(
+            ws, {"event": "send_answer", "payload": {"answer_text": answer}}
+        )
+    await manager.shutdown()
+
+    assert payloads[0] == {
+        "session_id": "iv-delta",
+        "context": {"job_description": "Backend developer"},
+        "history": [{"role": "candidate", "message": "A1"}],
+    }
+    assert payloads[1] == {
+        "session_id": "iv-delta",
+        "base_version": 2,
+        "history": [{"role": "candidate", "message": "A2"}],
+    }
+    # The conflicting delta is retried once with the full conversation.
+    assert payloads[2]["base_version"] == 4
+    assert "base_version" not in payloads[3] and len(payloads[3]["history"]) == 5
+    assert manager.transport.versions["iv-delta"] == 6
+    assert manager.history["iv-delta"][-1].message == "Q6"
+
+
+def test_turn_log_validates_once_and_shares_roles():
+    log = TurnLog([{"role": "interviewer", "message": "Q1"}])
+    log.append("candidate", "A1")
+    other = TurnLog()
+    other.append("".join(["cand", "idate"]), "B1")
+
+    assert log[1].role is other[0].role
+    assert log.to_dicts(1) == [{"role": "candidate", "message": "A1"}]
+    assert list(log) == [Turn("interviewer", "Q1"), Turn("candidate", "A1")]
+    with pytest.raises(TypeError):
+        log.append("candidate", None)
+    assert len(log) == 2
+
+
+@pytest.mark.asyncio
+async def test_orchestration_client_is_shared_and_closed():
+    manager = connection_manager.ConnectionManager()
+    await manager.startup()
+    client = manager.transport._get_client()
+
+    assert manager.transport._get_client() is client
+    assert client.timeout.connect == connection_manager.settings.ai_orchestration_connect_timeout
+
+    await manager.shutdown()
+    assert client.is_closed
+    assert manager.transport._client is None
+
+
+@pytest.mark.asyncio
+async def test_join_runs_topics_and_question_concurrently(monkeypatch):
+    delay = 0.2
+
+    async def fake_post(self, url, json=None, headers=None):
+        await asyncio.sleep(delay)
+        if url.endswith("/determine-topics"):
+            return DummyResponse({"topics": ["python"]})
+        return DummyResponse({"question_text": "First question?"})
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+
+    manager = connection_manager.ConnectionManager()
+    ws = RecordingWebSocket()
+    await manager.connect(ws)
+    await manager.handle_message(
+        ws, {"event": "join_session", "payload": {"job_description": "Backend dev"}}
+    )
+    await manager.shutdown()
+
+    timings = {data["event"]: at for at, data in ws.sent}
+    assert timings["session_started"] < delay / 2
+    # Sequential round-trips would take 2 * delay before the first question.
+    assert timings["new_question"] < 1.5 * delay
+    assert set(timings) == {"session_started", "topics", "new_question"}
+
+
+@pytest.mark.asyncio
+async def test_join_topics_failure_does_not_block_question(monkeypatch):
+    async def fake_post(self, url, json=None, headers=None):
+        if url.endswith("/determine-topics"):
+            raise httpx.ConnectError("orchestration unavailable")
+        return DummyResponse({"question_text": "First question?"})
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+
+    manager = connection_manager.ConnectionManager()
+    ws = RecordingWebSocket()
+    await manager.connect(ws)
+    await manager.handle_message(
+        ws, {"event": "join_session", "payload": {"job_description": "Backend dev"}}
+    )
+    await manager.shutdown()
+
+    events = [data for _, data in ws.sent]
+    assert {
+        "event": "error",
+        "payload": {"step": "topics", "detail": "orchestration unavailable"},
+    } in events
+    assert {
+        "event": "new_question",
+        "payload": {"question_text": "First question?"},
+    } in events
+
+
+@pytest.mark.asyncio
+async def test_join_with_job_id_uses_prewarmed_start(monkeypatch):
+    urls = []
+
+    async def fake_post(self, url, json=None, headers=None):
+        urls.append(url)
+        assert url == "http://ai/interview/jobs/job-1/start"
+        return DummyResponse({
+            "job_id": "job-1",
+            "context": {"job_description": "Backend dev", "candidate_resume": ""},
+            "topics": ["backend"],
+            "question_text": "Ready opener?",
+        })
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+
+    manager = connection_manager.ConnectionManager()
+    ws = RecordingWebSocket()
+    await manager.connect(ws)
+    await manager.handle_message(ws, {"event": "join_session", "payload": {"job_id": "job-1"}})
+    await manager.shutdown()
+
+    assert [data for _, data in ws.sent] == [
+        {"event": "session_started"},
+        {"event": "topics", "payload": {"topics": ["backend"]}},
+        {"event": "new_question", "payload": {"question_text": "Ready opener?"}},
+    ]
+    assert urls == ["http://ai/interview/jobs/job-1/start"]
+    assert manager.contexts[manager.interviews[ws]]["job_description"] == "Backend dev"
+
+
+@pytest.mark.asyncio
+async def test_join_with_unknown_job_falls_back(monkeypatch):
+    async def fake_post(self, url, json=None, headers=None):
+        if url.endswith("/start"):
+            return DummyResponse({"detail": "Unknown job"}, status_code=404)
+        if url.endswith("/determine-topics"):
+            return DummyResponse({"topics": ["python"]})
+        return DummyResponse({"question_text": "First question?"})
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+
+    manager = connection_manager.ConnectionManager()
+    ws = RecordingWebSocket()
+    await manager.connect(ws)
+    await manager.handle_message(
+        ws,
+        {"event": "join_session", "payload": {"job_id": "gone", "job_description": "Python"}},
+    )
+    await manager.shutdown()
+
+    assert [data["event"] for _, data in ws.sent] == [
+        "session_started",
+        "topics",
+        "new_question",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reconnect_resumes_stored_session(monkeypatch):
+    async def fake_post(self, url, json=None, headers=None):
+        if url.endswith("/determine-topics"):
+            return DummyResponse({"topics": ["python"]})
+        return DummyResponse({"question_text": f"Question {len(json['history'])}?"})
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+
+    store = MemorySessionStore()
+    first = connection_manager.ConnectionManager(store)
+    ws = RecordingWebSocket()
+    await first.connect(ws, "iv-1")
+    await first.handle_message(ws, {"event": "join_session", "payload": {"job_description": "Python"}})
+    await first.handle_message(ws, {"event": "send_answer", "payload": {"answer_text": "Flask"}})
+    first.disconnect(ws)
+    await first.shutdown()
+
+    # A second manager stands in for another worker sharing the store.
+    second = connection_manager.ConnectionManager(store)
+    ws = RecordingWebSocket()
+    await second.connect(ws, "iv-1")
+    history = [
+        {"role": "interviewer", "message": "Question 0?"},
+        {"role": "candidate", "message": "Flask"},
+        {"role": "interviewer", "message": "Question 2?"},
+    ]
+    assert ws.sent[0][1] == {
+        "event": "session_resumed",
+        "payload": {"interview_id": "iv-1", "history": history},
+    }
+    await second.handle_message(ws, {"event": "send_answer", "payload": {"answer_text": "Django"}})
+    await second.shutdown()
+
+    assert ws.sent[-1][1] == {"event": "new_question", "payload": {"question_text": "Question 4?"}}
+    assert second.contexts["iv-1"]["job_description"] == "Python"
+
+
+class RecordingTransport(orchestration_transport.OrchestrationTransport):
+    """Answers every call locally and records what it was sent."""
+
+    def __init__(self, start=None):
+        self.calls = []
+        self.start = start
+
+    async def generate_question(self, interview_id, context, history, on_queued=None):
+        self.calls.append((dict(context), history.to_dicts()))
+        return f"Question {len(history)}?"
+
+    async def stream_question(self, interview_id, context, history, on_queued=None):
+        yield await self.generate_question(interview_id, context, history, on_queued)
+
+    async def determine_topics(self, context):
+        return ["python"]
+
+    async def start_job(self, job_id, candidate_resume):
+        return self.start
+
+
+@pytest.mark.asyncio
+async def test_stale_socket_disconnect_keeps_reconnected_session():
+    transport = RecordingTransport()
+    manager = connection_manager.ConnectionManager(MemorySessionStore(), transport)
+    old = RecordingWebSocket()
+    await manager.connect(old, "iv-reconnect")
+    await manager.handle_message(
+        old, {"event": "join_session", "payload": {"job_description": "Python"}}
+    )
+    await manager.handle_message(old, {"event": "send_answer", "payload": {"answer_text": "A1"}})
+
+    # The client reconnects before the server notices the old socket closing.
+    new = RecordingWebSocket()
+    await manager.connect(new, "iv-reconnect")
+    manager.disconnect(old)
+    await manager.handle_message(new, {"event": "send_answer", "payload": {"answer_text": "A2"}})
+    manager.disconnect(new)
+    await manager.shutdown()
+
+    context, history = transport.calls[-1]
+    assert context["job_description"] == "Python"
+    assert [turn["message"] for turn in history] == [
+        "Question 0?", "A1", "Question 2?", "A2"
+    ]
+    assert new.sent[-1][1] == {"event": "new_question", "payload": {"question_text": "Question 4?"}}
+    assert "iv-reconnect" not in manager.history
+
+
+@pytest.mark.asyncio
+async def test_prewarmed_join_respects_context_limit(monkeypatch):
+    monkeypatch.setattr(settings, "session_max_context_bytes", 100)
+    start = {
+        "job_id": "job-big",
+        "context": {"job_description": "x" * 200, "candidate_resume": ""},
+        "topics": ["general"],
+        "question_text": "Ready opener?",
+    }
+    manager = connection_manager.ConnectionManager(MemorySessionStore(), RecordingTransport(start))
+    ws = RecordingWebSocket()
+    await manager.connect(ws, "iv-big-job")
+    await manager.handle_message(ws, {"event": "join_session", "payload": {"job_id": "job-big"}})
+    await manager.shutdown()
+
+    events = [data for _, data in ws.sent]
+    assert events[-1]["event"] == "error"
+    assert events[-1]["payload"]["step"] == "join"
+    assert all(event["event"] != "new_question" for event in events)
+    assert len(manager.history["iv-big-job"]) == 0
+    assert manager.session_bytes("iv-big-job") <= 100
+
+
+def test_lifespan_closes_session_store(monkeypatch):
+    import main
+    from api.v1.endpoints import interview_ws as served
+
+    closed = []
+
+    class ClosingStore(MemorySessionStore):
+        async def aclose(self):
+            closed.append(True)
+
+    monkeypatch.setattr(served.manager, "store", ClosingStore())
+    with TestClient(main.app):
+        assert closed == []
+    assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_sqlite_session_store_round_trip(tmp_path):
+    path = str(tmp_path / "sessions.sqlite3")
+    store = SQLiteSessionStore(path)
+    await store.start("iv-1", {"job_description": "Go"})
+    await store.append_turn("iv-1", {"role": "interviewer", "message": "Why Go?"})
+    await store.append_turn("iv-1", {"role": "candidate", "message": "Goroutines."})
+    await store.aclose()
+
+    reopened = SQLiteSessionStore(path)
+    record = await reopened.load("iv-1")
+    assert record.context == {"job_description": "Go"}
+    assert [t["message"] for t in record.turns] == ["Why Go?", "Goroutines."]
+
+    await reopened.start("iv-1", {"job_description": "Rust"})
+    record = await reopened.load("iv-1")
+    assert record.context == {"job_description": "Rust"} and record.turns == []
+
+    await reopened.delete("iv-1")
+    assert await reopened.load("iv-1") is None
+    await reopened.aclose()
+
+
+def test_session_released_when_handler_fails(monkeypatch):
+    async def broken(websocket, event, data):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(interview_ws.manager, "_handle_event", broken)
+
+    with TestClient(session_app) as client:
+        with pytest.raises(RuntimeError):
+            with client.websocket_connect("/api/v1/ws/leak") as websocket:
+                websocket.send_json({"event": "send_answer", "payload": {"answer_text": "hi"}})
+                websocket.receive_json()
+
+    assert interview_ws.manager.interviews == {}
+    assert "leak" not in interview_ws.manager.history
+
+
+def test_session_limits_and_accounting(monkeypatch):
+    from starlette.websockets import WebSocketDisconnect
+
+    async def fake_post(self, url, json=None, headers=None):
+        if url.endswith("/determine-topics"):
+            return DummyResponse({"topics": ["python"]})
+        return DummyResponse({"question_text": "Q?"})
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+    monkeypatch.setattr(settings, "session_max_count", 1)
+    monkeypatch.setattr(settings, "session_max_history_bytes", 16)
+
+    with TestClient(session_app) as client:
+        with client.websocket_connect("/api/v1/ws/first") as websocket:
+            websocket.send_json({"event": "join_session", "payload": {"job_description": "Go"}})
+            for _ in range(3):
+                websocket.receive_json()
+            websocket.send_json({"event": "send_answer", "payload": {"answer_text": "x" * 20}})
+            rejected = websocket.receive_json()
+
+            with pytest.raises(WebSocketDisconnect) as excinfo:
+                with client.websocket_connect("/api/v1/ws/second"):
+                    pass
+
+            stats = client.get("/api/v1/session-stats").json()
+
+    assert rejected["event"] == "error" and rejected["payload"]["step"] == "answer"
+    assert excinfo.value.code == 1013
+    assert stats["sessions"] == 1
+    assert stats["total_bytes"] == len("Go") + len("Q?")
+    assert stats["largest"][0]["interview_id"] == "first"
+    assert stats["largest"][0]["turns"] == 1
+
+
+@pytest.mark.asyncio
+async def test_idle_sessions_are_evicted(monkeypatch):
+    class ClosableWebSocket(RecordingWebSocket):
+        closed = None
+
+        async def close(self, code=1000):
+            self.closed = code
+
+    manager = connection_manager.ConnectionManager(store=MemorySessionStore())
+    websocket = ClosableWebSocket()
+    assert await manager.connect(websocket, "idle")
+
+    assert await manager.evict_idle() == 0
+    monkeypatch.setattr(settings, "session_idle_ttl", 0.0)
+    assert await manager.evict_idle() == 1
+
+    assert websocket.closed == 1001
+    assert manager.interviews == {} and manager.history == {}
+
+    await manager.handle_message(
+        websocket, {"event": "send_answer", "payload": {"answer_text": "Late"}}
+    )
+    assert websocket.sent[-1][1] == {
+        "event": "error",
+        "payload": {"step": "session", "detail": "Session expired; reconnect to resume"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_join_compacts_context_once_for_the_session(monkeypatch):
+    payloads = []
+
+    async def fake_post(self, url, json=None, headers=None):
+        payloads.append(json)
+        if url.endswith("/determine-topics"):
+            return DummyResponse({"topics": ["python"]})
+        return DummyResponse({"question_text": "Q?"})
+
+    monkeypatch.setattr(httpx.AsyncClient, "post", fake_post)
+    monkeypatch.setattr(settings, "ai_orchestration_incremental_history", False)
+    manager = connection_manager.ConnectionManager(store=MemorySessionStore())
+    websocket = RecordingWebSocket()
+    await manager.connect(websocket, "compact")
+    posting = "Python   developer\n\nBenefits:\n- Free lunch\n"
+    await manager.handle_message(
+        websocket, {"event": "join_session", "payload": {"job_description": posting}}
+    )
+    await manager.handle_message(
+        websocket, {"event": "send_answer", "payload": {"answer_text": "Hi"}}
+    )
+
+    assert manager.contexts["compact"]["job_description"] == "Python developer"
+    contexts = [p.get("context", p) for p in payloads]
+    assert all(c["job_description"] == "Python developer" for c in contexts)
+
+
+@pytest.mark.asyncio
+async def test_inprocess_transport_runs_the_shared_engine(monkeypatch):
+    from interview_core.config import settings as engine_settings
+    from interview_core.llm_service import provider_clients
+
+    prompts = []
+
+    def handler(request):
+        prompts.append(json.loads(request.content)["messages"])
+        return Response(200, json={"choices": [{"message": {"content": f"Q{len(prompts)}?"}}]})
+
+    monkeypatch.setattr(engine_settings, "llm_provider", "local")
+    monkeypatch.setattr(engine_settings, "local_llm_url", "http://llm/v1/chat/completions")
+    await provider_clients.aclose()
+    provider_clients._clients["local"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    async def no_http(self, *args, **kwargs):
+        raise AssertionError("in-process mode must not call the orchestration service")
+
+    monkeypatch.setattr(orchestration_transport.HttpTransport, "generate_question", no_http)
+    transport = orchestration_transport.build_transport("inprocess")
+    manager = connection_manager.ConnectionManager(transport=transport)
+    ws = RecordingWebSocket()
+    await manager.connect(ws, "iv-inprocess")
+    await manager.handle_message(
+        ws,
+        {
+            "event": "join_session",
+            "payload": {"job_description": "Python developer", "job_id": "unknown"},
+        },
+    )
+    await manager.handle_message(ws, {"event": "send_answer", "payload": {"answer_text": "Hi"}})
+    await manager.shutdown()
+
+    assert isinstance(transport, orchestration_transport.InProcessTransport)
+    events = [data for _, data in ws.sent]
+    assert {"event": "topics", "payload": {"topics": ["python"]}} in events
+    assert events[-1] == {"event": "new_question", "payload": {"question_text": "Q2?"}}
+    assert "Python developer" in prompts[1][0]["content"]
+    assert prompts[1][-1] == {"role": "user", "content": "Hi"}
+    assert not provider_clients._clients
+
+
+@pytest.mark.asyncio
+async def test_inprocess_transport_starts_jobs_registered_with_the_engine(monkeypatch):
+    from interview_core.config import settings as engine_settings
+    from interview_core.job_registry import job_registry
+    from interview_core.llm_service import provider_clients
+
+    prompts = []
+
+    def handler(request):
+        prompts.append(json.loads(request.content)["messages"])
+        return Response(200, json={"choices": [{"message": {"content": f"Q{len(prompts)}?"}}]})
+
+    monkeypatch.setattr(engine_settings, "llm_provider", "local")
+    monkeypatch.setattr(engine_settings, "llm_providers", "")
+    monkeypatch.setattr(engine_settings, "local_llm_url", "http://llm/v1/chat/completions")
+    await provider_clients.aclose()
+    provider_clients._clients["local"] = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    await job_registry.register("Python developer", job_id="inprocess-job", pool_size=1)
+    assert len(prompts) == 1
+
+    manager = connection_manager.ConnectionManager(
+        transport=orchestration_transport.build_transport("inprocess")
+    )
+    ws = RecordingWebSocket()
+    await manager.connect(ws, "iv-prewarmed")
+    await manager.handle_message(
+        ws,
+        {
+            "event": "join_session",
+            "payload": {"job_description": "ignored", "job_id": "inprocess-job"},
+        },
+    )
+    await manager.shutdown()
+
+    events = [data for _, data in ws.sent]
+    assert {"event": "topics", "payload": {"topics": ["python"]}} in events
+    assert {"event": "new_question", "payload": {"question_text": "Q1?"}} in events
+    assert manager.contexts["iv-prewarmed"]["job_description"] == "Python developer"
+
+
+@pytest.mark.asyncio
+async def test_answer_before_join_is_rejected_and_not_stored():
+    store = MemorySessionStore()
+    manager = connection_manager.ConnectionManager(store, RecordingTransport())
+    ws = RecordingWebSocket()
+    await manager.connect(ws, "iv-never-joined")
+    await manager.handle_message(ws, {"event": "send_answer", "payload": {"answer_text": "Hi"}})
+
+    assert ws.sent[-1][1] == {
+        "event": "error",
+        "payload": {"step": "answer", "detail": "Join the session before answering"},
+    }
+    assert await store.load("iv-never-joined") is None
+    assert len(manager.history["iv-never-joined"]) == 0
+
+
+def test_transport_missing_an_operation_cannot_be_created():
+    class NoStreaming(orchestration_transport.OrchestrationTransport):
+        async def generate_question(self, interview_id, context, history, on_queued=None):
+            return "Question?"
+
+        async def determine_topics(self, context):
+            return []
+
+    with pytest.raises(TypeError, match="stream_question"):
+        NoStreaming()
+
+
+def test_build_transport_honours_legacy_direct_flag(monkeypatch):
+    monkeypatch.setenv("AI_ORCHESTRATION_USE_DIRECT", "true")
+    assert isinstance(orchestration_transport.build_transport(), orchestration_transport.InProcessTransport)
+    monkeypatch.delenv("AI_ORCHESTRATION_USE_DIRECT")
+    monkeypatch.setattr(settings, "ai_orchestration_transport", "http")
+    assert isinstance(orchestration_transport.build_transport(), orchestration_transport.HttpTransport)
+    with pytest.raises(ValueError):
+        orchestration_transport.build_transport("carrier-pigeon")